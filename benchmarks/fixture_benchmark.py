@@ -0,0 +1,143 @@
+"""
+Benchmark Google Jobs parsing over recorded HTTP fixtures.
+
+Replays the responses saved by the record/replay transport through
+_parse_job_listings and get_job_details, without touching the network, and
+reports pages/sec, cards/sec and peak memory. Pages that yield no cards or no
+detail fields are listed, since that usually means Google changed its markup.
+
+Record a corpus first, either by running the app with JOB_SEARCH_HTTP_MODE=record
+or with --record.
+
+Usage:
+    python benchmarks/fixture_benchmark.py [fixture_dir] [--repeat N]
+    python benchmarks/fixture_benchmark.py [fixture_dir] --record "python developer" [--location Remote]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add the project root to Python's path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import HTTP_FIXTURE_DIRECTORY
+from core.fetchscheduler import FetchScheduler
+from core.httpfixtures import FixtureResponse, RecordReplayTransport
+from core.jobsearch import GoogleJobsSearch
+from parse_benchmark import build_synthetic_page
+
+
+def make_search(transport, unthrottled=False):
+    """Google Jobs search whose requests go through the given transport"""
+    search = GoogleJobsSearch()
+    search.cache = None
+    if unthrottled:
+        # Replayed responses come from disk, so the host limits would only add sleep time
+        search.scheduler = FetchScheduler(session=transport, rate_per_host=1e9, burst_per_host=10**9)
+    else:
+        search.scheduler = FetchScheduler(session=transport)
+    return search
+
+
+def record(fixture_dir, query, location, limit, details):
+    """Fetch a results page and some detail pages, saving every response"""
+    search = make_search(RecordReplayTransport(fixture_dir, "record"))
+    results = search.fetch_jobs(query, location, limit)
+    if results.get("error"):
+        print(f"Recording failed: {results['error']}")
+        return
+    urls = [job["application_url"] for job in results["results"] if job.get("application_url")][:details]
+    for url in urls:
+        search.get_job_details(url)
+    print(f"Recorded 1 results page ({len(results['results'])} cards) and {len(urls)} detail pages in {fixture_dir}")
+
+
+def build_synthetic_corpus(num_pages=5, num_details=20):
+    """Record synthetic pages into a temporary fixture directory when none are recorded"""
+    transport = RecordReplayTransport(tempfile.mkdtemp(prefix="job_fixtures_"), "replay")
+    search = GoogleJobsSearch()
+    for page in range(num_pages):
+        params = {"q": f"synthetic {page} jobs", "ibp": "htl;jobs"}
+        path = os.path.join(transport.directory, transport.fixture_key("GET", search.base_url, params) + ".json")
+        response = FixtureResponse(search.base_url, 200, {"Content-Type": "text/html"}, build_synthetic_page())
+        transport.save(path, "GET", search.base_url, params, response)
+    for i in range(num_details):
+        url = f"https://www.google.com/search?job={i}"
+        html = (f"<html><body><div class='job-description'>Synthetic job {i} description.</div>"
+                f"<div class='requirements'>• Python\n• SQL\n• Communication</div>"
+                f"<div class='salary-range'>$100,000 - $130,000</div></body></html>")
+        path = os.path.join(transport.directory, transport.fixture_key("GET", url) + ".json")
+        transport.save(path, "GET", url, None, FixtureResponse(url, 200, {}, html))
+    return transport
+
+
+def measure(pages, run, repeat):
+    """Run every page once under tracemalloc, then time repeated runs"""
+    outputs = []
+    peak = 0
+    for page in pages:
+        tracemalloc.start()
+        outputs.append(run(page))
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages:
+            run(page)
+    elapsed = time.perf_counter() - started
+    return outputs, elapsed / repeat, peak
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("fixture_dir", nargs="?", default=HTTP_FIXTURE_DIRECTORY)
+    arg_parser.add_argument("--repeat", type=int, default=10)
+    arg_parser.add_argument("--record", metavar="QUERY", help="Record a new search before benchmarking")
+    arg_parser.add_argument("--location", default=None)
+    arg_parser.add_argument("--limit", type=int, default=10)
+    arg_parser.add_argument("--details", type=int, default=5, help="Detail pages to record")
+    args = arg_parser.parse_args()
+
+    if args.record:
+        record(args.fixture_dir, args.record, args.location, args.limit, args.details)
+
+    transport = RecordReplayTransport(args.fixture_dir, "replay")
+    fixtures = [f for f in transport.fixtures() if f["status_code"] == 200]
+    if not fixtures:
+        print(f"No fixtures found in {args.fixture_dir}, using a synthetic corpus")
+        transport = build_synthetic_corpus()
+        fixtures = list(transport.fixtures())
+
+    # Results pages carry the jobs parameter, everything else is a detail page
+    listing_pages = [f for f in fixtures if "ibp" in f["params"]]
+    detail_pages = [f for f in fixtures if "ibp" not in f["params"]]
+    search = make_search(transport, unthrottled=True)
+
+    print(f"{'Stage':<14}{'pages':>7}{'pages/s':>11}{'cards/s':>11}{'peak KiB':>11}")
+    if listing_pages:
+        outputs, seconds, peak = measure(
+            listing_pages, lambda f: search._parse_job_listings(f["text"], limit=1000), args.repeat)
+        cards = sum(len(output["results"]) for output in outputs)
+        print(f"{'listings':<14}{len(listing_pages):>7}{len(listing_pages) / seconds:>11.1f}"
+              f"{cards / seconds:>11.1f}{peak / 1024:>11.1f}")
+        for fixture, output in zip(listing_pages, outputs):
+            if not output["results"]:
+                print(f"  no job cards found in {fixture['params'].get('q', fixture['url'])}")
+
+    if detail_pages:
+        outputs, seconds, peak = measure(
+            detail_pages, lambda f: search.get_job_details(f["url"]), args.repeat)
+        print(f"{'details':<14}{len(detail_pages):>7}{len(detail_pages) / seconds:>11.1f}"
+              f"{'-':>11}{peak / 1024:>11.1f}")
+        for fixture, output in zip(detail_pages, outputs):
+            if not output:
+                print(f"  no job details found in {fixture['url']}")
+
+
+if __name__ == "__main__":
+    main()
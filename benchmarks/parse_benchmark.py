@@ -0,0 +1,109 @@
+"""
+Benchmark Google Jobs result page parsing.
+
+Compares the full-page BeautifulSoup parse against the strained parse that only
+builds the job card subtrees, for every available parser backend, and checks
+that all of them produce the same listings.
+
+Usage:
+    python benchmarks/parse_benchmark.py [fixture_dir] [--repeat N]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+# Add the project root to Python's path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.jobsearch import GoogleJobsSearch
+
+DEFAULT_FIXTURE_DIR = os.path.join("data", "fixtures", "google_jobs")
+
+
+def build_synthetic_page(num_cards=50):
+    """Build a results page shaped like Google Jobs for when no fixtures are recorded"""
+    filler = "<div class='nav'>" + "<span>navigation</span>" * 200 + "</div>"
+    cards = []
+    for i in range(num_cards):
+        cards.append(f"""
+        <div class="iFjolb">
+            <div class="BjJfJf">Software Engineer {i}</div>
+            <div class="vNEEBe">Company {i % 7}</div>
+            <div class="Qk80Jf">City {i % 5}</div>
+            <div class="HBvzbc">Experience with Python and SQL. Knowledge of cloud platforms; degree in CS.</div>
+            <div class="KKh3md"><span class="LL4CDc">{i % 30} days ago</span></div>
+            <a class="pMhGee" href="/search?job={i}">Apply</a>
+        </div>""")
+    return f"<html><head>{filler}</head><body>{filler}{''.join(cards)}{filler}</body></html>"
+
+
+def load_pages(fixture_dir):
+    """Load recorded result pages, falling back to a synthetic page"""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(fixture_dir, "*.html"))):
+        with open(path, "r", encoding="utf-8") as f:
+            pages.append((os.path.basename(path), f.read()))
+
+    if not pages:
+        print(f"No fixtures found in {fixture_dir}, using a synthetic page")
+        pages.append(("synthetic", build_synthetic_page()))
+    return pages
+
+
+def available_modes():
+    """Parser configurations to compare, the first one is the reference"""
+    modes = [("html.parser, full page", "html.parser", False),
+             ("html.parser, cards only", "html.parser", True)]
+    try:
+        import lxml  # noqa: F401
+        modes.append(("lxml, full page", "lxml", False))
+        modes.append(("lxml, cards only", "lxml", True))
+    except ImportError:
+        print("lxml is not installed, skipping the lxml backend")
+    return modes
+
+
+def run_mode(search, pages, parser, strain_cards, repeat):
+    """Parse every page and return (outputs, seconds per page, peak bytes per page)"""
+    outputs = []
+    peaks = []
+    for _, html in pages:
+        tracemalloc.start()
+        outputs.append(search._parse_job_listings(html, limit=1000, parser=parser, strain_cards=strain_cards))
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for _, html in pages:
+            search._parse_job_listings(html, limit=1000, parser=parser, strain_cards=strain_cards)
+    elapsed = time.perf_counter() - started
+
+    return outputs, elapsed / (repeat * len(pages)), max(peaks)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("fixture_dir", nargs="?", default=DEFAULT_FIXTURE_DIR)
+    arg_parser.add_argument("--repeat", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    search = GoogleJobsSearch()
+    pages = load_pages(args.fixture_dir)
+
+    reference = None
+    print(f"{'Mode':<26}{'ms/page':>10}{'peak KiB/page':>16}  output")
+    for name, parser, strain_cards in available_modes():
+        outputs, seconds, peak = run_mode(search, pages, parser, strain_cards, args.repeat)
+        if reference is None:
+            reference = outputs
+        matches = "identical" if outputs == reference else "DIFFERS"
+        print(f"{name:<26}{seconds * 1000:>10.2f}{peak / 1024:>16.1f}  {matches}")
+
+
+if __name__ == "__main__":
+    main()
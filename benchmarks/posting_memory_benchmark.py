@@ -0,0 +1,62 @@
+"""
+Benchmark the memory held by search results in session state.
+
+Generates postings with the synthetic job generator and compares the memory
+retained by plain posting dicts against compact JobPosting objects, and checks
+that the compact postings convert back to the same dicts.
+
+Usage:
+    python benchmarks/posting_memory_benchmark.py [--postings N]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+# Add the project root to Python's path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.jobposting import JobPosting
+from core.syntheticjobs import SyntheticJobGenerator
+
+
+def retained_bytes(build):
+    """Bytes still allocated after build() returns, while its result is alive"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, retained
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--postings", type=int, default=5000)
+    arg_parser.add_argument("--query", default="python")
+    args = arg_parser.parse_args()
+
+    generator = SyntheticJobGenerator(seed=1)
+
+    def build_dicts():
+        return list(generator.iter_postings(args.postings, args.query))
+
+    def build_compact():
+        return [JobPosting.from_dict(job) for job in generator.iter_postings(args.postings, args.query)]
+
+    dicts, dict_bytes = retained_bytes(build_dicts)
+    compact, compact_bytes = retained_bytes(build_compact)
+    matches = all(job.to_dict() == original for job, original in zip(compact, dicts))
+
+    print(f"{'Representation':<16}{'total KiB':>12}{'bytes/posting':>16}")
+    print(f"{'dict':<16}{dict_bytes / 1024:>12.1f}{dict_bytes / args.postings:>16.0f}")
+    print(f"{'JobPosting':<16}{compact_bytes / 1024:>12.1f}{compact_bytes / args.postings:>16.0f}")
+    print(f"Saved {100 * (1 - compact_bytes / dict_bytes):.0f}% per posting; "
+          f"round trip {'identical' if matches else 'DIFFERS'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark requirement extraction from job descriptions.
+
+Compares the single-pass RequirementExtractor against the previous
+implementation, which ran one uncompiled regex per trigger phrase.
+
+Usage:
+    python benchmarks/requirements_benchmark.py [--descriptions N]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+# Add the project root to Python's path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.requirementextractor import SKILL_KEYWORDS, RequirementExtractor
+
+SKILLS = ["python", "sql", "aws", "kubernetes", "react", "statistics", "java",
+          "distributed systems", "machine learning", "ci/cd pipelines", "terraform"]
+
+FILLER = ["You will join a fast-growing team.", "We value ownership and curiosity.",
+          "The role is hybrid with two office days a week.", "Benefits include health and dental."]
+
+
+def build_descriptions(count, seed=42):
+    """Generate descriptions mixing trigger phrases with filler sentences"""
+    rng = random.Random(seed)
+    descriptions = []
+    for _ in range(count):
+        sentences = []
+        for _ in range(rng.randint(4, 12)):
+            roll = rng.random()
+            if roll < 0.35:
+                sentences.append(f"{rng.choice(SKILL_KEYWORDS).capitalize()} {rng.choice(SKILLS)}.")
+            elif roll < 0.5:
+                # Several phrases in one requirement, as real descriptions have them
+                phrases = rng.sample(SKILL_KEYWORDS, 2) + [rng.choice(SKILL_KEYWORDS)]
+                sentences.append(f"{phrases[0].capitalize()} {rng.choice(SKILLS)} and {phrases[1]} "
+                                 f"{rng.choice(SKILLS)}; {phrases[2]} {rng.choice(SKILLS)}.")
+            else:
+                sentences.append(rng.choice(FILLER))
+        descriptions.append(" ".join(sentences))
+    return descriptions
+
+
+def legacy_extract(description):
+    """The previous per-phrase loop, kept here as the baseline"""
+    extracted_reqs = []
+    for keyword in SKILL_KEYWORDS:
+        matches = re.finditer(f"{keyword}\\s+([^.;]*)[.;]", description.lower())
+        for match in matches:
+            if match.group(1).strip():
+                extracted_reqs.append(f"{keyword.capitalize()} {match.group(1).strip()}")
+    return list(set(extracted_reqs))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--descriptions", type=int, default=20000)
+    args = arg_parser.parse_args()
+
+    descriptions = build_descriptions(args.descriptions)
+    extractor = RequirementExtractor()
+
+    started = time.perf_counter()
+    legacy = [legacy_extract(description) for description in descriptions]
+    legacy_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    single_pass = list(extractor.extract_many(descriptions))
+    single_pass_seconds = time.perf_counter() - started
+
+    same = all(set(a) == set(b) for a, b in zip(legacy, single_pass))
+    print(f"Descriptions: {len(descriptions)}")
+    print(f"Per-phrase loop: {len(descriptions) / legacy_seconds:>12,.0f} descriptions/sec")
+    print(f"Single pass:     {len(descriptions) / single_pass_seconds:>12,.0f} descriptions/sec")
+    print(f"Speedup:         {legacy_seconds / single_pass_seconds:>12.1f}x")
+    print(f"Same requirements: {'yes' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark application tracker storage backends.
+
+Fills each backend with N applications, then times single-application
+lookups, updates, inserts and update-then-save round trips at that size, so
+the per-operation cost can be compared as the tracker grows.
+
+Usage:
+    python benchmarks/tracker_benchmark.py [--sizes 1000,10000,100000] [--ops N]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+# Add the project root to Python's path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.applicationtracker import ApplicationTracker
+from core.trackerstorage import TRACKER_COLUMNS, MemoryTrackerStorage, SqliteTrackerStorage
+
+STATUSES = ["Applied", "Interview Scheduled", "Follow-up Sent", "Rejected", "Offer Received"]
+
+
+def build_applications(count, start=0):
+    """Synthetic applications as a DataFrame"""
+    rng = random.Random(start)
+    rows = []
+    for i in range(start, start + count):
+        day = f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}"
+        rows.append({
+            'company': f"Company {i // 3}", 'position': f"Position {i % 3} #{i}",
+            'date_applied': day, 'status': rng.choice(STATUSES), 'follow_up_date': day,
+            'last_contact_date': day, 'contact_person': "", 'contact_email': "",
+            'notes': "Applied online", 'job_id': f"{i:016x}"
+        })
+    return pd.DataFrame(rows, columns=TRACKER_COLUMNS)
+
+
+def make_tracker(backend, size, directory):
+    """Tracker on the given backend, prefilled with size applications and bound to a file"""
+    applications = build_applications(size)
+    if backend == "sqlite":
+        file_path = os.path.join(directory, f"tracker_{size}.db")
+        storage = SqliteTrackerStorage()
+        storage.load(file_path)
+        storage.replace_all(applications)
+    else:
+        file_path = os.path.join(directory, f"tracker_{size}.csv")
+        storage = MemoryTrackerStorage()
+        storage.replace_all(applications)
+        storage.save(file_path)
+    return ApplicationTracker(storage), applications, file_path
+
+
+def time_per_op(operation, arguments):
+    started = time.perf_counter()
+    for args in arguments:
+        operation(*args)
+    return (time.perf_counter() - started) / len(arguments) * 1e6
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", default="1000,10000,100000")
+    arg_parser.add_argument("--ops", type=int, default=500)
+    args = arg_parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="tracker_benchmark_")
+    rng = random.Random(0)
+    print(f"{'backend':<10}{'rows':>9}{'get µs':>10}{'update µs':>11}{'insert µs':>11}{'save µs':>11}")
+    try:
+        for size in [int(s) for s in args.sizes.split(",")]:
+            for backend in ("memory", "sqlite"):
+                tracker, applications, file_path = make_tracker(backend, size, directory)
+                keys = [(applications.at[i, 'company'], applications.at[i, 'position'])
+                        for i in (rng.randrange(size) for _ in range(args.ops))]
+                new_rows = build_applications(args.ops, start=size)
+
+                # print() per change is part of the API, keep it out of the timings
+                stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+                try:
+                    get = time_per_op(tracker.get_application, keys)
+                    update = time_per_op(lambda c, p: tracker.update_application(c, p, status="Rejected"), keys)
+                    insert = time_per_op(tracker.track_application,
+                                         list(zip(new_rows['company'], new_rows['position'])))
+                    # What every button in the app does: change one field, then save
+                    save = time_per_op(lambda c, p: (tracker.update_application(c, p, status="Applied"),
+                                                     tracker.save_tracker(file_path)), keys)
+                finally:
+                    sys.stdout.close()
+                    sys.stdout = stdout
+                tracker.storage.close()
+                print(f"{backend:<10}{size:>9}{get:>10.1f}{update:>11.1f}{insert:>11.1f}{save:>11.1f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
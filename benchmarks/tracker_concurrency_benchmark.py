@@ -0,0 +1,149 @@
+"""
+Stress test concurrent writers on one application tracker.
+
+Starts several processes, each running several threads on its own
+ApplicationTracker over the same tracker file. Every thread tracks new
+applications and adds a note to one application they all share,
+saving as it goes, the way concurrent Streamlit sessions and app
+processes would. Afterwards the file is loaded fresh and checked for lost
+inserts and lost notes, each process checks that the statistics it kept
+up to date from the others' changes match a recount, and throughput and
+lock contention are reported.
+
+Usage:
+    python benchmarks/tracker_concurrency_benchmark.py [--processes 4] [--threads 4] [--ops 200]
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+# Add the project root to Python's path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.applicationtracker import ApplicationTracker
+from core.trackerstatistics import ApplicationStatistics
+
+SHARED = ("Shared Company", "Shared Position")
+
+
+def run_worker(file_path, worker, threads, ops, finished, results):
+    """One process: threads sharing one tracker, each tracking ops applications and notes"""
+    sys.stdout = open(os.devnull, "w")
+    tracker = ApplicationTracker()
+    tracker.load_tracker(file_path)
+
+    def work(thread):
+        for i in range(ops):
+            tracker.track_application(f"Company {worker}-{thread}", f"Position {i}")
+            tracker.update_application(*SHARED, notes=f"note {worker}-{thread}-{i}")
+            if i % 10 == 0:
+                tracker.save_tracker(file_path)
+
+    started = time.perf_counter()
+    pool = [threading.Thread(target=work, args=(thread,)) for thread in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    tracker.save_tracker(file_path)
+    seconds = time.perf_counter() - started
+
+    # Statistics kept up to date from other processes' changes must match a recount,
+    # taken once nobody is writing any more
+    finished.wait()
+    tracker.load_tracker(file_path)
+    recount = ApplicationStatistics()
+    recount.rebuild(tracker.get_all_applications())
+    consistent = recount.summary() == tracker.get_application_statistics()
+    results.put({'seconds': seconds, 'consistent': consistent, **tracker.get_lock_statistics()})
+
+
+def stress(file_path, processes, threads, ops):
+    sys.stdout, stdout = open(os.devnull, "w"), sys.stdout
+    try:
+        tracker = ApplicationTracker()
+        if os.path.splitext(file_path)[1] == ".db":
+            tracker.load_tracker(file_path)
+        tracker.track_application(*SHARED)
+        tracker.save_tracker(file_path)
+        tracker.storage.close()
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    finished = context.Barrier(processes)
+    workers = [context.Process(target=run_worker, args=(file_path, worker, threads, ops, finished, results))
+               for worker in range(processes)]
+    for worker in workers:
+        worker.start()
+    reports = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    # From the workers' own clocks, leaving out process start-up
+    elapsed = max(report['seconds'] for report in reports)
+
+    sys.stdout, stdout = open(os.devnull, "w"), sys.stdout
+    try:
+        check = ApplicationTracker()
+        check.load_tracker(file_path)
+        count = check.storage.count()
+        # Its history holds the status it was tracked with, then the notes
+        notes = check.count_application_history(*SHARED) - 1
+        check.storage.close()
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    expected = processes * threads * ops
+    lost_inserts = expected + 1 - count
+    lost_notes = expected - notes
+    return elapsed, expected, lost_inserts, lost_notes, reports
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--processes", type=int, default=4)
+    arg_parser.add_argument("--threads", type=int, default=4)
+    arg_parser.add_argument("--ops", type=int, default=200)
+    args = arg_parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="tracker_concurrency_")
+    print(f"{args.processes} processes x {args.threads} threads x {args.ops} track+note operations")
+    print(f"{'backend':<9}{'ops/s':>9}{'lost':>6}{'lost notes':>12}"
+          f"{'thread wait%':>14}{'file/db wait%':>15}{'max wait ms':>13}{'views':>8}")
+    failed = False
+    try:
+        for backend, extension in (("csv", ".csv"), ("sqlite", ".db")):
+            # Separate directories, or the SQLite tracker would import the CSV one next to it
+            os.makedirs(os.path.join(directory, backend))
+            file_path = os.path.join(directory, backend, f"tracker{extension}")
+            elapsed, expected, lost_inserts, lost_notes, reports = stress(
+                file_path, args.processes, args.threads, args.ops)
+            acquisitions = sum(report['storage']['acquisitions'] for report in reports)
+            contended = sum(report['storage']['contended'] for report in reports)
+            thread_acquisitions = sum(report['tracker']['acquisitions'] for report in reports)
+            thread_contended = sum(report['tracker']['contended'] for report in reports)
+            max_wait = max(report['storage']['max_wait_seconds'] for report in reports)
+            consistent = all(report['consistent'] for report in reports)
+            print(f"{backend:<9}{2 * expected / elapsed:>9.0f}{lost_inserts:>6}{lost_notes:>12}"
+                  f"{100 * thread_contended / max(thread_acquisitions, 1):>14.1f}"
+                  f"{100 * contended / max(acquisitions, 1):>15.1f}{1000 * max_wait:>13.1f}"
+                  f"{'yes' if consistent else 'NO':>8}")
+            failed = failed or lost_inserts != 0 or lost_notes != 0 or not consistent
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    if failed:
+        print("FAILED: updates were lost or statistics drifted")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
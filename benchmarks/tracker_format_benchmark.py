@@ -0,0 +1,114 @@
+"""
+Benchmark tracker snapshot formats.
+
+Writes the same applications as CSV, Parquet and Arrow IPC, then loads each
+one in a fresh process and reports file size, load time and peak RSS, for the
+full table and for a list-view projection that leaves out the notes column.
+Parquet and Arrow need pyarrow.
+
+Usage:
+    python benchmarks/tracker_format_benchmark.py [--sizes 10000,100000,1000000]
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to Python's path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.trackerstorage import TRACKER_COLUMNS, read_snapshot, write_snapshot
+
+STATUSES = np.array(["Applied", "Interview Scheduled", "Follow-up Sent", "Rejected", "Offer Received"],
+                    dtype=object)
+
+# Columns a list view needs
+LIST_COLUMNS = ['company', 'position', 'date_applied', 'status', 'follow_up_date']
+
+
+def build_applications(count):
+    """Synthetic applications as a DataFrame of text"""
+    rng = np.random.default_rng(0)
+    ids = np.arange(count)
+    days = pd.Timestamp("2023-01-01") + pd.to_timedelta(rng.integers(0, 700, count), unit="D")
+    dates = days.strftime("%Y-%m-%d").to_numpy(dtype=object)
+    follow_ups = (days + pd.Timedelta(days=14)).strftime("%Y-%m-%d").to_numpy(dtype=object)
+    return pd.DataFrame({
+        'company': np.char.add("Company ", (ids // 3).astype(str)).astype(object),
+        'position': np.char.add("Position ", ids.astype(str)).astype(object),
+        'date_applied': dates,
+        'status': STATUSES[rng.integers(0, len(STATUSES), count)],
+        'follow_up_date': follow_ups,
+        'last_contact_date': dates,
+        'contact_person': "",
+        'contact_email': "",
+        'notes': "Applied through the company website. Recruiter said to expect a reply within two weeks.",
+        'job_id': np.char.mod("%016x", ids).astype(object)
+    }, columns=TRACKER_COLUMNS)
+
+
+def measure_load(file_path, columns):
+    """Run in a child process: load a snapshot and report time and peak RSS"""
+    started = time.perf_counter()
+    frame = read_snapshot(file_path, columns=columns)
+    elapsed = time.perf_counter() - started
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mib = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    print(json.dumps({"seconds": elapsed, "rss_mib": peak_mib, "rows": len(frame)}))
+
+
+def load_in_child(file_path, columns):
+    command = [sys.executable, os.path.abspath(__file__), "--measure", file_path]
+    if columns:
+        command += ["--columns", ",".join(columns)]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", default="10000,100000,1000000")
+    arg_parser.add_argument("--measure", help=argparse.SUPPRESS)
+    arg_parser.add_argument("--columns", help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.measure:
+        measure_load(args.measure, args.columns.split(",") if args.columns else None)
+        return
+
+    try:
+        import pyarrow  # noqa: F401
+        extensions = [".csv", ".parquet", ".arrow"]
+    except ImportError:
+        print("pyarrow is not installed, only CSV is measured")
+        extensions = [".csv"]
+
+    directory = tempfile.mkdtemp(prefix="tracker_formats_")
+    print(f"{'rows':>9}  {'format':<9}{'MiB':>8}{'load s':>9}{'RSS MiB':>9}{'list s':>9}{'list RSS':>10}")
+    try:
+        for size in [int(s) for s in args.sizes.split(",")]:
+            applications = build_applications(size)
+            for extension in extensions:
+                file_path = os.path.join(directory, f"tracker_{size}{extension}")
+                write_snapshot(applications, file_path)
+                full = load_in_child(file_path, None)
+                projected = load_in_child(file_path, LIST_COLUMNS)
+                print(f"{size:>9}  {extension[1:]:<9}{os.path.getsize(file_path) / 2**20:>8.1f}"
+                      f"{full['seconds']:>9.3f}{full['rss_mib']:>9.0f}"
+                      f"{projected['seconds']:>9.3f}{projected['rss_mib']:>10.0f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark application history: adding notes and paging through them.
+
+Fills a tracker of N applications with notes added one update_application
+call at a time, then reports per-note cost, the list view (every column
+but notes), and reading the newest page of one application's history,
+cold (the first read after loading the tracker) and warm, plus an older page.
+
+Usage:
+    python benchmarks/tracker_history_benchmark.py [--rows 10000] [--notes 20000] [--page 10]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Add the project root to Python's path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.applicationtracker import ApplicationTracker
+from core.trackerstorage import SUMMARY_COLUMNS
+from tracker_benchmark import make_tracker
+
+
+def timed(operation):
+    started = time.perf_counter()
+    result = operation()
+    return result, time.perf_counter() - started
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--rows", type=int, default=10000)
+    arg_parser.add_argument("--notes", type=int, default=20000)
+    arg_parser.add_argument("--page", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="tracker_history_")
+    rng = random.Random(0)
+    print(f"{'backend':<9}{'note µs':>9}{'list ms':>9}{'cold page ms':>14}{'page µs':>9}{'older page µs':>15}")
+    try:
+        for backend in ("memory", "sqlite"):
+            tracker, applications, file_path = make_tracker(backend, args.rows, directory)
+            keys = list(zip(applications['company'], applications['position']))
+            # A few busy applications, as real trackers have
+            busy = keys[:10]
+            targets = [rng.choice(busy) if rng.random() < 0.5 else rng.choice(keys) for _ in range(args.notes)]
+
+            # print() per change is part of the API, keep it out of the timings
+            stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+            try:
+                note = "x" * 200
+                _, seconds = timed(lambda: [tracker.update_application(company, position, notes=f"Note {i}: {note}")
+                                            for i, (company, position) in enumerate(targets)])
+                tracker.save_tracker(file_path)
+                tracker.storage.close()
+                reader = ApplicationTracker()
+                reader.load_tracker(file_path)
+            finally:
+                sys.stdout.close()
+                sys.stdout = stdout
+
+            company, position = busy[0]
+            _, list_seconds = timed(lambda: reader.get_all_applications(columns=SUMMARY_COLUMNS))
+            _, cold = timed(lambda: reader.get_application_history(company, position, limit=args.page))
+            _, warm = timed(lambda: reader.get_application_history(company, position, limit=args.page))
+            _, older = timed(lambda: reader.get_application_history(company, position, limit=args.page,
+                                                                    offset=10 * args.page))
+            reader.storage.close()
+            print(f"{backend:<9}{seconds / args.notes * 1e6:>9.1f}{list_seconds * 1e3:>9.1f}"
+                  f"{cold * 1e3:>14.2f}{warm * 1e6:>9.1f}{older * 1e6:>15.1f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
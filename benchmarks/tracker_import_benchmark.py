@@ -0,0 +1,103 @@
+"""
+Benchmark bulk application import and export.
+
+Writes N synthetic applications (a tenth of them already tracked) as CSV,
+JSON and JSON Lines, then reports rows per second for import_applications
+and export_applications on each storage backend, next to adding the same
+rows one track_application call at a time (measured on --loop-rows rows).
+
+Usage:
+    python benchmarks/tracker_import_benchmark.py [--rows 100000] [--loop-rows 2000]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Add the project root to Python's path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.applicationtracker import ApplicationTracker
+from core.trackerio import write_applications
+from core.trackerstorage import MemoryTrackerStorage, SqliteTrackerStorage
+from tracker_benchmark import build_applications
+
+
+def make_tracker(backend, directory, existing):
+    """Tracker bound to a fresh file on the given backend, holding the existing applications"""
+    if backend == "sqlite":
+        storage = SqliteTrackerStorage()
+        storage.load(os.path.join(directory, "tracker.db"))
+        storage.replace_all(existing)
+    else:
+        storage = MemoryTrackerStorage()
+        storage.replace_all(existing)
+        storage.save(os.path.join(directory, "tracker.csv"))
+    return ApplicationTracker(storage)
+
+
+def timed(operation):
+    started = time.perf_counter()
+    result = operation()
+    return result, time.perf_counter() - started
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--rows", type=int, default=100000)
+    arg_parser.add_argument("--loop-rows", type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    applications = build_applications(args.rows)
+    existing = applications.iloc[::10]
+    directory = tempfile.mkdtemp(prefix="tracker_import_")
+    print(f"{'backend':<9}{'operation':<22}{'rows':>9}{'seconds':>10}{'rows/s':>12}")
+    try:
+        files = {}
+        for format in ("csv", "json", "jsonl"):
+            files[format] = os.path.join(directory, f"applications.{format}")
+            write_applications(applications, files[format])
+
+        stdout = sys.stdout
+        for backend in ("memory", "sqlite"):
+            results = []
+            for format, file_path in files.items():
+                with tempfile.TemporaryDirectory(dir=directory) as work:
+                    tracker = make_tracker(backend, work, existing)
+                    sys.stdout = open(os.devnull, "w")
+                    try:
+                        imported, seconds = timed(lambda: tracker.import_applications(file_path))
+                        _, export_seconds = timed(lambda: tracker.export_applications(
+                            os.path.join(work, f"export.{format}")))
+                    finally:
+                        sys.stdout.close()
+                        sys.stdout = stdout
+                    results.append((f"import {format}", imported, seconds))
+                    results.append((f"export {format}", tracker.storage.count(), export_seconds))
+                    tracker.storage.close()
+
+            # The old way: one track_application per row
+            with tempfile.TemporaryDirectory(dir=directory) as work:
+                tracker = make_tracker(backend, work, existing)
+                rows = applications.iloc[1:][applications.index[1:] % 10 != 0].head(args.loop_rows)
+                sys.stdout = open(os.devnull, "w")
+                try:
+                    _, seconds = timed(lambda: [tracker.track_application(c, p, s, n, j) for c, p, s, n, j in zip(
+                        rows['company'], rows['position'], rows['status'], rows['notes'], rows['job_id'])])
+                finally:
+                    sys.stdout.close()
+                    sys.stdout = stdout
+                results.append(("track_application", len(rows), seconds))
+                tracker.storage.close()
+
+            for operation, count, seconds in results:
+                print(f"{backend:<9}{operation:<22}{count:>9}{seconds:>10.3f}{count / seconds:>12,.0f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
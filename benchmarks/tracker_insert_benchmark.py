@@ -0,0 +1,81 @@
+"""
+Benchmark inserting applications one at a time.
+
+Compares the old tracker, which appended each application with pd.concat after a
+full-table duplicate check, against the hash-indexed columnar storage. The
+time per insert of the old approach grows with the tracker, so bulk loading is
+quadratic; the indexed storage stays flat, so it is linear.
+
+Usage:
+    python benchmarks/tracker_insert_benchmark.py [--sizes 5000,10000,20000,50000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+# Add the project root to Python's path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.trackerstorage import TRACKER_COLUMNS, MemoryTrackerStorage
+
+
+def make_row(i):
+    return {
+        'company': f"Company {i // 3}", 'position': f"Position {i}", 'date_applied': "2024-01-01",
+        'status': "Applied", 'follow_up_date': "2024-01-15", 'last_contact_date': "2024-01-01",
+        'contact_person': "", 'contact_email': "", 'notes': "", 'job_id': f"{i:016x}"
+    }
+
+
+def legacy_insert(count):
+    """The old tracker: duplicate check by boolean mask, then pd.concat per row"""
+    tracker = pd.DataFrame(columns=TRACKER_COLUMNS)
+    for i in range(count):
+        row = make_row(i)
+        existing = tracker[(tracker['company'] == row['company']) & (tracker['position'] == row['position'])]
+        if len(existing) == 0:
+            tracker = pd.concat([tracker, pd.DataFrame({c: [row[c]] for c in TRACKER_COLUMNS})],
+                                ignore_index=True)
+    return len(tracker)
+
+
+def indexed_insert(count):
+    """Duplicate check through the hash index, append into the columnar buffer"""
+    storage = MemoryTrackerStorage()
+    for i in range(count):
+        row = make_row(i)
+        if storage.get(row['company'], row['position']) is None:
+            storage.insert(row)
+    return storage.count()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", default="5000,10000,20000,50000")
+    arg_parser.add_argument("--max-legacy-rows", type=int, default=20000,
+                            help="Skip the old tracker above this size, it takes minutes")
+    args = arg_parser.parse_args()
+
+    print(f"{'rows':>8}{'old s':>10}{'old µs/row':>13}{'indexed s':>12}{'indexed µs/row':>17}")
+    for size in [int(s) for s in args.sizes.split(",")]:
+        legacy = None
+        if size <= args.max_legacy_rows:
+            started = time.perf_counter()
+            assert legacy_insert(size) == size
+            legacy = time.perf_counter() - started
+
+        started = time.perf_counter()
+        assert indexed_insert(size) == size
+        indexed = time.perf_counter() - started
+
+        legacy_columns = (f"{legacy:>10.2f}{legacy / size * 1e6:>13.1f}" if legacy is not None
+                          else f"{'-':>10}{'-':>13}")
+        print(f"{size:>8}{legacy_columns}{indexed:>12.3f}{indexed / size * 1e6:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,7 +18,41 @@ DEFAULT_FOLLOW_UP_DAYS = 14
 OUTPUT_DIRECTORY = "outputs"
 DATA_DIRECTORY = "data"
 RESUME_FILE = os.path.join(DATA_DIRECTORY, "resume.pdf")
-TRACKER_FILE = os.path.join(DATA_DIRECTORY, "application_tracker.csv")
+# Application tracker storage: "csv", "parquet" or "arrow" snapshots (the last two need pyarrow),
+# or "sqlite" (indexed, transactional)
+TRACKER_BACKEND = os.getenv("TRACKER_BACKEND", "csv").lower()
+TRACKER_FILE = os.getenv("TRACKER_FILE", os.path.join(
+    DATA_DIRECTORY, "application_tracker." + {"sqlite": "db", "parquet": "parquet", "arrow": "arrow"}.get(TRACKER_BACKEND, "csv")
+))
+
+# Job Search Cache
+SEARCH_CACHE_DIRECTORY = os.path.join(DATA_DIRECTORY, "cache", "search")
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "128"))
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "900"))  # seconds
+SEARCH_CACHE_MAX_AGE = int(os.getenv("SEARCH_CACHE_MAX_AGE", str(7 * 24 * 3600)))  # seconds, stale entries kept until then
+SEARCH_CACHE_DISK_ENTRIES = int(os.getenv("SEARCH_CACHE_DISK_ENTRIES", "1000"))
+
+# Job Search Sources
+# Sources searched by "All Sources", as registered in JobSearchFactory
+JOB_SEARCH_SOURCES = [s.strip().lower() for s in os.getenv("JOB_SEARCH_SOURCES", "google,simulated").split(",") if s.strip()]
+JOB_SEARCH_DEADLINE = float(os.getenv("JOB_SEARCH_DEADLINE", "8"))  # seconds for all sources together
+JOB_SEARCH_TIMEOUTS = {  # seconds per source, capped by the deadline
+    "google": float(os.getenv("GOOGLE_JOBS_TIMEOUT", "6")),
+    "simulated": 2.0
+}
+
+# Polite fetching of search and job detail pages
+FETCH_MAX_CONCURRENCY = int(os.getenv("FETCH_MAX_CONCURRENCY", "8"))
+FETCH_PER_HOST_CONCURRENCY = int(os.getenv("FETCH_PER_HOST_CONCURRENCY", "2"))
+FETCH_RATE_PER_HOST = float(os.getenv("FETCH_RATE_PER_HOST", "1.0"))  # requests per second
+FETCH_BURST_PER_HOST = int(os.getenv("FETCH_BURST_PER_HOST", "3"))
+FETCH_MAX_RETRIES = int(os.getenv("FETCH_MAX_RETRIES", "3"))
+FETCH_TIMEOUT = float(os.getenv("FETCH_TIMEOUT", "15"))  # seconds
+
+# Recorded HTTP responses for offline runs and benchmarks
+# "live" fetches normally, "record" also saves every response, "replay" serves only saved responses
+JOB_SEARCH_HTTP_MODE = os.getenv("JOB_SEARCH_HTTP_MODE", "live").lower()
+HTTP_FIXTURE_DIRECTORY = os.getenv("HTTP_FIXTURE_DIRECTORY", os.path.join(DATA_DIRECTORY, "fixtures", "http"))
 
 # Document Templates
 RESUME_TEMPLATE = os.path.join(DATA_DIRECTORY, "templates", "resume_template.md")
@@ -36,6 +70,9 @@ APP_STATUS = {
     "WITHDRAWN": "Withdrawn"
 }
 
+# Statuses whose follow-up date is still worth acting on
+FOLLOW_UP_STATUSES = [APP_STATUS["APPLIED"]]
+
 # Email Settings
 EMAIL_HOST = os.getenv("EMAIL_HOST", "smtp.gmail.com")
 EMAIL_PORT = int(os.getenv("EMAIL_PORT", "587"))
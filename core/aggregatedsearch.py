@@ -0,0 +1,162 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from core.jobindex import assign_job_id
+from core.jobsearch import JobSearchAPI
+
+# Common schema every source's postings are normalized to, with defaults
+NORMALIZED_FIELDS = {
+    "title": "Unknown Title",
+    "company": "Unknown Company",
+    "location": "Remote",
+    "description": "",
+    "requirements": [],
+    "posted_date": "Recently",
+    "application_url": "",
+    "source": "Unknown"
+}
+
+
+def normalize_posting(job, source_name):
+    """
+    Normalize a posting to the common schema
+
+    Args:
+        job (dict): Posting as returned by a source
+        source_name (str): Name of the source that returned it
+
+    Returns:
+        dict: Posting with every common field present and a job_id
+    """
+    normalized = dict(job)
+    for field, default in NORMALIZED_FIELDS.items():
+        value = normalized.get(field)
+        if value is None or value == "":
+            normalized[field] = list(default) if isinstance(default, list) else default
+        elif isinstance(value, str):
+            normalized[field] = value.strip()
+    if not job.get("source"):
+        normalized["source"] = source_name
+    if not normalized.get("job_id"):
+        assign_job_id(normalized)
+    return normalized
+
+
+class AggregatedJobSearch(JobSearchAPI):
+    """
+    Job search that queries several sources in parallel and merges what
+    finished before the deadline, so one slow source never stalls the search
+    """
+
+    source_name = "All Sources"
+
+    def __init__(self, sources, timeouts=None, deadline=8.0):
+        """
+        Args:
+            sources (dict): Job search instances by source name
+            timeouts (dict): Seconds to wait for each source, by source name
+            deadline (float): Seconds to wait for all sources together
+        """
+        super().__init__()
+        # Every source caches its own results; partial merged results are not cached
+        self.cache = None
+        self.sources = dict(sources)
+        self.timeouts = timeouts or {}
+        self.deadline = deadline
+
+    def search_jobs(self, query, location=None, limit=10, use_cache=True, page=0):
+        """
+        Search every source, each reading and writing its own cache unless use_cache is False
+
+        Returns:
+            dict: Merged results, see fetch_jobs
+        """
+        results = self.fetch_jobs(query, location, limit, page=page, use_cache=use_cache)
+        results["cache"] = {"hit": False, "age_seconds": 0}
+        return results
+
+    def fetch_jobs(self, query, location=None, limit=10, validators=None, page=0, use_cache=True):
+        """
+        Search every source in parallel and merge the results
+
+        Args:
+            query (str): Job search query
+            location (str): Job location
+            limit (int): Maximum number of results per source
+            validators (dict): Unused, each source revalidates its own cache
+            page (int): Result page to fetch, counting from 0
+            use_cache (bool): Whether the sources may answer from their caches
+
+        Returns:
+            dict: Merged results plus a "sources" entry with each source's
+                  status ("ok", "error" or "timeout"), result count and time taken
+        """
+        if not self.sources:
+            return {"results": [], "sources": {}, "error": "No job search sources are enabled"}
+
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=len(self.sources))
+        futures = {
+            executor.submit(source.search_jobs, query, location, limit, use_cache=use_cache, page=page): name
+            for name, source in self.sources.items()
+        }
+        cutoffs = {
+            future: min(self.timeouts.get(name, self.deadline), self.deadline)
+            for future, name in futures.items()
+        }
+
+        outcomes = {}
+        pending = set(futures)
+        while pending:
+            elapsed = time.monotonic() - started
+            next_cutoff = min(cutoffs[future] for future in pending)
+            done, pending = wait(pending, timeout=max(0, next_cutoff - elapsed), return_when=FIRST_COMPLETED)
+
+            elapsed = time.monotonic() - started
+            for future in done:
+                name = futures[future]
+                try:
+                    results = future.result()
+                    status = "error" if results.get("error") else "ok"
+                    outcomes[name] = (status, results, results.get("error"), elapsed)
+                except Exception as e:
+                    outcomes[name] = ("error", {"results": []}, str(e), elapsed)
+
+            # Give up on sources that ran past their own timeout
+            for future in [f for f in pending if elapsed >= cutoffs[f]]:
+                pending.discard(future)
+                outcomes[futures[future]] = ("timeout", {"results": []}, None, elapsed)
+
+        # Do not wait for timed-out sources; their threads finish in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        merged = []
+        seen = set()
+        sources = {}
+        for name in self.sources:
+            status, results, error, seconds = outcomes[name]
+            postings = [normalize_posting(job, self.sources[name].source_name)
+                        for job in results.get("results", [])]
+            sources[name] = {"status": status, "count": len(postings), "seconds": round(seconds, 3)}
+            if error:
+                sources[name]["error"] = error
+
+            for job in postings:
+                if job["job_id"] in seen:
+                    continue
+                seen.add(job["job_id"])
+                merged.append(job)
+
+        return {
+            "results": merged,
+            "sources": sources,
+            "elapsed": round(time.monotonic() - started, 3)
+        }
+
+    def get_job_details(self, job_url):
+        """Get job details from the first source that has them"""
+        for source in self.sources.values():
+            details = source.get_job_details(job_url)
+            if details:
+                return details
+        return {}
@@ -3,7 +3,7 @@ from dotenv import load_dotenv
 from core.resumeprocessor import ResumeProcessor
 from core.jobanalyzer import JobAnalyzer
 from core.documentgenerator import DocumentGenerator
-from core.applicationtracker import ApplicationTracker
+from core.applicationtracker import get_default_tracker
 from core.jobsearchfactory import JobSearchFactory
 
 # Load environment variables from .env file
@@ -13,7 +13,7 @@ from dotenv import load_dotenv
 from core.resumeprocessor import ResumeProcessor
 from core.jobanalyzer import JobAnalyzer
 from core.documentgenerator import DocumentGenerator
-from core.applicationtracker import ApplicationTracker
+from core.applicationtracker import get_default_tracker
 from core.jobsearchfactory import JobSearchFactory
 
 # Load environment variables from .env file
@@ -30,7 +30,8 @@ class JobApplicationAutomator:
         self.resume_processor = ResumeProcessor(self.api_key)
         self.job_analyzer = JobAnalyzer(self.api_key)
         self.document_generator = DocumentGenerator(self.api_key)
-        self.application_tracker = ApplicationTracker()
+        # Every session shares one resident tracker instead of re-reading the file
+        self.application_tracker = get_default_tracker()
         
         # Initialize job search engine (defaults to Google Jobs)
         self.job_search_type = os.getenv("JOB_SEARCH_TYPE", "google")
@@ -82,9 +83,9 @@ class JobApplicationAutomator:
         """
         return self.job_search.search_jobs(query, location, limit)
     
-    def track_application(self, company, position, status="Applied", notes=""):
+    def track_application(self, company, position, status="Applied", notes="", job_id=""):
         """Add an application to the tracking system"""
-        self.application_tracker.track_application(company, position, status, notes)
+        self.application_tracker.track_application(company, position, status, notes, job_id)
         
     def generate_follow_up_email(self, company, position):
         """Generate a follow-up email for a specific application"""
@@ -110,6 +111,10 @@ class JobApplicationAutomator:
         """Get applications due for follow-up"""
         return self.application_tracker.get_due_follow_ups()
 
+    def get_upcoming_follow_ups(self, days=7):
+        """Get applications whose follow-up falls within the next days days"""
+        return self.application_tracker.get_upcoming_follow_ups(days)
+
 
 # Example usage
 if __name__ == "__main__":
@@ -129,7 +134,8 @@ class JobApplicationAutomator:
         self.resume_processor = ResumeProcessor(self.api_key)
         self.job_analyzer = JobAnalyzer(self.api_key)
         self.document_generator = DocumentGenerator(self.api_key)
-        self.application_tracker = ApplicationTracker()
+        # Every session shares one resident tracker instead of re-reading the file
+        self.application_tracker = get_default_tracker()
         
     def load_resume(self, resume_path):
         """Load and process the user's resume"""
@@ -163,9 +169,9 @@ class JobApplicationAutomator:
             job_analysis
         )
     
-    def track_application(self, company, position, status="Applied", notes=""):
+    def track_application(self, company, position, status="Applied", notes="", job_id=""):
         """Add an application to the tracking system"""
-        self.application_tracker.track_application(company, position, status, notes)
+        self.application_tracker.track_application(company, position, status, notes, job_id)
         
     def generate_follow_up_email(self, company, position):
         """Generate a follow-up email for a specific application"""
@@ -191,6 +197,10 @@ class JobApplicationAutomator:
         """Get applications due for follow-up"""
         return self.application_tracker.get_due_follow_ups()
 
+    def get_upcoming_follow_ups(self, days=7):
+        """Get applications whose follow-up falls within the next days days"""
+        return self.application_tracker.get_upcoming_follow_ups(days)
+
 
 # Example usage
 if __name__ == "__main__":
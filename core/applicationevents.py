@@ -0,0 +1,231 @@
+import io
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+# What an application's history records
+EVENT_KINDS = ("status", "contact", "note", "follow_up")
+
+
+def new_event(company, position, kind, body):
+    """An event dict stamped with the current time"""
+    if kind not in EVENT_KINDS:
+        raise ValueError(f"Unknown application event kind: {kind}")
+    return {
+        'company': company,
+        'position': position,
+        'occurred_at': datetime.now().isoformat(timespec="seconds"),
+        'kind': kind,
+        'body': body
+    }
+
+
+class ApplicationEventLog:
+    """
+    Application events in an append-only JSON Lines file
+
+    Each application's events are indexed by byte offset and length, so a
+    page of its history is a few seeks and reads, and nothing else in the
+    file (other applications' notes included) is ever parsed again. The index
+    is built on first use and extended from where it stopped, which also
+    picks up events other processes appended. Without a file the events are
+    kept in memory until bind() gives them one.
+
+    Clearing an application only appends a record saying so; compact()
+    rewrites the file without the events cleared applications left behind,
+    and other processes notice the new file and index it afresh.
+    """
+
+    # compact() leaves the file alone while less than this share of it is dead
+    compact_ratio = 0.25
+
+    def __init__(self, file_path=None):
+        self.file_path = file_path
+        self._buffer = io.BytesIO() if file_path is None else None
+        self._reset_index(None)
+        self._lock = threading.Lock()
+
+    def _reset_index(self, identity):
+        self._offsets = {}
+        self._indexed = 0
+        self._dead_bytes = 0
+        self._identity = identity
+
+    def bind(self, file_path):
+        """Move in-memory events to the end of a file and keep writing there"""
+        with self._lock:
+            if self._buffer is not None and self._buffer.getbuffer().nbytes:
+                os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+                with open(file_path, "ab") as f:
+                    f.write(self._buffer.getvalue())
+                    f.flush()
+                    os.fsync(f.fileno())
+            self.file_path = file_path
+            self._buffer = None
+            self._reset_index(None)
+
+    @contextmanager
+    def _reading(self):
+        """The event file (or buffer) open for reading, None when there is no file yet"""
+        if self._buffer is not None:
+            yield self._buffer
+        elif not os.path.exists(self.file_path):
+            yield None
+        else:
+            with open(self.file_path, "rb") as f:
+                yield f
+
+    def append(self, event):
+        """
+        Add an event (see new_event); call holding the tracker's write lock
+
+        Args:
+            event (dict): company, position, occurred_at, kind and body
+        """
+        self._write(json.dumps(event) + "\n")
+
+    def append_many(self, events):
+        """Add events (see new_event) in one write; call holding the tracker's write lock"""
+        self._write("".join(json.dumps(event) + "\n" for event in events))
+
+    def clear(self, company, position):
+        """Forget an application's events, e.g. when it is deleted"""
+        self._write(json.dumps({'company': company, 'position': position, 'kind': "cleared"}) + "\n")
+
+    def _write(self, line):
+        with self._lock:
+            if self._buffer is not None:
+                self._buffer.seek(0, os.SEEK_END)
+                self._buffer.write(line.encode("utf-8"))
+                return
+            os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+            with open(self.file_path, "ab") as f:
+                f.write(line.encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _index_new(self, f):
+        """Index events added since the last look (by us or another process), from an open file"""
+        if self._buffer is None:
+            identity = _identity(f)
+            if identity != self._identity:
+                # Compacted by another process, the offsets no longer hold
+                self._reset_index(identity)
+        f.seek(self._indexed)
+        position = self._indexed
+        for line in f:
+            if not line.endswith(b"\n"):
+                # Still being written by another process
+                break
+            record = json.loads(line)
+            key = (record['company'], record['position'])
+            if record['kind'] == "cleared":
+                self._dead_bytes += sum(length for _, length in self._offsets.pop(key, ())) + len(line)
+            else:
+                self._offsets.setdefault(key, []).append((position, len(line)))
+            position += len(line)
+        self._indexed = position
+
+    def count(self, company, position):
+        """Number of events of an application"""
+        with self._lock:
+            with self._reading() as f:
+                if f is not None:
+                    self._index_new(f)
+            return len(self._offsets.get((company, position), ()))
+
+    def history(self, company, position, limit=20, offset=0):
+        """
+        A page of an application's events, newest first
+
+        Args:
+            company (str): Company name
+            position (str): Position title
+            limit (int): Events per page
+            offset (int): Newer events to skip
+
+        Returns:
+            list: Event dicts
+        """
+        with self._lock:
+            with self._reading() as f:
+                if f is None:
+                    return []
+                self._index_new(f)
+                entries = self._offsets.get((company, position), [])
+                end = max(len(entries) - offset, 0)
+                events = []
+                for start, length in entries[max(end - limit, 0):end][::-1]:
+                    f.seek(start)
+                    events.append(json.loads(f.read(length)))
+                return events
+
+    def events(self):
+        """Every event still belonging to an application, in the order they were added"""
+        with self._lock:
+            if self._buffer is not None:
+                # A copy, so appends can carry on while it is read
+                f = io.BytesIO(self._buffer.getvalue())
+            elif os.path.exists(self.file_path):
+                f = open(self.file_path, "rb")
+            else:
+                return
+            try:
+                self._index_new(f)
+            except BaseException:
+                f.close()
+                raise
+            entries = sorted(entry for offsets in self._offsets.values() for entry in offsets)
+        # Read without the lock; an open file keeps its contents even if compact() replaces it
+        with f:
+            for start, length in entries:
+                f.seek(start)
+                yield json.loads(f.read(length))
+
+    def compact(self):
+        """
+        Rewrite the event file without the events of cleared applications
+
+        Call holding the tracker's file lock, so no other process appends
+        meanwhile. Does nothing while dead events are less than
+        compact_ratio of the file.
+
+        Returns:
+            bool: Whether the file was rewritten
+        """
+        with self._lock:
+            if self._buffer is not None:
+                return False
+            with self._reading() as f:
+                if f is None:
+                    return False
+                self._index_new(f)
+                if not self._dead_bytes or self._dead_bytes < self.compact_ratio * self._indexed:
+                    return False
+                entries = sorted(entry for offsets in self._offsets.values() for entry in offsets)
+                tmp_path = self.file_path + ".tmp"
+                with open(tmp_path, "wb") as out:
+                    for start, length in entries:
+                        f.seek(start)
+                        out.write(f.read(length))
+                    out.flush()
+                    os.fsync(out.fileno())
+            try:
+                os.replace(tmp_path, self.file_path)
+            except OSError as e:
+                # Windows will not replace a file another process has open; try again next time
+                print(f"Error compacting application events: {e}")
+                os.remove(tmp_path)
+                return False
+            with open(self.file_path, "rb") as f:
+                self._reset_index(_identity(f))
+                self._index_new(f)
+            return True
+
+
+def _identity(f):
+    """(device, inode) of an open file, which a rewrite by os.replace changes"""
+    stat = os.fstat(f.fileno())
+    return (stat.st_dev, stat.st_ino)
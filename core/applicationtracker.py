@@ -1,154 +1,384 @@
-import pandas as pd
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 
+import pandas as pd
+
+from config import TRACKER_FILE
+from core.applicationevents import new_event
+from core.followupindex import FollowUpIndex
+from core.trackerio import new_applications, prepare_applications, read_applications, write_applications
+from core.trackerlock import ReadWriteLock
+from core.trackerstatistics import ApplicationStatistics
+from core.trackerstorage import (SUMMARY_COLUMNS, TRACKER_COLUMNS, MemoryTrackerStorage,
+                                 create_tracker_storage, is_sqlite_path)
+
 class ApplicationTracker:
-    def __init__(self):
-        self.tracker = pd.DataFrame(columns=[
-            'company', 'position', 'date_applied', 'status', 'follow_up_date', 
-            'last_contact_date', 'contact_person', 'contact_email', 'notes'
-        ])
-    
-    def track_application(self, company, position, status="Applied", notes=""):
-        """Add a new application to the tracker"""
+    """
+    Tracks job applications in a storage backend chosen by the tracker file:
+    hash-indexed in-memory columns saved as CSV, or an indexed SQLite database (.db/.sqlite)
+
+    One instance is shared by every session (see get_default_tracker), so
+    load_tracker() only reloads when the file changed under it; a tracker
+    file that does not exist yet loads as an empty tracker, saved there later.
+    Follow-up dates (FollowUpIndex) and statistics (ApplicationStatistics)
+    are updated with every change, so due follow-ups and dashboards never
+    scan the tracker. Status changes, contacts, follow-ups and notes go to
+    each application's history, read a page at a time, so the notes column
+    only ever holds the note an application was tracked with.
+
+    Reads share a read-write lock and run side by side; each change is a
+    storage transaction (the tracker file lock, or BEGIN IMMEDIATE for
+    SQLite) that first takes in what other processes wrote, so two
+    sessions or app processes changing the tracker at once both land.
+    The write lock is only taken once the storage transaction has begun,
+    so reads never wait on another process.
+    """
+
+    def __init__(self, storage=None):
+        self.storage = storage or MemoryTrackerStorage()
+        self._lock = ReadWriteLock()
+        self.follow_ups = FollowUpIndex()
+        self.statistics = ApplicationStatistics()
+        self._rebuild_views()
+
+    @property
+    def tracker(self):
+        """All applications as a DataFrame"""
+        return self.get_all_applications()
+
+    def track_application(self, company, position, status="Applied", notes="", job_id=""):
+        """Add a new application to the tracker, linked to a job posting by job_id if known"""
         today = datetime.now().strftime("%Y-%m-%d")
         follow_up = (datetime.now() + timedelta(days=14)).strftime("%Y-%m-%d")
-        
-        new_application = pd.DataFrame({
-            'company': [company],
-            'position': [position],
-            'date_applied': [today],
-            'status': [status],
-            'follow_up_date': [follow_up],
-            'last_contact_date': [today],
-            'contact_person': [""],
-            'contact_email': [""],
-            'notes': [notes]
-        })
-        
-        # Check if this application already exists
-        existing = self.tracker[
-            (self.tracker['company'] == company) & 
-            (self.tracker['position'] == position)
-        ]
-        
-        if len(existing) > 0:
-            # Update existing application
-            self.update_application(company, position, status=status, notes=notes)
-        else:
+
+        with self._writing():
+            # Check if this application already exists
+            if self.storage.get(company, position) is not None:
+                # Update existing application
+                self.update_application(company, position, status=status, notes=notes)
+                return
+
             # Add new application
-            self.tracker = pd.concat([self.tracker, new_application], ignore_index=True)
-            print(f"Application for {position} at {company} has been tracked.")
-    
-    def update_application(self, company, position, status=None, 
+            application = {
+                'company': company,
+                'position': position,
+                'date_applied': today,
+                'status': status,
+                'follow_up_date': follow_up,
+                'last_contact_date': today,
+                'contact_person': "",
+                'contact_email': "",
+                'notes': notes,
+                'job_id': job_id
+            }
+            self.storage.insert(application)
+            self.storage.add_event(company, position, "status", status)
+            self._record_change(None, application)
+        print(f"Application for {position} at {company} has been tracked.")
+
+    def update_application(self, company, position, status=None,
                           follow_up_date=None, last_contact_date=None,
                           contact_person=None, contact_email=None, notes=None):
-        """Update an existing application"""
-        # Find the application
-        mask = (self.tracker['company'] == company) & (self.tracker['position'] == position)
-        
-        if not any(mask):
-            print(f"No application found for {position} at {company}")
-            return False
-        
-        # Update the fields that were provided
-        if status:
-            self.tracker.loc[mask, 'status'] = status
-            
-        if follow_up_date:
-            self.tracker.loc[mask, 'follow_up_date'] = follow_up_date
-            
-        if last_contact_date:
-            self.tracker.loc[mask, 'last_contact_date'] = last_contact_date
-        
-        if contact_person:
-            self.tracker.loc[mask, 'contact_person'] = contact_person
-            
-        if contact_email:
-            self.tracker.loc[mask, 'contact_email'] = contact_email
-            
-        if notes:
-            # Append to existing notes
-            existing_notes = self.tracker.loc[mask, 'notes'].iloc[0]
-            updated_notes = existing_notes
-            if existing_notes:
-                today = datetime.now().strftime("%Y-%m-%d")
-                updated_notes = f"{existing_notes}\n\n{today}: {notes}"
-            else:
-                updated_notes = notes
-                
-            self.tracker.loc[mask, 'notes'] = updated_notes
-        
+        """Update an existing application, recording what changed (and any note) in its history"""
+        with self._writing():
+            # Find the application
+            application = self.storage.get(company, position)
+
+            if application is None:
+                print(f"No application found for {position} at {company}")
+                return False
+
+            # Update the fields that were provided
+            fields = {}
+            events = []
+            if status:
+                fields['status'] = status
+                if status != application['status']:
+                    events.append(("status", status))
+
+            if follow_up_date:
+                fields['follow_up_date'] = follow_up_date
+                events.append(("follow_up", follow_up_date))
+
+            if last_contact_date:
+                fields['last_contact_date'] = last_contact_date
+
+            if contact_person:
+                fields['contact_person'] = contact_person
+
+            if contact_email:
+                fields['contact_email'] = contact_email
+
+            contact = " ".join(value for value in (contact_person, contact_email and f"<{contact_email}>",
+                                                   last_contact_date and f"on {last_contact_date}") if value)
+            if contact:
+                events.append(("contact", contact))
+
+            if notes:
+                # Notes go to the history rather than growing the notes column
+                events.append(("note", notes))
+
+            if fields:
+                self.storage.update(company, position, fields)
+                self._record_change(application, {**application, **fields})
+            for kind, body in events:
+                self.storage.add_event(company, position, kind, body)
         print(f"Application for {position} at {company} has been updated.")
         return True
-    
+
+    @contextmanager
+    def _writing(self):
+        """
+        Exclusive access for a read-modify-write, caught up with other processes' changes
+
+        The storage lock is taken first, so waiting for another process (up to
+        SQLite's busy timeout) happens before this process's readers are held up.
+        """
+        while True:
+            storage = self.storage
+            with storage.transaction() as changes, self._lock.write():
+                if storage is not self.storage:
+                    # Another file was loaded while we waited, start over on that one
+                    continue
+                self._take_in(changes)
+                yield
+                return
+
+    def _take_in(self, changes):
+        """Bring the follow-up index and statistics in line with changes other processes made"""
+        if changes is None:
+            # Too many, or a wholesale reload
+            self._rebuild_views()
+        else:
+            for old_row, new_row in changes:
+                self.follow_ups.apply(old_row, new_row)
+                self.statistics.apply(old_row, new_row)
+
+    def _record_change(self, old_row, new_row):
+        """Bring the follow-up index and statistics in line with one change"""
+        self.follow_ups.apply(old_row, new_row)
+        self.statistics.apply(old_row, new_row)
+
+    def _rebuild_views(self):
+        """Rebuild the follow-up index and statistics from the storage"""
+        applications = self.storage.all(columns=SUMMARY_COLUMNS)
+        self.follow_ups.rebuild(applications)
+        self.statistics.rebuild(applications)
+
+    def import_applications(self, source, format=None):
+        """
+        Add many applications at once
+
+        Rows get the same defaults as track_application, column by column,
+        and each new application starts its history with its status, as it
+        does there; applications already tracked (by company and position)
+        are left alone, and the new ones are stored in a single transaction.
+
+        Args:
+            source: CSV, JSON or JSON Lines file path or file object, a DataFrame, or a list of dicts
+            format (str): csv, json or jsonl; guessed from the file extension if None
+
+        Returns:
+            int: Number of applications added
+        """
+        try:
+            applications = prepare_applications(read_applications(source, format))
+        except Exception as e:
+            print(f"Error importing applications: {e}")
+            return 0
+
+        with self._writing():
+            new = new_applications(applications, self.storage.keys())
+            if not new.empty:
+                self.storage.insert_many(new)
+                self.storage.add_events([new_event(company, position, "status", status) for company, position, status
+                                         in zip(new['company'], new['position'], new['status'])])
+                # Rebuilding vectorized beats one incremental update per row here
+                self._rebuild_views()
+        print(f"Imported {len(new)} applications ({len(applications) - len(new)} already tracked).")
+        return len(new)
+
+    def export_applications(self, target, format=None):
+        """
+        Write every application as CSV, JSON or JSON Lines
+
+        Args:
+            target: File path or writable file object
+            format (str): csv, json or jsonl; guessed from the file extension if None
+
+        Returns:
+            int: Number of applications written
+        """
+        with self._lock.read():
+            applications = self.storage.all()
+        write_applications(applications, target, format)
+        return len(applications)
+
+    def get_application_by_job_id(self, job_id):
+        """Get the application linked to a job posting"""
+        with self._lock.read():
+            return self.storage.get_by_job_id(job_id)
+
     def get_application(self, company, position):
         """Get a specific application"""
-        application = self.tracker[
-            (self.tracker['company'] == company) & 
-            (self.tracker['position'] == position)
-        ]
-        
-        if application.empty:
-            return None
-        
-        # Convert to dictionary
-        return application.iloc[0].to_dict()
-    
-    def get_all_applications(self, status=None):
-        """Get all applications, optionally filtered by status"""
-        if status:
-            return self.tracker[self.tracker['status'] == status]
-        return self.tracker
-    
+        with self._lock.read():
+            return self.storage.get(company, position)
+
+    def get_all_applications(self, status=None, columns=None):
+        """
+        Get all applications, optionally filtered by status
+
+        Args:
+            status (str): Only applications in this status
+            columns (list): Only these columns; list views pass SUMMARY_COLUMNS to leave out notes
+
+        Returns:
+            DataFrame: The applications
+        """
+        with self._lock.read():
+            return self.storage.all(status, columns)
+
+    def get_application_history(self, company, position, limit=20, offset=0):
+        """
+        Get a page of an application's history, newest first
+
+        Args:
+            company (str): Company name
+            position (str): Position title
+            limit (int): Events per page
+            offset (int): Newer events to skip, e.g. the number already shown
+
+        Returns:
+            list: Dicts with occurred_at, kind (status, contact, note or follow_up) and body
+        """
+        with self._lock.read():
+            return self.storage.history(company, position, limit, offset)
+
+    def count_application_history(self, company, position):
+        """Get the number of events in an application's history"""
+        with self._lock.read():
+            return self.storage.history_count(company, position)
+
     def get_due_follow_ups(self):
-        """Get applications due for follow-up"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        follow_ups = self.tracker[
-            (self.tracker['follow_up_date'] <= today) & 
-            (self.tracker['status'] == "Applied")
-        ]
-        
-        return follow_ups
-    
+        """Get applications due for follow-up, earliest first"""
+        with self._lock.read():
+            return self._applications(self.follow_ups.due())
+
+    def get_upcoming_follow_ups(self, days=7):
+        """Get applications whose follow-up falls within the next days days (after today), earliest first"""
+        tomorrow = (datetime.now() + timedelta(days=1)).date()
+        with self._lock.read():
+            return self._applications(self.follow_ups.due_within(days - 1, start=tomorrow))
+
+    def get_next_follow_up(self):
+        """Get the application with the earliest follow-up date, or None"""
+        with self._lock.read():
+            entry = self.follow_ups.next_due()
+            return None if entry is None else self.storage.get(entry[1], entry[2])
+
+    def _applications(self, entries):
+        """Applications for (follow_up_date, company, position) index entries as a DataFrame"""
+        rows = [self.storage.get(company, position) for _, company, position in entries]
+        return pd.DataFrame(rows, columns=TRACKER_COLUMNS)
+
     def save_tracker(self, file_path):
-        """Save tracker to CSV file"""
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        self.tracker.to_csv(file_path, index=False)
+        """Save tracker to its file (CSV, or SQLite for .db/.sqlite paths)"""
+        with self._writing():
+            self.storage.save(file_path)
         print(f"Application tracking data saved to {file_path}")
-    
+
     def load_tracker(self, file_path):
-        """Load tracker from CSV file"""
+        """
+        Load tracker from its file (CSV, or SQLite for .db/.sqlite paths)
+
+        Nothing is read when the tracker already holds this file and nobody
+        else has changed it since, so pages can call this on every rerun.
+        """
+        with self._lock.read():
+            if not self.storage.is_stale(file_path):
+                return
+            same_file = (self.storage.file_path is not None
+                         and os.path.abspath(file_path) == os.path.abspath(self.storage.file_path))
+        if same_file:
+            # Only other processes changed it, take in just their changes
+            with self._writing():
+                return
+        with self._lock.write():
+            if not self.storage.is_stale(file_path):
+                return
+            previous = self._load(file_path)
+        # Outside the lock: a writer may still hold the old storage's lock, waiting for ours
+        if previous is not None:
+            previous.close()
+
+    def _load(self, file_path):
+        """Switch to the tracker at file_path, returns the storage it replaced (None on failure)"""
         try:
-            self.tracker = pd.read_csv(file_path)
+            storage = create_tracker_storage(file_path)
+            if is_sqlite_path(file_path) and not os.path.exists(file_path):
+                # Carry over a CSV tracker kept next to the new database
+                legacy_csv = os.path.splitext(file_path)[0] + ".csv"
+                if os.path.exists(legacy_csv):
+                    legacy = MemoryTrackerStorage()
+                    legacy.load(legacy_csv)
+                    legacy.save(file_path)
+                    print(f"Imported {legacy.count()} applications from {legacy_csv}")
+            storage.load(file_path)
+            previous, self.storage = self.storage, storage
+            self._rebuild_views()
             print(f"Application tracking data loaded from {file_path}")
+            return previous
         except Exception as e:
             print(f"Error loading tracker: {e}")
-    
+            return None
+
+    def get_lock_statistics(self):
+        """
+        Get contention metrics: acquisitions, how many had to wait and for how long
+
+        Returns:
+            dict: 'tracker' for writers within this process, 'storage' for the
+            file or database lock shared with other processes
+        """
+        return {'tracker': self._lock.stats.summary(), 'storage': self.storage.lock_stats.summary()}
+
     def get_application_statistics(self):
         """Get statistics about applications"""
-        stats = {
-            'total_applications': len(self.tracker),
-            'status_counts': self.tracker['status'].value_counts().to_dict(),
-            'companies_applied': self.tracker['company'].nunique(),
-            'positions_applied': self.tracker['position'].nunique(),
-            'oldest_application': self.tracker['date_applied'].min() if not self.tracker.empty else None,
-            'newest_application': self.tracker['date_applied'].max() if not self.tracker.empty else None,
-        }
-        
-        return stats
-    
+        with self._lock.read():
+            return self.statistics.summary()
+
+    def get_application_timeline(self):
+        """Get applications per week (week ending date and count) for the timeline chart"""
+        with self._lock.read():
+            return self.statistics.timeline()
+
     def delete_application(self, company, position):
         """Delete an application from the tracker"""
-        before_count = len(self.tracker)
-        self.tracker = self.tracker[
-            ~((self.tracker['company'] == company) & (self.tracker['position'] == position))
-        ]
-        
-        if len(self.tracker) < before_count:
+        with self._writing():
+            application = self.storage.get(company, position)
+            deleted = self.storage.delete(company, position)
+            if deleted:
+                self.storage.clear_history(company, position)
+                self._record_change(application, None)
+        if deleted:
             print(f"Application for {position} at {company} has been deleted.")
             return True
         else:
             print(f"No application found for {position} at {company}")
             return False
+
+
+_default_tracker = None
+_default_tracker_lock = threading.Lock()
+
+
+def get_default_tracker():
+    """Get the application tracker shared by every session in this process, loaded from TRACKER_FILE"""
+    global _default_tracker
+    with _default_tracker_lock:
+        if _default_tracker is None:
+            _default_tracker = ApplicationTracker()
+            _default_tracker.load_tracker(TRACKER_FILE)
+        return _default_tracker
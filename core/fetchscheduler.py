@@ -0,0 +1,271 @@
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+
+from config import (FETCH_BURST_PER_HOST, FETCH_MAX_CONCURRENCY, FETCH_MAX_RETRIES,
+                    FETCH_PER_HOST_CONCURRENCY, FETCH_RATE_PER_HOST, FETCH_TIMEOUT,
+                    HTTP_FIXTURE_DIRECTORY, JOB_SEARCH_HTTP_MODE)
+from core.httpfixtures import RecordReplayTransport
+
+# Responses that mean the host wants us to slow down
+THROTTLE_STATUS_CODES = {429, 503}
+
+
+class TokenBucket:
+    """Token bucket rate limiter; callers hold the scheduler lock"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, now):
+        """Seconds until a token is available"""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self, now):
+        self._refill(now)
+        self.tokens -= 1
+
+
+class HostState:
+    """Queue, limits and counters for one host"""
+
+    def __init__(self, rate, burst):
+        self.queue = deque()
+        self.active = 0
+        self.bucket = TokenBucket(rate, burst)
+        self.backoff_until = 0.0
+        self.stats = {
+            "requests": 0, "throttled": 0, "retries": 0, "errors": 0,
+            "wait_seconds": 0.0, "max_queue": 0, "backoff_seconds": 0.0
+        }
+
+    def delay(self, now):
+        """Seconds until this host may send another request, ignoring concurrency"""
+        return max(self.backoff_until - now, self.bucket.delay(now), 0.0)
+
+
+class FetchScheduler:
+    """
+    Polite HTTP fetcher shared by the job search sources
+
+    Requests are admitted under a global concurrency cap and a per-host cap,
+    spaced by a per-host token bucket, and retried with exponential backoff
+    (or the host's Retry-After) on 429/503. When several hosts have waiting
+    requests, free slots are handed out round-robin across hosts so a slow
+    or throttled host never starves the others.
+    """
+
+    def __init__(self, session=None, max_concurrency=FETCH_MAX_CONCURRENCY,
+                 per_host_concurrency=FETCH_PER_HOST_CONCURRENCY, rate_per_host=FETCH_RATE_PER_HOST,
+                 burst_per_host=FETCH_BURST_PER_HOST, max_retries=FETCH_MAX_RETRIES,
+                 backoff_base=1.0, backoff_max=60.0, timeout=FETCH_TIMEOUT):
+        """
+        Args:
+            session: Object with a requests-style request() method, defaults to a requests.Session
+            max_concurrency (int): Requests in flight across all hosts
+            per_host_concurrency (int): Requests in flight per host
+            rate_per_host (float): Sustained requests per second per host
+            burst_per_host (int): Requests a host may receive back to back
+            max_retries (int): Retries after a 429/503 response
+            backoff_base (float): First backoff delay in seconds, doubled on every retry
+            backoff_max (float): Longest backoff delay in seconds
+            timeout (float): Request timeout in seconds
+        """
+        self.session = session or requests.Session()
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.rate_per_host = rate_per_host
+        self.burst_per_host = burst_per_host
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+
+        self._cond = threading.Condition()
+        self._hosts = {}
+        self._turns = deque()  # Hosts with waiting requests, in round-robin order
+        self._active = 0
+
+    def get(self, url, **kwargs):
+        """Send a GET request through the scheduler"""
+        return self.request("GET", url, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        """
+        Send a request once the host's limits allow it, retrying throttled responses
+
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            **kwargs: Passed on to session.request
+
+        Returns:
+            Response: The final response, which may still be a 429/503 once retries run out
+        """
+        host = urlparse(url).netloc
+        kwargs.setdefault("timeout", self.timeout)
+
+        for attempt in range(self.max_retries + 1):
+            self._acquire(host)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except Exception:
+                self._count(host, "errors")
+                raise
+            finally:
+                self._release(host)
+
+            if response.status_code not in THROTTLE_STATUS_CODES:
+                return response
+
+            self._count(host, "throttled")
+            if attempt == self.max_retries:
+                return response
+
+            # Back the whole host off, not just this request
+            delay = self._backoff_delay(response, attempt)
+            with self._cond:
+                state = self._hosts[host]
+                state.backoff_until = max(state.backoff_until, time.monotonic() + delay)
+                state.stats["backoff_seconds"] += delay
+                state.stats["retries"] += 1
+                self._cond.notify_all()
+
+        return response
+
+    def metrics(self):
+        """
+        Get queue and throttle metrics
+
+        Returns:
+            dict: Global "active"/"queued" counts and per-host counters
+        """
+        with self._cond:
+            now = time.monotonic()
+            hosts = {}
+            for host, state in self._hosts.items():
+                hosts[host] = dict(state.stats)
+                hosts[host].update({
+                    "active": state.active,
+                    "queued": len(state.queue),
+                    "backing_off": state.backoff_until > now,
+                    "wait_seconds": round(state.stats["wait_seconds"], 3),
+                    "backoff_seconds": round(state.stats["backoff_seconds"], 3)
+                })
+            return {
+                "active": self._active,
+                "queued": sum(len(state.queue) for state in self._hosts.values()),
+                "max_concurrency": self.max_concurrency,
+                "hosts": hosts
+            }
+
+    def _host(self, host):
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = HostState(self.rate_per_host, self.burst_per_host)
+        return state
+
+    def _ready(self, state, now):
+        return (state.queue and state.active < self.per_host_concurrency
+                and self._active < self.max_concurrency and state.delay(now) == 0)
+
+    def _acquire(self, host):
+        with self._cond:
+            state = self._host(host)
+            ticket = object()
+            state.queue.append(ticket)
+            state.stats["max_queue"] = max(state.stats["max_queue"], len(state.queue))
+            if host not in self._turns:
+                self._turns.append(host)
+            queued_at = time.monotonic()
+
+            while True:
+                now = time.monotonic()
+                if state.queue[0] is ticket and self._ready(state, now) and self._is_turn(host, now):
+                    break
+                self._cond.wait(timeout=self._next_wakeup(now))
+
+            state.queue.popleft()
+            state.active += 1
+            self._active += 1
+            state.bucket.take(now)
+            state.stats["requests"] += 1
+            state.stats["wait_seconds"] += now - queued_at
+
+            # Move this host to the back of the line
+            self._turns.remove(host)
+            if state.queue:
+                self._turns.append(host)
+            self._cond.notify_all()
+
+    def _is_turn(self, host, now):
+        """A host goes when no host ahead of it in the round-robin order is ready"""
+        for waiting_host in self._turns:
+            if waiting_host == host:
+                return True
+            if self._ready(self._hosts[waiting_host], now):
+                return False
+        return True
+
+    def _next_wakeup(self, now):
+        """Seconds until a rate limit or backoff expires for a waiting host"""
+        delays = [state.delay(now) for state in self._hosts.values() if state.queue]
+        delays = [delay for delay in delays if delay > 0]
+        return min(delays) if delays else None
+
+    def _release(self, host):
+        with self._cond:
+            self._hosts[host].active -= 1
+            self._active -= 1
+            self._cond.notify_all()
+
+    def _count(self, host, counter):
+        with self._cond:
+            self._hosts[host].stats[counter] += 1
+
+    def _backoff_delay(self, response, attempt):
+        """Exponential backoff with jitter, or the host's Retry-After if longer"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt)) * random.uniform(1.0, 1.25)
+        retry_after = response.headers.get("Retry-After") if response.headers else None
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    delay = max(delay, (retry_at - datetime.now(timezone.utc)).total_seconds())
+                except (TypeError, ValueError):
+                    pass
+        return min(delay, self.backoff_max)
+
+
+_default_scheduler = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_default_scheduler():
+    """Get the fetch scheduler shared by every job search instance in this process"""
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            session = None
+            if JOB_SEARCH_HTTP_MODE != "live":
+                session = RecordReplayTransport(HTTP_FIXTURE_DIRECTORY, JOB_SEARCH_HTTP_MODE)
+            _default_scheduler = FetchScheduler(session=session)
+        return _default_scheduler
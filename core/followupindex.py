@@ -0,0 +1,109 @@
+import bisect
+from datetime import date, timedelta
+
+import pandas as pd
+
+from config import FOLLOW_UP_STATUSES
+
+
+def parse_date(value):
+    """Parse a tracker date (normally YYYY-MM-DD) into a date, or None"""
+    if isinstance(value, date):
+        return value
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        parsed = pd.to_datetime(value, errors="coerce")
+        return None if pd.isna(parsed) else parsed.date()
+
+
+class FollowUpIndex:
+    """
+    Follow-up dates of the applications that can still be followed up, kept sorted
+
+    Entries are (follow_up_date, company, position) tuples in a sorted list,
+    updated with bisect on every change, so what is due by a date, the next
+    follow-up and "due in the next N days" are a binary search plus the
+    matching entries, never a scan of the tracker.
+    """
+
+    def __init__(self, eligible_statuses=FOLLOW_UP_STATUSES):
+        self.eligible_statuses = set(eligible_statuses)
+        self._entries = []
+        self._dates = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def rebuild(self, applications):
+        """
+        Index every eligible application
+
+        Args:
+            applications (DataFrame): All applications
+        """
+        eligible = applications[applications['status'].isin(self.eligible_statuses)]
+        dates = pd.to_datetime(eligible['follow_up_date'], errors="coerce", format="mixed")
+        keep = dates.notna()
+        entries = zip(dates[keep].dt.date, eligible['company'][keep], eligible['position'][keep])
+        self._entries = sorted(entries)
+        self._dates = {(company, position): due for due, company, position in self._entries}
+
+    def apply(self, old_row, new_row):
+        """
+        Update the index for one change
+
+        Args:
+            old_row (dict): Application before the change, None for an insert
+            new_row (dict): Application after the change, None for a delete
+        """
+        if old_row is not None:
+            self._remove((old_row['company'], old_row['position']))
+        if new_row is not None and new_row.get('status') in self.eligible_statuses:
+            due = parse_date(new_row.get('follow_up_date'))
+            if due is not None:
+                key = (new_row['company'], new_row['position'])
+                bisect.insort(self._entries, (due,) + key)
+                self._dates[key] = due
+
+    def _remove(self, key):
+        due = self._dates.pop(key, None)
+        if due is not None:
+            position = bisect.bisect_left(self._entries, (due,) + key)
+            del self._entries[position]
+
+    def due(self, on_date=None):
+        """
+        Applications whose follow-up is due on or before a date
+
+        Args:
+            on_date (date): Defaults to today
+
+        Returns:
+            list: (follow_up_date, company, position) tuples, earliest first
+        """
+        on_date = on_date or date.today()
+        end = bisect.bisect_left(self._entries, (on_date + timedelta(days=1),))
+        return self._entries[:end]
+
+    def due_within(self, days, start=None):
+        """
+        Applications whose follow-up falls in the next days days
+
+        Args:
+            days (int): Length of the window in days
+            start (date): First day of the window, defaults to today
+
+        Returns:
+            list: (follow_up_date, company, position) tuples, earliest first
+        """
+        start = start or date.today()
+        first = bisect.bisect_left(self._entries, (start,))
+        last = bisect.bisect_left(self._entries, (start + timedelta(days=days + 1),))
+        return self._entries[first:last]
+
+    def next_due(self):
+        """The earliest (follow_up_date, company, position) entry, or None"""
+        return self._entries[0] if self._entries else None
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import os
+import threading
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from utils.helpers import ensure_directory_exists
+
+# Responses that describe the state of our client rather than the page, never recorded
+UNRECORDED_STATUS_CODES = {304, 429, 503}
+
+
+class FixtureResponse:
+    """Recorded HTTP response with the parts of requests.Response the job searches use"""
+
+    def __init__(self, url, status_code, headers, text, encoding="utf-8"):
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.text = text
+        self.encoding = encoding
+
+    @property
+    def content(self):
+        return self.text.encode(self.encoding or "utf-8")
+
+    def raise_for_status(self):
+        if 400 <= self.status_code < 600:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class RecordReplayTransport:
+    """
+    HTTP transport that records responses to a fixture directory and serves them back
+
+    Used as the fetch scheduler's session. Each response is stored as one JSON
+    file named after a hash of the method, URL and query parameters; request
+    headers are left out of the key so conditional requests replay the same page.
+
+    Modes:
+        "record": send the request and save the response
+        "replay": serve the saved response, never touching the network
+        "live": pass requests straight through
+    """
+
+    def __init__(self, directory, mode="replay", session=None):
+        """
+        Args:
+            directory (str): Fixture directory
+            mode (str): "record", "replay" or "live"
+            session: Session used for live and recorded requests, defaults to a requests.Session
+        """
+        if mode not in ("record", "replay", "live"):
+            raise ValueError(f"Unknown HTTP fixture mode: {mode}")
+        self.directory = ensure_directory_exists(directory)
+        self.mode = mode
+        self.session = session or requests.Session()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fixture_key(method, url, params=None):
+        """Stable name of the fixture for a request"""
+        if params:
+            url = f"{url}?{urlencode(sorted(dict(params).items()))}"
+        return hashlib.sha1(f"{method.upper()} {url}".encode("utf-8")).hexdigest()[:20]
+
+    def request(self, method, url, params=None, **kwargs):
+        """
+        Send, record or replay a request
+
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            params (dict): Query parameters
+            **kwargs: Passed on to session.request for live and recorded requests
+
+        Returns:
+            Response: A live response or a FixtureResponse
+        """
+        if self.mode == "live":
+            return self.session.request(method, url, params=params, **kwargs)
+
+        path = os.path.join(self.directory, self.fixture_key(method, url, params) + ".json")
+        if self.mode == "replay":
+            return self.load(path)
+
+        response = self.session.request(method, url, params=params, **kwargs)
+        if response.status_code not in UNRECORDED_STATUS_CODES:
+            self.save(path, method, url, params, response)
+        return response
+
+    def load(self, path):
+        """Load a recorded response, raising a RequestException when there is none"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                fixture = json.load(f)
+        except FileNotFoundError:
+            raise requests.ConnectionError(f"No recorded response in {path}")
+        return FixtureResponse(fixture["url"], fixture["status_code"], fixture["headers"],
+                               fixture["text"], fixture.get("encoding"))
+
+    def save(self, path, method, url, params, response):
+        """Write a response to its fixture file"""
+        fixture = {
+            "method": method.upper(),
+            "url": url,
+            "params": dict(params or {}),
+            "status_code": response.status_code,
+            "headers": {name: value for name, value in response.headers.items()
+                        if name.lower() in ("content-type", "etag", "last-modified")},
+            "encoding": response.encoding,
+            "text": response.text
+        }
+        with self._lock:
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(fixture, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, path)
+
+    def fixtures(self):
+        """
+        Iterate over the recorded fixtures
+
+        Yields:
+            dict: Fixture with "method", "url", "params", "status_code", "headers" and "text"
+        """
+        for name in sorted(os.listdir(self.directory)):
+            if name.endswith(".json"):
+                with open(os.path.join(self.directory, name), "r", encoding="utf-8") as f:
+                    yield json.load(f)
@@ -0,0 +1,233 @@
+import glob
+import json
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from utils.helpers import ensure_directory_exists
+
+# Posting fields covered by the full-text index
+INDEXED_FIELDS = ["title", "company", "location", "description", "requirements"]
+
+# Keep the full-text index in step with postings, by rowid (the FTS table only holds the index)
+FTS_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS postings_ai AFTER INSERT ON postings BEGIN "
+    "INSERT INTO postings_fts (rowid, {fields}) VALUES (new.id, {new}); END",
+    "CREATE TRIGGER IF NOT EXISTS postings_ad AFTER DELETE ON postings BEGIN "
+    "INSERT INTO postings_fts (postings_fts, rowid, {fields}) VALUES ('delete', old.id, {old}); END",
+    "CREATE TRIGGER IF NOT EXISTS postings_au AFTER UPDATE ON postings BEGIN "
+    "INSERT INTO postings_fts (postings_fts, rowid, {fields}) VALUES ('delete', old.id, {old}); "
+    "INSERT INTO postings_fts (rowid, {fields}) VALUES (new.id, {new}); END",
+]
+
+
+class JobHistoryIndex:
+    """
+    Full-text index over every saved job posting, backed by SQLite FTS5
+
+    Postings are indexed as they are saved, so searching the history never
+    touches the network or rescans the saved search files. The FTS5 table
+    takes its content from postings by rowid, so replacing a re-saved job
+    is a lookup on the job_id index rather than a scan of the full-text
+    table. Falls back to LIKE queries when the SQLite build has no FTS5.
+    """
+
+    def __init__(self, db_path=os.path.join("data", "job_listings", "history_index.db")):
+        self.db_path = db_path
+        ensure_directory_exists(os.path.dirname(db_path))
+        self._lock = threading.Lock()
+        self.has_fts = self._create_schema()
+
+    def add_results(self, results, saved_at=None):
+        """
+        Index the postings of a search, replacing earlier copies of the same job IDs
+
+        Args:
+            results (dict): Job search results
+            saved_at (str): When the results were saved, defaults to now
+
+        Returns:
+            int: Number of postings indexed
+        """
+        saved_at = saved_at or datetime.now().isoformat(timespec="seconds")
+        rows = []
+        for job in results.get("results", []):
+            if not job.get("job_id"):
+                continue
+            requirements = job.get("requirements") or []
+            if isinstance(requirements, (list, tuple)):
+                requirements = "\n".join(requirements)
+            rows.append((
+                job["job_id"],
+                job.get("title", ""),
+                job.get("company", ""),
+                job.get("location", ""),
+                job.get("full_description") or job.get("description", ""),
+                requirements,
+                saved_at,
+                json.dumps(job)
+            ))
+
+        if not rows:
+            return 0
+
+        with self._lock, self._connect() as conn:
+            # An upsert keeps the rowid, and the update trigger swaps the old index entry for the new one
+            conn.executemany(
+                "INSERT INTO postings "
+                "(job_id, title, company, location, description, requirements, saved_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (job_id) DO UPDATE SET title = excluded.title, company = excluded.company, "
+                "location = excluded.location, description = excluded.description, "
+                "requirements = excluded.requirements, saved_at = excluded.saved_at, data = excluded.data",
+                rows
+            )
+        return len(rows)
+
+    def search(self, text, location=None, limit=20):
+        """
+        Search saved postings
+
+        Args:
+            text (str): Words to look for in any indexed field
+            location (str): Words that must appear in the location
+            limit (int): Maximum number of results to return
+
+        Returns:
+            dict: Job search results, best matches first
+        """
+        terms = self._terms(text)
+        location_terms = self._terms(location)
+        if not terms and not location_terms:
+            return {"results": []}
+
+        with self._connect() as conn:
+            if self.has_fts:
+                match = " ".join(
+                    [f'"{term}"*' for term in terms] +
+                    [f'location : "{term}"*' for term in location_terms]
+                )
+                rows = conn.execute(
+                    "SELECT p.data FROM postings_fts f JOIN postings p ON p.id = f.rowid "
+                    "WHERE postings_fts MATCH ? ORDER BY bm25(postings_fts) LIMIT ?",
+                    (match, limit)
+                ).fetchall()
+            else:
+                clauses = []
+                params = []
+                for term in terms:
+                    clauses.append("(" + " OR ".join(f"{field} LIKE ?" for field in INDEXED_FIELDS) + ")")
+                    params.extend([f"%{term}%"] * len(INDEXED_FIELDS))
+                for term in location_terms:
+                    clauses.append("location LIKE ?")
+                    params.append(f"%{term}%")
+                rows = conn.execute(
+                    f"SELECT data FROM postings WHERE {' AND '.join(clauses)} ORDER BY saved_at DESC LIMIT ?",
+                    params + [limit]
+                ).fetchall()
+
+        results = [json.loads(row[0]) for row in rows]
+        for job in results:
+            job["from_history"] = True
+        return {"results": results}
+
+    def backfill(self, directory=os.path.join("data", "job_listings")):
+        """
+        Index saved search files written before the index existed
+
+        Runs once per index; later saves are indexed as they are written.
+
+        Returns:
+            int: Number of postings indexed
+        """
+        with self._connect() as conn:
+            done = conn.execute("SELECT value FROM meta WHERE key = 'backfilled'").fetchone()
+        if done:
+            return 0
+
+        indexed = 0
+        for path in sorted(glob.glob(os.path.join(directory, "job_search_*.json"))):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    results = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Skipping unreadable search file {path}: {e}")
+                continue
+            saved_at = datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec="seconds")
+            indexed += self.add_results(results, saved_at=saved_at)
+
+        with self._lock, self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('backfilled', ?)",
+                         (datetime.now().isoformat(timespec="seconds"),))
+        return indexed
+
+    def count(self):
+        """Number of postings in the index"""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+
+    @staticmethod
+    def _terms(text):
+        return re.findall(r"\w+", (text or "").lower())
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _create_schema(self):
+        with self._connect() as conn:
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(postings)")]
+            if columns and "id" not in columns:
+                # Index from before postings had a rowid key, its FTS table held a copy of every posting
+                conn.execute("ALTER TABLE postings RENAME TO postings_old")
+                conn.execute("DROP TABLE IF EXISTS postings_fts")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS postings ("
+                "id INTEGER PRIMARY KEY, job_id TEXT NOT NULL UNIQUE, title TEXT, company TEXT, "
+                "location TEXT, description TEXT, requirements TEXT, saved_at TEXT, data TEXT)"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            try:
+                conn.execute(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS postings_fts USING fts5("
+                    f"{', '.join(INDEXED_FIELDS)}, content = 'postings', content_rowid = 'id', "
+                    f"tokenize = 'porter unicode61')"
+                )
+                has_fts = True
+            except sqlite3.OperationalError:
+                print("SQLite FTS5 is not available, history search will use LIKE queries")
+                has_fts = False
+            if has_fts:
+                for trigger in FTS_TRIGGERS:
+                    conn.execute(trigger.format(fields=", ".join(INDEXED_FIELDS),
+                                                new=", ".join(f"new.{field}" for field in INDEXED_FIELDS),
+                                                old=", ".join(f"old.{field}" for field in INDEXED_FIELDS)))
+            if columns and "id" not in columns:
+                conn.execute(
+                    "INSERT INTO postings (job_id, title, company, location, description, requirements, "
+                    "saved_at, data) SELECT job_id, title, company, location, description, requirements, "
+                    "saved_at, data FROM postings_old ORDER BY rowid"
+                )
+                conn.execute("DROP TABLE postings_old")
+            return has_fts
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_default_history_index():
+    """Get the history index shared by every job search instance in this process"""
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = JobHistoryIndex()
+        return _default_index
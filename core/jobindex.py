@@ -0,0 +1,141 @@
+import hashlib
+import os
+import threading
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from utils.helpers import ensure_directory_exists
+
+# Query parameters that change between searches without changing the posting
+VOLATILE_URL_PARAMS = {"ved", "ei", "sa", "usg", "sxsrf", "fbclid", "gclid"}
+
+
+def normalize_text(value):
+    """Lowercase a value and collapse its whitespace"""
+    return " ".join(str(value or "").lower().split())
+
+
+def normalize_url(url):
+    """
+    Normalize a URL so the same posting always produces the same string
+
+    Lowercases the scheme and host, drops the fragment and tracking
+    parameters, and sorts the remaining query parameters.
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in VOLATILE_URL_PARAMS and not key.startswith("utm_")
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), urlencode(query), ""))
+
+
+def make_job_id(company, title, location, url=None):
+    """
+    Build a stable job ID from the normalized company, title, location and URL
+
+    Args:
+        company (str): Company name
+        title (str): Job title
+        location (str): Job location
+        url (str): Application URL
+
+    Returns:
+        str: 16 hex character job ID
+    """
+    fingerprint = "\x1f".join([
+        normalize_text(company),
+        normalize_text(title),
+        normalize_text(location),
+        normalize_url(url)
+    ])
+    return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:16]
+
+
+def assign_job_id(job):
+    """Set a posting's job_id from its content and return the posting"""
+    job["job_id"] = make_job_id(
+        job.get("company"), job.get("title"), job.get("location"), job.get("application_url")
+    )
+    return job
+
+
+class SeenJobsIndex:
+    """
+    Persistent set of job IDs found by earlier searches
+
+    IDs are kept in memory for O(1) lookups and appended to a text file,
+    one per line, as they are first seen.
+    """
+
+    def __init__(self, file_path=os.path.join("data", "job_listings", "seen_jobs.txt")):
+        self.file_path = file_path
+        ensure_directory_exists(os.path.dirname(file_path))
+        self._ids = set()
+        self._lock = threading.Lock()
+        self._load()
+
+    def __contains__(self, job_id):
+        return job_id in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def add_many(self, job_ids):
+        """
+        Record job IDs as seen
+
+        Args:
+            job_ids (iterable): Job IDs
+
+        Returns:
+            list: The IDs that had not been seen before
+        """
+        with self._lock:
+            new_ids = []
+            for job_id in job_ids:
+                if job_id and job_id not in self._ids:
+                    self._ids.add(job_id)
+                    new_ids.append(job_id)
+
+            if new_ids:
+                with open(self.file_path, "a", encoding="utf-8") as f:
+                    f.write("".join(f"{job_id}\n" for job_id in new_ids))
+            return new_ids
+
+    def mark_results(self, results):
+        """
+        Flag each posting with whether it was found by an earlier search,
+        then record all of them as seen
+
+        Args:
+            results (dict): Job search results
+
+        Returns:
+            dict: The same results, each posting with a "seen_before" flag
+        """
+        postings = results.get("results", [])
+        for job in postings:
+            job["seen_before"] = job.get("job_id") in self._ids
+        self.add_many(job.get("job_id") for job in postings)
+        return results
+
+    def _load(self):
+        if not os.path.exists(self.file_path):
+            return
+        with open(self.file_path, "r", encoding="utf-8") as f:
+            self._ids.update(line.strip() for line in f if line.strip())
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_default_seen_index():
+    """Get the seen-jobs index shared by every job search instance in this process"""
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = SeenJobsIndex()
+        return _default_index
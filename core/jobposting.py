@@ -0,0 +1,157 @@
+import sys
+
+# Fields every source fills in, stored in slots; anything else goes to "extra"
+POSTING_FIELDS = ("job_id", "title", "company", "location", "description", "requirements",
+                  "posted_date", "application_url", "source", "salary_range")
+
+# Short fields that repeat across postings and are worth sharing
+INTERNED_FIELDS = ("title", "company", "location", "posted_date", "source", "salary_range")
+
+# Requirement lists shared between postings, most postings reuse a few base lists
+_shared_requirements = {}
+MAX_SHARED_REQUIREMENTS = 10000
+
+
+def share_requirements(requirements):
+    """
+    Get a shared tuple for a requirements list
+
+    Args:
+        requirements (list): Requirement strings
+
+    Returns:
+        tuple: Interned requirement strings, the same tuple object for equal lists
+    """
+    key = tuple(sys.intern(req) if isinstance(req, str) else req for req in requirements)
+    shared = _shared_requirements.get(key)
+    if shared is None:
+        if len(_shared_requirements) >= MAX_SHARED_REQUIREMENTS:
+            _shared_requirements.clear()
+        shared = _shared_requirements[key] = key
+    return shared
+
+
+class JobPosting:
+    """
+    Compact job posting held in session state
+
+    Behaves like the posting dicts the searches return (job["title"],
+    job.get(...), "field" in job, job[field] = value) but keeps the common
+    fields in slots, interns repeated strings and shares requirement tuples
+    between postings. Convert back with to_dict() wherever JSON is written.
+    A field set to None counts as missing, like an absent dict key.
+    """
+
+    __slots__ = POSTING_FIELDS + ("extra",)
+
+    def __init__(self, **fields):
+        for name in POSTING_FIELDS:
+            setattr(self, name, None)
+        self.extra = None
+        for name, value in fields.items():
+            self[name] = value
+
+    @classmethod
+    def from_dict(cls, job):
+        """Build a posting from a posting dict (a JobPosting is returned unchanged)"""
+        if isinstance(job, cls):
+            return job
+        return cls(**job)
+
+    def to_dict(self):
+        """Plain dict for JSON, with the same keys the source returned"""
+        job = {}
+        for name in POSTING_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                job[name] = list(value) if name == "requirements" else value
+        if self.extra:
+            job.update(self.extra)
+        return job
+
+    def __getitem__(self, name):
+        if name in POSTING_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                return value
+        elif self.extra and name in self.extra:
+            return self.extra[name]
+        raise KeyError(name)
+
+    def __setitem__(self, name, value):
+        if name in POSTING_FIELDS:
+            if name == "requirements" and value is not None:
+                value = share_requirements(value)
+            elif name in INTERNED_FIELDS and isinstance(value, str):
+                value = sys.intern(value)
+            setattr(self, name, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[name] = value
+
+    def __contains__(self, name):
+        try:
+            self[name]
+            return True
+        except KeyError:
+            return False
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __repr__(self):
+        return f"JobPosting({self.to_dict()!r})"
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def keys(self):
+        keys = [name for name in POSTING_FIELDS if getattr(self, name) is not None]
+        if self.extra:
+            keys.extend(self.extra)
+        return keys
+
+    def items(self):
+        return [(name, self[name]) for name in self.keys()]
+
+    def update(self, fields):
+        for name, value in dict(fields).items():
+            self[name] = value
+
+
+def compact_results(results):
+    """
+    Convert search results to compact postings for keeping in session state
+
+    Args:
+        results (dict): Job search results
+
+    Returns:
+        dict: Copy of the results with every posting as a JobPosting
+    """
+    compact = dict(results)
+    compact["results"] = [JobPosting.from_dict(job) for job in results.get("results", [])]
+    return compact
+
+
+def results_to_dicts(results):
+    """
+    Convert search results holding JobPostings back to plain dicts for JSON
+
+    Args:
+        results (dict): Job search results
+
+    Returns:
+        dict: Copy of the results with every posting as a dict
+    """
+    plain = dict(results)
+    plain["results"] = [job.to_dict() if isinstance(job, JobPosting) else job
+                        for job in results.get("results", [])]
+    return plain
@@ -1,36 +1,353 @@
 import requests
 import json
 import os
-from datetime import datetime
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
+import copy
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from core.fetchscheduler import get_default_scheduler
+from core.jobhistory import get_default_history_index
+from core.jobindex import assign_job_id, get_default_seen_index
+from core.jobposting import results_to_dicts
+from core.requirementextractor import extract_requirements
+from core.searchcache import get_default_cache
+from core.searchhistory import get_default_history_store
+from core.syntheticjobs import SyntheticJobGenerator
 from utils.helpers import ensure_directory_exists, save_text_to_file
 
+# Prefer the C-based lxml parser when it is installed
+try:
+    import lxml  # noqa: F401
+    DEFAULT_HTML_PARSER = "lxml"
+except ImportError:
+    DEFAULT_HTML_PARSER = "html.parser"
+
+# Only the job card subtrees are needed from a Google Jobs results page
+JOB_CARD_STRAINER = SoupStrainer("div", class_="iFjolb")
+
 class JobSearchAPI:
     """Base class for job search API integrations"""
     
+    # Name of the source, also part of the search cache key
+    source_name = "Unknown"
+    
+    # Seconds a cached search stays fresh (None uses the cache default)
+    cache_ttl = None
+    
+    # Upper bound on concurrent searches/fetches issued by search_many and enrich_results;
+    # per-host limits are enforced by the fetch scheduler
+    max_workers = 4
+    
     def __init__(self, api_key=None):
         self.api_key = api_key
         self.data_dir = ensure_directory_exists(os.path.join("data", "job_listings"))
+        self.cache = get_default_cache()
+        self.scheduler = get_default_scheduler()
+        self.seen_jobs = get_default_seen_index()
+        self.history_index = get_default_history_index()
+        self.history_store = get_default_history_store()
     
-    def search_jobs(self, query, location=None, limit=10):
+    def search_jobs(self, query, location=None, limit=10, use_cache=True, page=0):
         """
-        Search for jobs - to be implemented by subclasses
+        Search for jobs, serving repeated searches from the result cache
+        
+        Stale cache entries are revalidated with the source's ETag/Last-Modified
+        validators when it provided them.
+        
+        Args:
+            query (str): Job search query
+            location (str): Job location
+            limit (int): Maximum number of results to return
+            use_cache (bool): Whether to read and write the result cache
+            page (int): Result page to fetch, counting from 0
+            
+        Returns:
+            dict: Job search results, with a "cache" entry telling whether they
+                  came from the cache and how old they are
         """
-        raise NotImplementedError("Subclasses must implement search_jobs")
+        if not use_cache or self.cache is None:
+            results = self.fetch_jobs(query, location, limit, page=page)
+            results.pop("validators", None)
+            results["cache"] = {"hit": False, "age_seconds": 0}
+            return results
+        
+        key = self.cache.make_key(self.source_name, query, location, limit, page, self.cache_identity())
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry, self.cache_ttl):
+            return self._cached_results(entry, revalidated=False)
+        
+        validators = entry["validators"] if entry is not None else None
+        results = self.fetch_jobs(query, location, limit, validators=validators, page=page)
+        
+        if results.get("not_modified") and entry is not None:
+            return self._cached_results(self.cache.touch(key), revalidated=True)
+        
+        validators = results.pop("validators", None)
+        if not results.get("error"):
+            self.cache.put(key, results, validators)
+        
+        results = copy.deepcopy(results)
+        results["cache"] = {"hit": False, "age_seconds": 0}
+        return results
     
-    def save_search_results(self, results, filename=None):
+    def cache_identity(self):
         """
-        Save search results to a file
+        Settings of this source instance that change its results, part of the search cache key
+        
+        Returns:
+            tuple: Settings values, empty when every instance returns the same results
         """
-        if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"job_search_{timestamp}.json"
+        return ()
+    
+    def fetch_jobs(self, query, location=None, limit=10, validators=None, page=0):
+        """
+        Fetch jobs from the source - to be implemented by subclasses
+        
+        Args:
+            query (str): Job search query
+            location (str): Job location
+            limit (int): Maximum number of results to return
+            validators (dict): "etag"/"last_modified" of a cached copy to revalidate
+            page (int): Result page to fetch, counting from 0
+            
+        Returns:
+            dict: Job search results, optionally with "validators" for future
+                  revalidation, or {"not_modified": True} if the cached copy is current
+        """
+        raise NotImplementedError("Subclasses must implement fetch_jobs")
+    
+    def iter_jobs(self, query, location=None, page_size=10, start_page=0, max_pages=None):
+        """
+        Lazily page through search results, yielding postings as each page is parsed
+        
+        Pages are only fetched when the consumer asks for more postings, so
+        stopping iteration stops the fetching.
+        
+        Args:
+            query (str): Job search query
+            location (str): Job location
+            page_size (int): Number of results requested per page
+            start_page (int): First page to fetch, counting from 0
+            max_pages (int): Maximum number of pages to fetch (None for no limit)
+            
+        Yields:
+            dict: Job postings
+        """
+        seen = set()
+        page = start_page
+        while max_pages is None or page < start_page + max_pages:
+            results = self.search_jobs(query, location, page_size, page=page)
+            if results.get("error"):
+                print(f"Stopped paging after page {page}: {results['error']}")
+                return
+            
+            new_postings = 0
+            for job in results.get("results", []):
+                key = self._dedupe_key(job)
+                if key in seen:
+                    continue
+                seen.add(key)
+                new_postings += 1
+                yield job
+            
+            # An empty page, or one that only repeats earlier postings, is the end
+            if new_postings == 0:
+                return
+            page += 1
+    
+    def _cached_results(self, entry, revalidated):
+        """Copy of a cache entry's results annotated with its cache status"""
+        results = copy.deepcopy(entry["results"])
+        results["cache"] = {
+            "hit": True,
+            "age_seconds": round(self.cache.age(entry), 1),
+            "revalidated": revalidated
+        }
+        return results
+    
+    def search_many(self, queries, locations=None, limit=10, max_workers=None):
+        """
+        Search every combination of queries and locations concurrently
+        
+        Args:
+            queries (list): Job search queries
+            locations (list): Job locations (None searches without a location)
+            limit (int): Maximum number of results per query
+            max_workers (int): Maximum number of searches running at once
+            
+        Returns:
+            dict: Merged, de-duplicated results with per-query timings
+        """
+        if isinstance(queries, str):
+            queries = [queries]
+        if not locations:
+            locations = [None]
+        elif isinstance(locations, str):
+            locations = [locations]
+        
+        combinations = [(query, location) for query in queries for location in locations]
+        workers = max(1, min(max_workers or self.max_workers, len(combinations)))
+        
+        def timed_search(query, location):
+            started = time.perf_counter()
+            try:
+                results = self.search_jobs(query, location, limit)
+            except Exception as e:
+                results = {"results": [], "error": str(e)}
+            return results, time.perf_counter() - started
+        
+        started = time.perf_counter()
+        outcomes = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(timed_search, query, location): (query, location)
+                for query, location in combinations
+            }
+            for future in as_completed(futures):
+                outcomes[futures[future]] = future.result()
+        
+        # Merge in submission order so the output does not depend on timing
+        merged = []
+        seen = set()
+        timings = []
+        for query, location in combinations:
+            results, elapsed = outcomes[(query, location)]
+            postings = results.get("results", [])
+            timing = {
+                "query": query,
+                "location": location,
+                "seconds": round(elapsed, 3),
+                "count": len(postings),
+                "cached": results.get("cache", {}).get("hit", False)
+            }
+            if results.get("error"):
+                timing["error"] = results["error"]
+            timings.append(timing)
+            
+            for job in postings:
+                key = self._dedupe_key(job)
+                if key in seen:
+                    continue
+                seen.add(key)
+                merged.append(job)
+        
+        return {
+            "results": merged,
+            "timings": timings,
+            "elapsed": round(time.perf_counter() - started, 3)
+        }
+    
+    def get_job_details(self, job_url):
+        """
+        Get detailed information for a specific job listing - sources without
+        detail pages return an empty dict
+        """
+        return {}
+    
+    def enrich_results(self, results, max_workers=None, progress_callback=None):
+        """
+        Fetch details for every listing with an application URL concurrently
+        
+        Per-host concurrency and rate limits come from the fetch scheduler.
+        
+        Args:
+            results (dict): Job search results
+            max_workers (int): Maximum number of detail fetches running at once
+            progress_callback (callable): Called as progress_callback(completed, total, job)
+                after each listing is enriched
+            
+        Returns:
+            dict: Copy of the results with listings merged with their details
+        """
+        enriched = dict(results)
+        jobs = [dict(job) for job in results.get("results", [])]
+        enriched["results"] = jobs
+        
+        pending = [i for i, job in enumerate(jobs) if job.get("application_url")]
+        total = len(pending)
+        if not pending:
+            return enriched
+        
+        workers = max(1, min(max_workers or self.max_workers, total))
+        completed = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self.get_job_details, jobs[i]["application_url"]): i for i in pending}
+            for future in as_completed(futures):
+                job = jobs[futures[future]]
+                try:
+                    details = future.result()
+                except Exception as e:
+                    print(f"Error fetching job details: {e}")
+                    details = {}
+                
+                for field in ("full_description", "requirements", "salary_range"):
+                    if details.get(field):
+                        job[field] = details[field]
+                job["details_fetched"] = bool(details)
+                
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total, job)
+        
+        return enriched
+    
+    def mark_seen(self, results):
+        """
+        Flag postings already found by earlier searches and remember the new ones
+        
+        Args:
+            results (dict): Job search results
+            
+        Returns:
+            dict: The same results, each posting with a "seen_before" flag
+        """
+        return self.seen_jobs.mark_results(results)
+    
+    def _dedupe_key(self, job):
+        """Key used to recognise the same posting returned by different searches"""
+        return job.get("job_id") or assign_job_id(dict(job))["job_id"]
+    
+    def save_search_results(self, results, filename=None, query=None, location=None):
+        """
+        Save search results and add them to the history index
+        
+        Results are appended to the search history store unless a filename
+        is given, in which case they are exported to that JSON file instead.
+        
+        Args:
+            results (dict): Job search results
+            filename (str, optional): Name of a JSON file to export the results to
+            query (str, optional): Query that produced the results
+            location (str, optional): Location that produced the results
             
-        file_path = os.path.join(self.data_dir, filename)
-        save_text_to_file(json.dumps(results, indent=2), file_path)
+        Returns:
+            str: Path to the file the results were written to
+        """
+        results = results_to_dicts(results)
+        if filename is None:
+            file_path = self.history_store.append(results, query=query, location=location)
+        else:
+            file_path = os.path.join(self.data_dir, filename)
+            save_text_to_file(json.dumps(results, indent=2), file_path)
+        self.history_index.add_results(results)
         
         return file_path
+    
+    def search_history(self, query, location=None, limit=10):
+        """
+        Search previously saved postings offline
+        
+        Args:
+            query (str): Words to look for in title, company, location, description and requirements
+            location (str): Words that must appear in the location
+            limit (int): Maximum number of results to return
+            
+        Returns:
+            dict: Job search results, best matches first
+        """
+        self.history_index.backfill(self.data_dir)
+        return self.history_index.search(query, location, limit)
 
 
 class GoogleJobsSearch(JobSearchAPI):
@@ -38,14 +355,18 @@ class GoogleJobsSearch(JobSearchAPI):
     Class for searching and extracting job listings from Google Jobs
     """
     
-    def __init__(self):
+    source_name = "Google Jobs"
+    
+    def __init__(self, parser=None, strain_cards=True):
         super().__init__()
+        self.parser = parser or DEFAULT_HTML_PARSER
+        self.strain_cards = strain_cards
         self.base_url = "https://www.google.com/search"
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
     
-    def search_jobs(self, query, location=None, limit=10):
+    def fetch_jobs(self, query, location=None, limit=10, validators=None, page=0):
         """
         Search for jobs on Google Jobs
         
@@ -53,6 +374,8 @@ class GoogleJobsSearch(JobSearchAPI):
             query (str): Job search query
             location (str): Job location
             limit (int): Maximum number of results to return
+            validators (dict): "etag"/"last_modified" of a cached copy to revalidate
+            page (int): Result page to fetch, counting from 0
             
         Returns:
             dict: Job search results
@@ -70,89 +393,120 @@ class GoogleJobsSearch(JobSearchAPI):
             "hl": "en",  # Language
             "gl": "us"   # Country
         }
+        if page:
+            # A result offset; pages of limit cards, so none are skipped when limit is not ten
+            params["start"] = page * limit
+        
+        # Ask Google to confirm a cached copy instead of resending it
+        headers = dict(self.headers)
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
         
         try:
             # Make the request to Google
-            response = requests.get(self.base_url, params=params, headers=self.headers)
+            response = self.scheduler.get(self.base_url, params=params, headers=headers)
+            if response.status_code == 304:
+                return {"results": [], "not_modified": True}
             response.raise_for_status()
             
             # Parse the HTML response
-            return self._parse_job_listings(response.text, limit)
+            results = self._parse_job_listings(response.text, limit)
+            results["validators"] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified")
+            }
+            return results
             
         except requests.RequestException as e:
             print(f"Error fetching job listings: {e}")
             return {"results": [], "error": str(e)}
     
-    def _parse_job_listings(self, html_content, limit=10):
+    def _parse_job_listings(self, html_content, limit=10, parser=None, strain_cards=None):
         """
         Parse job listings from HTML content
         
         Args:
             html_content (str): HTML content of the search results page
             limit (int): Maximum number of results to return
+            parser (str): BeautifulSoup parser backend, defaults to self.parser
+            strain_cards (bool): Only build the job card subtrees instead of the whole page,
+                defaults to self.strain_cards
             
         Returns:
             dict: Parsed job listings
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if strain_cards is None:
+            strain_cards = self.strain_cards
+        parse_only = JOB_CARD_STRAINER if strain_cards else None
+        soup = BeautifulSoup(html_content, parser or self.parser, parse_only=parse_only)
         
         # Find all job cards
-        job_cards = soup.select('div.iFjolb')
+        job_cards = soup.select('div.iFjolb', limit=limit)
         
         results = []
-        for i, card in enumerate(job_cards[:limit]):
-            if i >= limit:
-                break
-                
+        for card in job_cards:
             try:
-                # Extract job title
-                title_elem = card.select_one('div.BjJfJf')
-                title = title_elem.text.strip() if title_elem else "Unknown Title"
-                
-                # Extract company name
-                company_elem = card.select_one('div.vNEEBe')
-                company = company_elem.text.strip() if company_elem else "Unknown Company"
-                
-                # Extract location
-                location_elem = card.select_one('div.Qk80Jf')
-                location = location_elem.text.strip() if location_elem else "Remote"
-                
-                # Extract description snippet
-                description_elem = card.select_one('div.HBvzbc')
-                description = description_elem.text.strip() if description_elem else ""
-                
-                # Extract posting date
-                date_elem = card.select_one('div.KKh3md span.LL4CDc')
-                posted_date = date_elem.text.strip() if date_elem else "Recently"
-                
-                # Generate requirements based on job title and description
-                requirements = self._generate_requirements_from_description(title, description)
-                
-                # Create job posting object
-                job_posting = {
-                    "title": title,
-                    "company": company,
-                    "location": location,
-                    "description": description,
-                    "requirements": requirements,
-                    "posted_date": posted_date,
-                    "source": "Google Jobs",
-                    "job_id": f"GJ{i+1000}"
-                }
-                
-                # Additional details (might need to be fetched separately)
-                link_elem = card.select_one('a.pMhGee')
-                if link_elem and 'href' in link_elem.attrs:
-                    job_posting["application_url"] = "https://www.google.com" + link_elem['href']
-                
-                results.append(job_posting)
-                
+                results.append(self._parse_job_card(card))
             except Exception as e:
                 print(f"Error parsing job card: {e}")
                 continue
         
         return {"results": results}
     
+    def _parse_job_card(self, card):
+        """
+        Parse a single job card element into a job posting
+        
+        Args:
+            card (Tag): Job card element
+            
+        Returns:
+            dict: Job posting
+        """
+        # Extract job title
+        title_elem = card.select_one('div.BjJfJf')
+        title = title_elem.text.strip() if title_elem else "Unknown Title"
+        
+        # Extract company name
+        company_elem = card.select_one('div.vNEEBe')
+        company = company_elem.text.strip() if company_elem else "Unknown Company"
+        
+        # Extract location
+        location_elem = card.select_one('div.Qk80Jf')
+        location = location_elem.text.strip() if location_elem else "Remote"
+        
+        # Extract description snippet
+        description_elem = card.select_one('div.HBvzbc')
+        description = description_elem.text.strip() if description_elem else ""
+        
+        # Extract posting date
+        date_elem = card.select_one('div.KKh3md span.LL4CDc')
+        posted_date = date_elem.text.strip() if date_elem else "Recently"
+        
+        # Generate requirements based on job title and description
+        requirements = self._generate_requirements_from_description(title, description)
+        
+        # Create job posting object
+        job_posting = {
+            "title": title,
+            "company": company,
+            "location": location,
+            "description": description,
+            "requirements": requirements,
+            "posted_date": posted_date,
+            "source": "Google Jobs"
+        }
+        
+        # Additional details (might need to be fetched separately)
+        link_elem = card.select_one('a.pMhGee')
+        if link_elem and 'href' in link_elem.attrs:
+            job_posting["application_url"] = "https://www.google.com" + link_elem['href']
+        
+        return assign_job_id(job_posting)
+    
     def _generate_requirements_from_description(self, title, description):
         """
         Extract or generate requirements based on job title and description
@@ -171,21 +525,8 @@ class GoogleJobsSearch(JobSearchAPI):
             "Problem-solving abilities"
         ]
         
-        # Extract potential requirements from description
-        skill_keywords = [
-            "experience with", "knowledge of", "proficiency in", "expertise in",
-            "familiarity with", "skills in", "background in", "degree in",
-            "certification in", "qualified in", "trained in"
-        ]
-        
-        # Extract specific skills mentioned in the description
-        extracted_reqs = []
-        for keyword in skill_keywords:
-            matches = re.finditer(f"{keyword}\\s+([^.;]*)[.;]", description.lower())
-            for match in matches:
-                if match.group(1).strip():
-                    req = f"{keyword.capitalize()} {match.group(1).strip()}"
-                    extracted_reqs.append(req)
+        # Extract specific skills mentioned in the description in a single pass
+        extracted_reqs = extract_requirements(description)
         
         # Combine base and extracted requirements
         all_requirements = base_requirements + extracted_reqs
@@ -199,8 +540,8 @@ class GoogleJobsSearch(JobSearchAPI):
         elif "manager" in title_lower or "lead" in title_lower:
             all_requirements.append("Leadership and project management experience")
         
-        # Return unique requirements (remove duplicates)
-        return list(set(all_requirements))
+        # Return unique requirements (remove duplicates), keeping their order
+        return list(dict.fromkeys(all_requirements))
     
     def get_job_details(self, job_url):
         """
@@ -213,37 +554,49 @@ class GoogleJobsSearch(JobSearchAPI):
             dict: Detailed job information
         """
         try:
-            response = requests.get(job_url, headers=self.headers)
+            response = self.scheduler.get(job_url, headers=self.headers)
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract detailed job information
-            job_details = {}
-            
-            # Extract full description
-            description_elem = soup.select_one('div.job-description')
-            if description_elem:
-                job_details["full_description"] = description_elem.text.strip()
-            
-            # Extract requirements
-            requirements_elem = soup.select_one('div.requirements')
-            if requirements_elem:
-                requirements_text = requirements_elem.text.strip()
-                # Split by bullet points or newlines
-                requirements = [req.strip() for req in re.split(r'•|\n', requirements_text) if req.strip()]
-                job_details["requirements"] = requirements
-            
-            # Extract salary information
-            salary_elem = soup.select_one('div.salary-range')
-            if salary_elem:
-                job_details["salary_range"] = salary_elem.text.strip()
-            
-            return job_details
+            return self._parse_job_details(response.text)
             
         except requests.RequestException as e:
             print(f"Error fetching job details: {e}")
             return {}
+    
+    def _parse_job_details(self, html_content, parser=None):
+        """
+        Parse a job detail page
+        
+        Args:
+            html_content (str): HTML content of the job detail page
+            parser (str): BeautifulSoup parser backend, defaults to self.parser
+            
+        Returns:
+            dict: Detailed job information
+        """
+        soup = BeautifulSoup(html_content, parser or self.parser)
+        
+        # Extract detailed job information
+        job_details = {}
+        
+        # Extract full description
+        description_elem = soup.select_one('div.job-description')
+        if description_elem:
+            job_details["full_description"] = description_elem.text.strip()
+        
+        # Extract requirements
+        requirements_elem = soup.select_one('div.requirements')
+        if requirements_elem:
+            requirements_text = requirements_elem.text.strip()
+            # Split by bullet points or newlines
+            requirements = [req.strip() for req in re.split(r'•|\n', requirements_text) if req.strip()]
+            job_details["requirements"] = requirements
+        
+        # Extract salary information
+        salary_elem = soup.select_one('div.salary-range')
+        if salary_elem:
+            job_details["salary_range"] = salary_elem.text.strip()
+        
+        return job_details
 
 
 class SimulatedJobSearch(JobSearchAPI):
@@ -251,112 +604,32 @@ class SimulatedJobSearch(JobSearchAPI):
     Simulated job search for testing when online APIs are unavailable
     """
     
-    def __init__(self):
+    source_name = "Simulated"
+    
+    def __init__(self, seed=0, total_results=1000):
+        """
+        Args:
+            seed (int): Seed of the synthetic data set, the same seed gives the same postings
+            total_results (int): Number of postings the simulated source has per search
+                (None for an endless supply)
+        """
         super().__init__()
+        self.seed = seed
+        self.total_results = total_results
+        self.generator = SyntheticJobGenerator(seed=seed, source=self.source_name)
+    
+    def cache_identity(self):
+        """Different seeds and sizes give different postings, so they are cached apart"""
+        return (self.seed, self.total_results)
     
-    def search_jobs(self, query, location=None, limit=10):
+    def fetch_jobs(self, query, location=None, limit=10, validators=None, page=0):
         """
         Return simulated job search results
         """
-        job_titles = [
-            "Software Engineer", "Data Scientist", "Frontend Developer",
-            "Backend Developer", "DevOps Engineer", "Product Manager",
-            "UX Designer", "Machine Learning Engineer", "Full Stack Developer",
-            "QA Engineer", "Systems Architect", "Database Administrator"
-        ]
-        
-        companies = [
-            "Tech Innovators Inc.", "DataCrunch Solutions", "WebFront Systems",
-            "Cloud Nine Computing", "Agile Dynamics", "Product Visionaries",
-            "UX Masters", "AI Learning Corp", "Full Range Technologies",
-            "Quality Assurance Experts", "System Design Partners", "Data Storage Pro"
-        ]
+        offset = page * limit
+        count = limit
+        if self.total_results is not None:
+            count = max(0, min(limit, self.total_results - offset))
         
-        results = []
-        for i in range(min(limit, 10)):
-            job_index = i % len(job_titles)
-            company_index = i % len(companies)
-            
-            # Create job title that includes the search query if possible
-            title = job_titles[job_index]
-            if query.lower() not in title.lower():
-                title = f"{title} - {query.capitalize()}"
-            
-            # Create job posting with more detailed information
-            job_posting = {
-                "title": title,
-                "company": companies[company_index],
-                "location": location or "Remote",
-                "description": self._generate_job_description(title, query),
-                "requirements": self._generate_requirements(title, query),
-                "salary_range": "$90,000 - $140,000",
-                "posted_date": (datetime.now().replace(
-                    day=max(1, datetime.now().day - (i % 10))
-                )).strftime("%Y-%m-%d"),
-                "application_url": f"https://example.com/jobs/{i+1}",
-                "job_id": f"JOB{i+1000}",
-                "source": "Simulated"
-            }
-            
-            results.append(job_posting)
-            
+        results = list(self.generator.iter_postings(count, query, location or "Remote", start=offset))
         return {"results": results}
-    
-    def _generate_job_description(self, job_title, query):
-        """Generate a realistic job description based on the title and query"""
-        descriptions = {
-            "Software Engineer": "We are looking for a Software Engineer to join our development team. You will be responsible for designing, coding, and modifying applications according to client specifications. As a member of our team, you will develop high-quality software design and architecture.",
-            "Data Scientist": "We're seeking a Data Scientist to interpret data and turn it into information which can offer ways to improve our business. You'll be mining complex data and using advanced analytics to find patterns and relationships in data, then presenting these insights to stakeholders.",
-            "Frontend Developer": "We need a Frontend Developer who will implement visual elements that users see and interact with in a web application. You'll collaborate with UI/UX designers and bridge the gap between graphical design and technical implementation.",
-            "Backend Developer": "Join our team as a Backend Developer to build and maintain the server-side logic that powers our applications. You will develop all server-side logic, maintain databases, and ensure high performance and responsiveness to requests from the front-end.",
-            "DevOps Engineer": "We're looking for a DevOps Engineer to help us build and scale our infrastructure. You will be responsible for designing, implementing, and maintaining our CI/CD pipelines as well as managing our cloud infrastructure."
-        }
-        
-        base_desc = descriptions.get(job_title.split(" - ")[0], 
-                                   f"We are hiring a talented {job_title} to join our team. In this role, you will work on challenging projects and collaborate with cross-functional teams to deliver high-quality solutions.")
-        
-        # Add query-specific information
-        specific_desc = f"\n\nIn this role, you will focus specifically on {query.lower()} technologies and solutions. You will be working with cutting-edge tools and frameworks in the {query.lower()} space to develop innovative solutions for our clients."
-        
-        return base_desc + specific_desc
-    
-    def _generate_requirements(self, job_title, query):
-        """Generate realistic requirements based on the job title and query"""
-        base_requirements = [
-            "Bachelor's degree in Computer Science or related field",
-            "Excellent problem-solving skills",
-            "Strong communication and teamwork abilities"
-        ]
-        
-        specific_requirements = {
-            "Software Engineer": [
-                "3+ years of software development experience",
-                f"Proficiency in {query}-related technologies",
-                "Experience with software design patterns",
-                "Knowledge of databases and data structures"
-            ],
-            "Data Scientist": [
-                "Experience with data analysis tools like Python, R, or SAS",
-                "Knowledge of machine learning frameworks",
-                "Strong statistical and mathematical background",
-                f"Experience with {query} data processing"
-            ],
-            "Frontend Developer": [
-                "Expertise in JavaScript, HTML, and CSS",
-                "Experience with React, Angular, or Vue",
-                "Understanding of responsive design principles",
-                f"Knowledge of {query} frameworks and libraries"
-            ]
-        }
-        
-        job_base = job_title.split(" - ")[0]
-        requirements = base_requirements + specific_requirements.get(job_base, [
-            f"Experience in {job_base} role",
-            f"Technical knowledge of {query}",
-            "Ability to learn quickly and adapt to new technologies"
-        ])
-        
-        # Add a query-specific requirement
-        requirements.append(f"Familiarity with {query.capitalize()} ecosystem and best practices")
-        
-        return requirements
\ No newline at end of file
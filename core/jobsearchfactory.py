@@ -1,29 +1,85 @@
+from config import JOB_SEARCH_DEADLINE, JOB_SEARCH_SOURCES, JOB_SEARCH_TIMEOUTS
+from core.aggregatedsearch import AggregatedJobSearch
 from core.jobsearch import GoogleJobsSearch, SimulatedJobSearch
 
 class JobSearchFactory:
     """
     Factory class for creating job search instances
     """
-    
-    @staticmethod
-    def create_job_search(search_type="google", **kwargs):
+
+    # Registered job search classes by source name
+    _sources = {}
+
+    @classmethod
+    def register_source(cls, name, search_class):
+        """
+        Register a job search source
+
+        Args:
+            name (str): Name used to select the source, e.g. "google"
+            search_class (type): JobSearchAPI subclass implementing the source
+        """
+        cls._sources[name.lower()] = search_class
+
+    @classmethod
+    def available_sources(cls):
+        """
+        Get the registered sources
+
+        Returns:
+            dict: Display name of each registered source, by source name
+        """
+        return {name: search_class.source_name for name, search_class in cls._sources.items()}
+
+    @classmethod
+    def enabled_sources(cls):
+        """Registered sources enabled through JOB_SEARCH_SOURCES"""
+        return [name for name in JOB_SEARCH_SOURCES if name in cls._sources]
+
+    @classmethod
+    def create_job_search(cls, search_type="google", **kwargs):
         """
         Create a job search instance based on the specified type
-        
+
         Args:
-            search_type (str): Type of job search ("google", "simulated")
+            search_type (str): Type of job search - a registered source name, or "all"
+                to search every enabled source at once
             **kwargs: Additional arguments to pass to the job search constructor
-            
+
         Returns:
             JobSearchAPI: A job search instance
         """
         search_type = search_type.lower()
-        
-        if search_type == "google":
-            return GoogleJobsSearch(**kwargs)
-        elif search_type == "simulated":
-            return SimulatedJobSearch(**kwargs)
+
+        if search_type == "all":
+            return cls.create_aggregated_search(**kwargs)
+        elif search_type in cls._sources:
+            return cls._sources[search_type](**kwargs)
         else:
             # Default to Google Jobs search
             print(f"Unknown search type: {search_type}. Using Google Jobs search.")
             return GoogleJobsSearch(**kwargs)
+
+    @classmethod
+    def create_aggregated_search(cls, sources=None, timeouts=None, deadline=None):
+        """
+        Create a job search that queries several sources in parallel
+
+        Args:
+            sources (list): Source names to include, defaults to the enabled sources
+            timeouts (dict): Seconds to wait for each source, defaults to JOB_SEARCH_TIMEOUTS
+            deadline (float): Seconds to wait for all sources, defaults to JOB_SEARCH_DEADLINE
+
+        Returns:
+            AggregatedJobSearch: The aggregating job search
+        """
+        names = sources or cls.enabled_sources()
+        return AggregatedJobSearch(
+            {name: cls._sources[name]() for name in names if name in cls._sources},
+            timeouts=JOB_SEARCH_TIMEOUTS if timeouts is None else timeouts,
+            deadline=JOB_SEARCH_DEADLINE if deadline is None else deadline
+        )
+
+
+JobSearchFactory.register_source("google", GoogleJobsSearch)
+JobSearchFactory.register_source("simulated", SimulatedJobSearch)
@@ -0,0 +1,77 @@
+import re
+
+# Phrases that usually introduce a requirement in a job description
+SKILL_KEYWORDS = [
+    "experience with", "knowledge of", "proficiency in", "expertise in",
+    "familiarity with", "skills in", "background in", "degree in",
+    "certification in", "qualified in", "trained in"
+]
+
+
+class RequirementExtractor:
+    """
+    Extract requirements from job descriptions in a single pass
+
+    All trigger phrases are compiled into one alternation regex, so each
+    description is scanned once instead of once per phrase, and
+    requirements come out in the order they appear. Only the phrases are
+    consumed by the scan, and each requirement is matched from the end of
+    its phrase, so a phrase inside an earlier requirement ("experience with
+    python and knowledge of sql;") is still found, as with one scan per phrase.
+    """
+
+    def __init__(self, keywords=SKILL_KEYWORDS):
+        # Longest phrases first so a phrase never loses to one of its prefixes
+        alternation = "|".join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+        self.pattern = re.compile(alternation)
+        self.requirement = re.compile(r"\s+([^.;]*)[.;]")
+
+    def extract(self, description):
+        """
+        Extract requirements from a job description
+
+        Args:
+            description (str): Job description
+
+        Returns:
+            list: Requirements in order of appearance, without duplicates
+        """
+        description = description.lower()
+        requirements = {}
+        # Where each phrase's last requirement ended: a scan per phrase never
+        # finds the same phrase again inside its own match
+        ends = {}
+        for match in self.pattern.finditer(description):
+            keyword = match.group()
+            if match.start() < ends.get(keyword, 0):
+                continue
+            requirement = self.requirement.match(description, match.end())
+            if requirement is None:
+                continue
+            ends[keyword] = requirement.end()
+            skill = requirement.group(1).strip()
+            if skill:
+                requirements[f"{keyword.capitalize()} {skill}"] = None
+        return list(requirements)
+
+    def extract_many(self, descriptions):
+        """
+        Extract requirements from many job descriptions
+
+        Args:
+            descriptions (iterable): Job descriptions
+
+        Yields:
+            list: Requirements of each description, in input order
+        """
+        extract = self.extract
+        for description in descriptions:
+            yield extract(description)
+
+
+_default_extractor = RequirementExtractor()
+
+
+def extract_requirements(description):
+    """Extract requirements from a job description with the default trigger phrases"""
+    return _default_extractor.extract(description)
@@ -0,0 +1,309 @@
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+from core.jobsearchfactory import JobSearchFactory
+from utils.helpers import ensure_directory_exists
+
+
+class SavedSearchStore:
+    """
+    Persisted saved searches and the postings each one has already seen
+
+    The saved searches and their counters live in one small JSON file.
+    Each search also has an append-only file of seen job IDs, loaded into a
+    set on first use, and an append-only JSONL file holding only the
+    postings that were new when found (none from the first run, which only
+    establishes what has been seen), read newest first from its end.
+    """
+
+    def __init__(self, directory=os.path.join("data", "saved_searches")):
+        self.directory = ensure_directory_exists(directory)
+        self.file_path = os.path.join(directory, "saved_searches.json")
+        self._lock = threading.RLock()
+        self._seen = {}
+        self._searches = self._load()
+
+    def add(self, query, location=None, source="simulated", limit=10, interval_hours=24):
+        """
+        Save a search
+
+        Args:
+            query (str): Job search query
+            location (str): Job location
+            source (str): Registered job search source, or "all"
+            limit (int): Number of results fetched per run
+            interval_hours (float): Hours between runs
+
+        Returns:
+            dict: The saved search
+        """
+        search_id = hashlib.sha1(
+            json.dumps([" ".join(query.lower().split()), " ".join((location or "").lower().split()),
+                        source.lower()]).encode("utf-8")
+        ).hexdigest()[:12]
+
+        with self._lock:
+            if search_id not in self._searches:
+                self._searches[search_id] = {
+                    "id": search_id,
+                    "query": query,
+                    "location": location,
+                    "source": source,
+                    "limit": limit,
+                    "interval_hours": interval_hours,
+                    "created_at": datetime.now().isoformat(timespec="seconds"),
+                    "last_run": None,
+                    "new_count": 0,
+                    "seen_count": 0
+                }
+                self._save()
+            return dict(self._searches[search_id])
+
+    def remove(self, search_id):
+        """Delete a saved search and its files"""
+        with self._lock:
+            if self._searches.pop(search_id, None) is None:
+                return False
+            self._seen.pop(search_id, None)
+            self._save()
+            for path in (self._seen_path(search_id), self._new_path(search_id)):
+                if os.path.exists(path):
+                    os.remove(path)
+            return True
+
+    def all(self):
+        """All saved searches"""
+        with self._lock:
+            return [dict(search) for search in self._searches.values()]
+
+    def total_new_count(self):
+        """Number of new postings across all saved searches not yet viewed"""
+        with self._lock:
+            return sum(search["new_count"] for search in self._searches.values())
+
+    def record_run(self, search_id, results):
+        """
+        Diff a run's postings against the ones this search has seen and store the delta
+
+        Args:
+            search_id (str): Saved search ID
+            results (dict): Job search results of the run
+
+        Returns:
+            list: The postings that are new for this search, none on its first run
+        """
+        with self._lock:
+            search = self._searches.get(search_id)
+            if search is None:
+                return []
+            seen = self._seen_ids(search_id)
+
+            new_postings = []
+            for job in results.get("results", []):
+                job_id = job.get("job_id")
+                if job_id and job_id not in seen:
+                    seen.add(job_id)
+                    new_postings.append(job)
+
+            found_at = datetime.now().isoformat(timespec="seconds")
+            if new_postings:
+                with open(self._seen_path(search_id), "a", encoding="utf-8") as f:
+                    f.write("".join(f"{job['job_id']}\n" for job in new_postings))
+
+            # The first run only establishes the baseline, nothing is "new" yet
+            if search["last_run"] is None:
+                new_postings = []
+            elif new_postings:
+                with open(self._new_path(search_id), "a", encoding="utf-8") as f:
+                    f.write("".join(json.dumps({"found_at": found_at, "job": job}) + "\n" for job in new_postings))
+                search["new_count"] += len(new_postings)
+            search["seen_count"] = len(seen)
+            search["last_run"] = found_at
+            self._save()
+            return new_postings
+
+    def get_new_postings(self, search_id, since=None, limit=None, offset=0):
+        """
+        Get a page of the postings stored as new for a search
+
+        The file is read backwards from its end, so a page of the newest
+        postings costs the size of the page, not of the file.
+
+        Args:
+            search_id (str): Saved search ID
+            since (str): Only return postings found at or after this ISO timestamp
+            limit (int): Maximum number of records (None for all)
+            offset (int): Newer records to skip
+
+        Returns:
+            list: Records with "found_at" and "job", newest first
+        """
+        path = self._new_path(search_id)
+        if not os.path.exists(path) or limit == 0:
+            return []
+        records = []
+        for line in _lines_from_end(path):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            # Appended in the order found, so everything further back is older still
+            if since is not None and record["found_at"] < since:
+                break
+            if offset:
+                offset -= 1
+                continue
+            records.append(record)
+            if limit is not None and len(records) >= limit:
+                break
+        return records
+
+    def mark_viewed(self, search_id):
+        """Reset a search's new-postings counter once the user has seen them"""
+        with self._lock:
+            if search_id in self._searches:
+                self._searches[search_id]["new_count"] = 0
+                self._save()
+
+    def due(self, now=None):
+        """Saved searches whose interval has passed since their last run"""
+        now = now or datetime.now()
+        with self._lock:
+            return [
+                dict(search) for search in self._searches.values()
+                if search["last_run"] is None
+                or datetime.fromisoformat(search["last_run"]) + timedelta(hours=search["interval_hours"]) <= now
+            ]
+
+    def _seen_ids(self, search_id):
+        seen = self._seen.get(search_id)
+        if seen is None:
+            seen = set()
+            path = self._seen_path(search_id)
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    seen.update(line.strip() for line in f if line.strip())
+            self._seen[search_id] = seen
+        return seen
+
+    def _seen_path(self, search_id):
+        return os.path.join(self.directory, f"{search_id}.seen")
+
+    def _new_path(self, search_id):
+        return os.path.join(self.directory, f"{search_id}.new.jsonl")
+
+    def _load(self):
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                return {search["id"]: search for search in json.load(f)}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Error loading saved searches: {e}")
+            return {}
+
+    def _save(self):
+        tmp_path = self.file_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(list(self._searches.values()), f, indent=2)
+        os.replace(tmp_path, self.file_path)
+
+
+def _lines_from_end(path, block_size=64 * 1024):
+    """Yield the lines of a file last to first, reading it in blocks from the end"""
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        rest = b""
+        while position > 0:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            lines = (f.read(step) + rest).split(b"\n")
+            # The first piece may be the end of a line that starts in an earlier block
+            rest = lines.pop(0)
+            for line in reversed(lines):
+                if line:
+                    yield line.decode("utf-8")
+        if rest:
+            yield rest.decode("utf-8")
+
+
+class SavedSearchWatcher:
+    """
+    Background runner that re-executes due saved searches and stores only
+    the postings each one had not seen before
+    """
+
+    def __init__(self, store=None, poll_seconds=300):
+        self.store = store or SavedSearchStore()
+        self.poll_seconds = poll_seconds
+        self._stop = threading.Event()
+        self._thread = None
+
+    def run_search(self, search):
+        """
+        Run one saved search now
+
+        Args:
+            search (dict): Saved search
+
+        Returns:
+            list: The postings that are new for this search
+        """
+        job_search = JobSearchFactory.create_job_search(search["source"])
+        # Always ask the source, a cached copy would hide new postings
+        results = job_search.search_jobs(search["query"], search["location"], search["limit"], use_cache=False)
+        if results.get("error"):
+            print(f"Saved search '{search['query']}' failed: {results['error']}")
+            return []
+        return self.store.record_run(search["id"], results)
+
+    def run_due(self):
+        """
+        Run every saved search that is due
+
+        Returns:
+            dict: Number of new postings found, by saved search ID
+        """
+        found = {}
+        for search in self.store.due():
+            try:
+                found[search["id"]] = len(self.run_search(search))
+            except Exception as e:
+                print(f"Error running saved search '{search['query']}': {e}")
+        return found
+
+    def start(self):
+        """Start running due searches in a background thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="saved-search-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.run_due()
+            self._stop.wait(self.poll_seconds)
+
+
+_default_watcher = None
+_default_watcher_lock = threading.Lock()
+
+
+def get_default_watcher():
+    """Get the saved search watcher shared by every session in this process"""
+    global _default_watcher
+    with _default_watcher_lock:
+        if _default_watcher is None:
+            _default_watcher = SavedSearchWatcher()
+        return _default_watcher
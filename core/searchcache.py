@@ -0,0 +1,220 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from config import (SEARCH_CACHE_DIRECTORY, SEARCH_CACHE_DISK_ENTRIES, SEARCH_CACHE_MAX_AGE, SEARCH_CACHE_SIZE,
+                    SEARCH_CACHE_TTL)
+from utils.helpers import ensure_directory_exists
+
+
+class SearchCache:
+    """
+    Two-tier cache for job search results: an in-memory LRU in front of
+    one JSON file per entry on disk
+
+    Entries past the TTL are still served (stale) until max_age, when they
+    are deleted as they are read. The disk tier holds at most
+    max_disk_entries files: going past that deletes expired entries and
+    then the least recently written, down to three quarters of it.
+    """
+
+    def __init__(self, cache_dir=SEARCH_CACHE_DIRECTORY, max_entries=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL,
+                 max_age=SEARCH_CACHE_MAX_AGE, max_disk_entries=SEARCH_CACHE_DISK_ENTRIES):
+        self.cache_dir = ensure_directory_exists(cache_dir)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_age = max_age
+        self.max_disk_entries = max_disk_entries
+        self._memory = OrderedDict()
+        self._disk_entries = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(source, query, location=None, limit=10, page=0, identity=()):
+        """
+        Build a cache key from the normalized search parameters
+
+        Args:
+            source (str): Name of the job search source
+            query (str): Job search query
+            location (str): Job location
+            limit (int): Maximum number of results
+            page (int): Result page number
+            identity (tuple): Settings of the source instance that change its results
+
+        Returns:
+            str: Cache key
+        """
+        normalized = [
+            " ".join(str(source).lower().split()),
+            " ".join(str(query or "").lower().split()),
+            " ".join(str(location or "").lower().split()),
+            int(limit),
+            int(page)
+        ]
+        if identity:
+            normalized.append([str(value) for value in identity])
+        return hashlib.sha1(json.dumps(normalized).encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """
+        Get a cache entry, fresh or stale
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            dict: Entry with "stored_at", "results" and "validators", or None
+            when there is none or it is older than max_age
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self.age(entry) >= self.max_age:
+                    del self._memory[key]
+                else:
+                    self._memory.move_to_end(key)
+                    return entry
+
+        entry = self._read_from_disk(key)
+        if entry is not None and self.age(entry) >= self.max_age:
+            self._remove_from_disk(key)
+            entry = None
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key, results, validators=None):
+        """
+        Store search results in both tiers
+
+        Args:
+            key (str): Cache key
+            results (dict): Job search results
+            validators (dict): ETag/Last-Modified values returned by the source
+
+        Returns:
+            dict: The stored entry
+        """
+        entry = {
+            "stored_at": time.time(),
+            "results": results,
+            "validators": validators or {}
+        }
+        self._remember(key, entry)
+        self._write_to_disk(key, entry)
+        return entry
+
+    def touch(self, key):
+        """Mark an entry as fresh again after the source confirmed it is unchanged"""
+        entry = self.get(key)
+        if entry is None:
+            return None
+        return self.put(key, entry["results"], entry["validators"])
+
+    def is_fresh(self, entry, ttl=None):
+        """Check whether an entry is younger than the TTL"""
+        return self.age(entry) < (self.ttl if ttl is None else ttl)
+
+    @staticmethod
+    def age(entry):
+        """Age of an entry in seconds"""
+        return max(0.0, time.time() - entry["stored_at"])
+
+    def clear(self):
+        """Remove every entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            self._disk_entries = 0
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(".json"):
+                os.remove(os.path.join(self.cache_dir, filename))
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read_from_disk(self, key):
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _remove_from_disk(self, key):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            return
+        with self._lock:
+            if self._disk_entries:
+                self._disk_entries -= 1
+
+    def _write_to_disk(self, key, entry):
+        # Write to a temporary file first so readers never see a partial entry
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            added = not os.path.exists(path)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            print(f"Error writing search cache entry: {e}")
+            return
+        with self._lock:
+            if self._disk_entries is None:
+                self._disk_entries = self._count_disk_entries()
+            elif added:
+                self._disk_entries += 1
+            if self._disk_entries > self.max_disk_entries:
+                self._prune_disk()
+
+    def _count_disk_entries(self):
+        return sum(1 for filename in os.listdir(self.cache_dir) if filename.endswith(".json"))
+
+    def _prune_disk(self):
+        """Delete expired entries, then the oldest, down to three quarters of max_disk_entries (hold the lock)"""
+        entries = []
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(".json"):
+                path = os.path.join(self.cache_dir, filename)
+                try:
+                    entries.append((os.path.getmtime(path), path))
+                except OSError:
+                    continue
+        entries.sort()
+        expired_before = time.time() - self.max_age
+        keep = self.max_disk_entries * 3 // 4
+        removed = 0
+        for written, path in entries:
+            if written >= expired_before and len(entries) - removed <= keep:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            removed += 1
+        self._disk_entries = len(entries) - removed
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache():
+    """Get the search cache shared by every job search instance in this process"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = SearchCache()
+        return _default_cache
@@ -0,0 +1,305 @@
+import glob
+import gzip
+import json
+import os
+import re
+import threading
+import zlib
+from datetime import datetime, timedelta
+
+from utils.helpers import ensure_directory_exists
+
+SEGMENT_PATTERN = re.compile(r"segment_(\d{6})\.jsonl(\.gz)?$")
+
+
+class SearchHistoryStore:
+    """
+    Append-only store for saved search results
+
+    Every saved posting becomes one JSON line in the active segment file.
+    Segments are rotated once they reach max_segment_bytes on disk, and
+    once compact_after more have been sealed, the sealed segments are
+    compacted so each job ID is kept once (its latest copy), replacing the
+    one-file-per-search layout that grew without bound.
+    """
+
+    def __init__(self, directory=os.path.join("data", "job_listings", "history"),
+                 max_segment_bytes=8 * 1024 * 1024, compress=True,
+                 compact_after=8, retention_days=365):
+        """
+        Args:
+            directory (str): Directory holding the segment files
+            max_segment_bytes (int): Size at which the active segment is sealed
+            compress (bool): Write gzip-compressed segments
+            compact_after (int): Compact once this many sealed segments exist
+            retention_days (int): Drop postings saved longer ago than this when compacting
+                (None keeps everything)
+        """
+        self.directory = ensure_directory_exists(directory)
+        self.max_segment_bytes = max_segment_bytes
+        self.compress = compress
+        self.compact_after = compact_after
+        self.retention_days = retention_days
+        # Number of the last segment the latest compaction covered
+        self._compacted_through = 0
+        self._lock = threading.Lock()
+
+    def append(self, results, query=None, location=None, saved_at=None):
+        """
+        Append the postings of a search to the active segment
+
+        Args:
+            results (dict): Job search results
+            query (str): Query that produced the results
+            location (str): Location that produced the results
+            saved_at (str): When the results were saved, defaults to now
+
+        Returns:
+            str: Path of the segment written to
+        """
+        saved_at = saved_at or datetime.now().isoformat(timespec="seconds")
+        lines = "".join(
+            json.dumps({
+                "saved_at": saved_at,
+                "query": query,
+                "location": location,
+                "job": job
+            }) + "\n"
+            for job in results.get("results", [])
+        )
+
+        with self._lock:
+            path = self._active_segment()
+            if lines:
+                self._write(path, lines, append=True)
+
+            # Seal the segment once it is full, compacting when enough have piled up since the last time
+            if os.path.getsize(path) >= self.max_segment_bytes:
+                self._new_segment()
+                sealed = self._segments()[:-1]
+                uncompacted = [path for path in sealed if self._number(path) > self._compacted_through]
+                if self.compact_after and len(uncompacted) >= self.compact_after:
+                    self._compact_locked()
+
+        return path
+
+    def iter_records(self):
+        """
+        Stream every stored record, oldest segment first, one line at a time
+
+        Yields:
+            dict: Record with "saved_at", "query", "location" and "job"
+        """
+        for path in self._segments():
+            try:
+                yield from self._read_segment(path)
+            except (OSError, EOFError) as e:
+                print(f"Error reading history segment {path}: {e}")
+
+    def iter_postings(self):
+        """
+        Stream stored postings, each job ID once (its latest stored copy, as compaction keeps)
+
+        Reads the records twice, first to find when each job ID was last
+        saved, so only the job IDs are held in memory.
+
+        Yields:
+            dict: Job posting
+        """
+        latest = {}
+        for record in self.iter_records():
+            job_id = record.get("job", {}).get("job_id")
+            if job_id:
+                latest[job_id] = record.get("saved_at")
+
+        yielded = set()
+        for record in self.iter_records():
+            job = record.get("job", {})
+            job_id = job.get("job_id")
+            if job_id:
+                # Saved since the first pass: its latest copy was already found
+                if job_id in yielded or job_id not in latest or record.get("saved_at") != latest[job_id]:
+                    continue
+                yielded.add(job_id)
+            yield job
+
+    def compact(self):
+        """
+        Rewrite the sealed segments keeping only the latest record per job ID
+        and dropping records older than the retention period
+
+        Returns:
+            dict: Number of records read and kept, and bytes before and after
+        """
+        with self._lock:
+            return self._compact_locked()
+
+    def import_legacy_files(self, directory=os.path.join("data", "job_listings"), remove=False):
+        """
+        Move the old one-file-per-search job_search_*.json files into the store
+
+        Args:
+            directory (str): Directory holding the legacy files
+            remove (bool): Delete each legacy file once it is imported
+
+        Returns:
+            int: Number of files imported
+        """
+        imported = 0
+        for path in sorted(glob.glob(os.path.join(directory, "job_search_*.json"))):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    results = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Skipping unreadable search file {path}: {e}")
+                continue
+
+            saved_at = datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec="seconds")
+            self.append(results, saved_at=saved_at)
+            imported += 1
+            if remove:
+                os.remove(path)
+        return imported
+
+    def disk_usage(self):
+        """Total size of the segment files in bytes"""
+        return sum(os.path.getsize(path) for path in self._segments())
+
+    def _compact_locked(self):
+        sealed = self._segments()[:-1]
+        stats = {"segments": len(sealed), "records_read": 0, "records_kept": 0,
+                 "bytes_before": sum(os.path.getsize(path) for path in sealed), "bytes_after": 0}
+        if not sealed:
+            return stats
+        self._compacted_through = self._number(sealed[-1])
+
+        cutoff = None
+        if self.retention_days is not None:
+            cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat(timespec="seconds")
+
+        # Later records win, so a re-saved posting keeps its newest copy
+        latest = {}
+        anonymous = []
+        for path in sealed:
+            for record in self._read_segment(path):
+                stats["records_read"] += 1
+                if cutoff and record.get("saved_at", "") < cutoff:
+                    continue
+                job_id = record.get("job", {}).get("job_id")
+                if job_id:
+                    latest.pop(job_id, None)
+                    latest[job_id] = record
+                else:
+                    anonymous.append(record)
+        records = anonymous + list(latest.values())
+        stats["records_kept"] = len(records)
+        if len(records) == stats["records_read"]:
+            # Nothing to drop, leave the segments as they are
+            stats["bytes_after"] = stats["bytes_before"]
+            return stats
+
+        # Write the survivors into the sealed segment slots, oldest slot first,
+        # then drop the slots that are no longer needed. A slot is full at
+        # max_segment_bytes on disk (compressed, if it is), the size rotation
+        # goes by. The last slot takes whatever is left so no record is ever
+        # dropped for lack of a slot.
+        outputs = []
+        encoder = _SegmentEncoder(sealed[0].endswith(".gz"))
+        for record in records:
+            encoder.add(json.dumps(record) + "\n")
+            if encoder.size >= self.max_segment_bytes and len(outputs) < len(sealed) - 1:
+                outputs.append(encoder.finish())
+                encoder = _SegmentEncoder(sealed[len(outputs)].endswith(".gz"))
+        if encoder.lines:
+            outputs.append(encoder.finish())
+
+        for path, data in zip(sealed, outputs):
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        for path in sealed[len(outputs):]:
+            os.remove(path)
+
+        stats["bytes_after"] = sum(os.path.getsize(path) for path in sealed[:len(outputs)])
+        return stats
+
+    def _read_segment(self, path):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A torn last line from an interrupted write
+                    continue
+
+    def _write(self, path, text, append, compress=None):
+        if compress is None:
+            compress = path.endswith(".gz")
+        mode = "ab" if append else "wb"
+        data = text.encode("utf-8")
+        if compress:
+            # Each append is its own gzip member; readers see one continuous stream
+            data = gzip.compress(data)
+        with open(path, mode) as f:
+            f.write(data)
+
+    @staticmethod
+    def _number(path):
+        return int(SEGMENT_PATTERN.search(path).group(1))
+
+    def _segments(self):
+        paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                 if SEGMENT_PATTERN.match(name)]
+        return sorted(paths, key=self._number)
+
+    def _active_segment(self):
+        segments = self._segments()
+        return segments[-1] if segments else self._new_segment()
+
+    def _new_segment(self):
+        segments = self._segments()
+        number = int(SEGMENT_PATTERN.search(segments[-1]).group(1)) + 1 if segments else 1
+        suffix = ".jsonl.gz" if self.compress else ".jsonl"
+        path = os.path.join(self.directory, f"segment_{number:06d}{suffix}")
+        open(path, "ab").close()
+        return path
+
+
+class _SegmentEncoder:
+    """Builds a segment's bytes line by line, keeping track of their size on disk"""
+
+    def __init__(self, compress):
+        # wbits=31 writes a gzip member, as gzip.compress does
+        self._compressor = zlib.compressobj(wbits=31) if compress else None
+        self._parts = []
+        self.lines = 0
+        self.size = 0
+
+    def add(self, line):
+        data = line.encode("utf-8")
+        if self._compressor is not None:
+            # Lags behind by what the compressor still buffers, a small share of a segment
+            data = self._compressor.compress(data)
+        self._parts.append(data)
+        self.lines += 1
+        self.size += len(data)
+
+    def finish(self):
+        if self._compressor is not None:
+            self._parts.append(self._compressor.flush())
+        return b"".join(self._parts)
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_history_store():
+    """Get the search history store shared by every job search instance in this process"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = SearchHistoryStore()
+        return _default_store
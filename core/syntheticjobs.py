@@ -0,0 +1,245 @@
+import bisect
+import itertools
+import random
+from datetime import datetime, timedelta
+
+from core.jobindex import assign_job_id
+
+# (title, relative frequency) - common roles dominate like on real job boards
+JOB_TITLES = [
+    ("Software Engineer", 30), ("Data Scientist", 10), ("Frontend Developer", 9),
+    ("Backend Developer", 9), ("DevOps Engineer", 6), ("Product Manager", 7),
+    ("UX Designer", 4), ("Machine Learning Engineer", 5), ("Full Stack Developer", 8),
+    ("QA Engineer", 4), ("Systems Architect", 2), ("Database Administrator", 2),
+    ("Data Engineer", 6), ("Site Reliability Engineer", 3), ("Security Engineer", 3),
+    ("Mobile Developer", 4), ("Engineering Manager", 3), ("Technical Writer", 1)
+]
+
+# (seniority prefix, relative frequency, salary multiplier)
+SENIORITY_LEVELS = [
+    ("", 40, 1.0), ("Junior", 12, 0.7), ("Senior", 30, 1.3),
+    ("Staff", 8, 1.6), ("Principal", 4, 1.9), ("Lead", 6, 1.5)
+]
+
+# (location, relative frequency, salary multiplier)
+LOCATIONS = [
+    ("Remote", 25, 1.0), ("San Francisco, CA", 10, 1.35), ("New York, NY", 10, 1.3),
+    ("Seattle, WA", 7, 1.25), ("Austin, TX", 6, 1.05), ("Boston, MA", 5, 1.2),
+    ("Chicago, IL", 5, 1.05), ("Denver, CO", 4, 1.0), ("Atlanta, GA", 4, 0.95),
+    ("Los Angeles, CA", 5, 1.2), ("Raleigh, NC", 3, 0.95), ("Portland, OR", 3, 1.0),
+    ("Miami, FL", 3, 0.95), ("Minneapolis, MN", 2, 0.95), ("Pittsburgh, PA", 2, 0.9),
+    ("Salt Lake City, UT", 2, 0.9), ("Phoenix, AZ", 2, 0.9), ("Columbus, OH", 2, 0.85)
+]
+
+BASE_SALARIES = {
+    "Software Engineer": 120000, "Data Scientist": 125000, "Frontend Developer": 110000,
+    "Backend Developer": 118000, "DevOps Engineer": 122000, "Product Manager": 130000,
+    "UX Designer": 100000, "Machine Learning Engineer": 140000, "Full Stack Developer": 115000,
+    "QA Engineer": 90000, "Systems Architect": 145000, "Database Administrator": 100000,
+    "Data Engineer": 125000, "Site Reliability Engineer": 130000, "Security Engineer": 135000,
+    "Mobile Developer": 115000, "Engineering Manager": 160000, "Technical Writer": 85000
+}
+
+COMPANY_PREFIXES = [
+    "Tech", "Data", "Cloud", "Quantum", "Blue", "Bright", "Agile", "Pixel", "Nova", "Apex",
+    "Vertex", "Summit", "River", "Iron", "Silver", "Green", "Atlas", "Orbit", "Signal", "Harbor",
+    "Cedar", "Falcon", "Lumen", "Nimbus", "Polar", "Prism", "Stellar", "Tidal", "Vector", "Zenith"
+]
+
+COMPANY_CORES = [
+    "Innovators", "Crunch", "Front", "Nine", "Dynamics", "Vision", "Works", "Labs", "Logic",
+    "Systems", "Networks", "Analytics", "Forge", "Stack", "Bridge", "Wave", "Path", "Scale"
+]
+
+COMPANY_SUFFIXES = ["Inc.", "LLC", "Corp", "Solutions", "Technologies", "Group", "Partners", "Co."]
+
+DESCRIPTIONS = {
+    "Software Engineer": "We are looking for a Software Engineer to join our development team. You will be responsible for designing, coding, and modifying applications according to client specifications. As a member of our team, you will develop high-quality software design and architecture.",
+    "Data Scientist": "We're seeking a Data Scientist to interpret data and turn it into information which can offer ways to improve our business. You'll be mining complex data and using advanced analytics to find patterns and relationships in data, then presenting these insights to stakeholders.",
+    "Frontend Developer": "We need a Frontend Developer who will implement visual elements that users see and interact with in a web application. You'll collaborate with UI/UX designers and bridge the gap between graphical design and technical implementation.",
+    "Backend Developer": "Join our team as a Backend Developer to build and maintain the server-side logic that powers our applications. You will develop all server-side logic, maintain databases, and ensure high performance and responsiveness to requests from the front-end.",
+    "DevOps Engineer": "We're looking for a DevOps Engineer to help us build and scale our infrastructure. You will be responsible for designing, implementing, and maintaining our CI/CD pipelines as well as managing our cloud infrastructure."
+}
+
+EXTRA_SENTENCES = [
+    "You will work closely with product, design and engineering partners.",
+    "Our team ships small changes to production several times a day.",
+    "We value clear written communication and thoughtful code review.",
+    "The role includes participating in a shared on-call rotation.",
+    "Experience with Python or Go is a plus.",
+    "Knowledge of cloud platforms such as AWS or GCP is preferred.",
+    "Familiarity with containerization and Kubernetes is helpful.",
+    "You will mentor junior team members and help grow the team.",
+    "We offer flexible hours, a learning budget and generous parental leave.",
+    "Background in distributed systems is highly valued.",
+    "Proficiency in SQL and data modeling is expected.",
+    "You will own features end to end, from design through monitoring.",
+    "Our customers range from startups to Fortune 500 companies.",
+    "We are committed to building a diverse and inclusive workplace."
+]
+
+SPECIFIC_REQUIREMENTS = {
+    "Software Engineer": [
+        "3+ years of software development experience",
+        "Proficiency in {query}-related technologies",
+        "Experience with software design patterns",
+        "Knowledge of databases and data structures"
+    ],
+    "Data Scientist": [
+        "Experience with data analysis tools like Python, R, or SAS",
+        "Knowledge of machine learning frameworks",
+        "Strong statistical and mathematical background",
+        "Experience with {query} data processing"
+    ],
+    "Frontend Developer": [
+        "Expertise in JavaScript, HTML, and CSS",
+        "Experience with React, Angular, or Vue",
+        "Understanding of responsive design principles",
+        "Knowledge of {query} frameworks and libraries"
+    ]
+}
+
+BASE_REQUIREMENTS = [
+    "Bachelor's degree in Computer Science or related field",
+    "Excellent problem-solving skills",
+    "Strong communication and teamwork abilities"
+]
+
+
+class WeightedChoice:
+    """Pick items with fixed relative frequencies in O(log n) per draw"""
+
+    def __init__(self, items, weights):
+        self.items = list(items)
+        self.cumulative = list(itertools.accumulate(weights))
+        self.total = self.cumulative[-1]
+
+    def pick(self, rng):
+        return self.items[bisect.bisect_right(self.cumulative, rng.random() * self.total)]
+
+
+class SyntheticJobGenerator:
+    """
+    Deterministic generator of realistic job postings for load testing
+
+    Posting n of a given (seed, query, location) is always the same, so
+    results can be paged or regenerated without storing them, and postings
+    are produced one at a time so millions can be streamed.
+    """
+
+    def __init__(self, seed=0, reference_date=None, max_age_days=60, source="Simulated"):
+        """
+        Args:
+            seed (int): Seed that fixes the generated data set
+            reference_date (datetime): Date postings are dated back from, defaults to today
+            max_age_days (int): Oldest posting age in days
+            source (str): Source name stamped on every posting
+        """
+        self.seed = seed
+        self.reference_date = (reference_date or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.max_age_days = max_age_days
+        self.source = source
+
+        self._titles = WeightedChoice([t for t, _ in JOB_TITLES], [w for _, w in JOB_TITLES])
+        self._seniority = WeightedChoice([(p, m) for p, _, m in SENIORITY_LEVELS],
+                                         [w for _, w, _ in SENIORITY_LEVELS])
+        self._locations = WeightedChoice([(l, m) for l, _, m in LOCATIONS], [w for _, w, _ in LOCATIONS])
+
+        # Company popularity follows a Zipf-like curve: a few companies post a lot
+        self._companies = [f"{prefix} {core} {suffix}"
+                           for prefix, core, suffix in itertools.product(COMPANY_PREFIXES, COMPANY_CORES, COMPANY_SUFFIXES)]
+        random.Random(seed).shuffle(self._companies)
+        self._company_choice = WeightedChoice(self._companies,
+                                              [1.0 / (rank + 1) for rank in range(len(self._companies))])
+
+    def iter_postings(self, count=None, query=None, location=None, start=0):
+        """
+        Stream postings without materializing them
+
+        Args:
+            count (int): Number of postings to generate (None for an endless stream)
+            query (str): Search query worked into titles, descriptions and requirements
+            location (str): Fixed location for every posting (None draws realistic locations)
+            start (int): Index of the first posting
+
+        Yields:
+            dict: Job posting
+        """
+        indices = itertools.count(start) if count is None else range(start, start + count)
+        for index in indices:
+            yield self.posting(index, query, location)
+
+    def posting(self, index, query=None, location=None):
+        """
+        Generate posting number index
+
+        Args:
+            index (int): Posting number
+            query (str): Search query worked into titles, descriptions and requirements
+            location (str): Fixed location (None draws a realistic location)
+
+        Returns:
+            dict: Job posting
+        """
+        rng = random.Random(f"{self.seed}:{query or ''}:{location or ''}:{index}")
+
+        base_title = self._titles.pick(rng)
+        seniority, seniority_factor = self._seniority.pick(rng)
+        title = f"{seniority} {base_title}".strip()
+        if query and query.lower() not in title.lower():
+            title = f"{title} - {query.capitalize()}"
+
+        if location:
+            location_factor = 1.0
+        else:
+            location, location_factor = self._locations.pick(rng)
+
+        # Salaries are log-normally spread around the role/level/location midpoint
+        midpoint = BASE_SALARIES[base_title] * seniority_factor * location_factor * rng.lognormvariate(0, 0.12)
+        low = int(round(midpoint * 0.85, -3))
+        high = int(round(midpoint * 1.15, -3))
+
+        # Most postings are recent, with a long tail of older ones
+        age_days = min(self.max_age_days, int(rng.expovariate(1 / 7)))
+        posted_date = (self.reference_date - timedelta(days=age_days)).strftime("%Y-%m-%d")
+
+        job_posting = {
+            "title": title,
+            "company": self._company_choice.pick(rng),
+            "location": location,
+            "description": self._description(rng, base_title, title, query),
+            "requirements": self._requirements(rng, base_title, query),
+            "salary_range": f"${low:,} - ${high:,}",
+            "posted_date": posted_date,
+            "application_url": f"https://example.com/jobs/{self.seed}-{index + 1}",
+            "source": self.source
+        }
+        return assign_job_id(job_posting)
+
+    def _description(self, rng, base_title, title, query):
+        description = DESCRIPTIONS.get(
+            base_title,
+            f"We are hiring a talented {title} to join our team. In this role, you will work on challenging projects and collaborate with cross-functional teams to deliver high-quality solutions."
+        )
+
+        # Description lengths vary from a short blurb to a long posting
+        extra = min(len(EXTRA_SENTENCES), int(rng.lognormvariate(1.2, 0.7)))
+        if extra:
+            description += " " + " ".join(rng.sample(EXTRA_SENTENCES, extra))
+
+        if query:
+            description += f"\n\nIn this role, you will focus specifically on {query.lower()} technologies and solutions. You will be working with cutting-edge tools and frameworks in the {query.lower()} space to develop innovative solutions for our clients."
+        return description
+
+    def _requirements(self, rng, base_title, query):
+        topic = query or base_title
+        specific = SPECIFIC_REQUIREMENTS.get(base_title, [
+            f"Experience in {base_title} role",
+            "Technical knowledge of {query}",
+            "Ability to learn quickly and adapt to new technologies"
+        ])
+        requirements = BASE_REQUIREMENTS + [req.format(query=topic) for req in specific]
+        requirements.append(f"Familiarity with {topic.capitalize()} ecosystem and best practices")
+        if rng.random() < 0.4:
+            requirements.append(f"{rng.randint(2, 10)}+ years of professional experience")
+        return requirements
@@ -0,0 +1,156 @@
+import json
+import os
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from config import APP_STATUS
+from core.trackerstorage import TRACKER_COLUMNS
+
+IMPORT_FORMATS = {".csv": "csv", ".json": "json", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+
+def applications_format(source, format=None):
+    """
+    Work out the import/export format of a file
+
+    Args:
+        source: File path, or an uploaded file with a name
+        format (str): csv, json or jsonl; guessed from the file extension if None
+
+    Returns:
+        str: csv, json or jsonl
+    """
+    if format:
+        format = format.lower()
+        if format not in IMPORT_FORMATS.values():
+            raise ValueError(f"Unsupported applications format: {format}")
+        return format
+    name = source if isinstance(source, str) else getattr(source, "name", "")
+    extension = os.path.splitext(name)[1].lower()
+    if extension not in IMPORT_FORMATS:
+        raise ValueError(f"Cannot tell the format of {name or 'the applications file'}, pass format=")
+    return IMPORT_FORMATS[extension]
+
+
+def read_applications(source, format=None):
+    """
+    Read applications from a file or from records
+
+    Args:
+        source: CSV, JSON (a list of objects) or JSON Lines file path or file
+            object, a DataFrame, or a list of dicts
+        format (str): csv, json or jsonl; guessed from the file extension if None
+
+    Returns:
+        DataFrame: The applications as read, every value as text
+    """
+    if isinstance(source, pd.DataFrame):
+        frame = source.astype(object)
+    elif isinstance(source, list):
+        frame = pd.DataFrame(source, dtype=object)
+    else:
+        format = applications_format(source, format)
+        if format == "csv":
+            # Already plain Python strings, with blanks as ""
+            try:
+                return pd.read_csv(source, dtype=object, keep_default_na=False)
+            except pd.errors.EmptyDataError:
+                return pd.DataFrame(columns=TRACKER_COLUMNS, dtype=object)
+        # object columns keep a job_id of 123 from turning into 123.0 next to a missing one
+        frame = pd.DataFrame(_read_json_records(source, lines=(format == "jsonl")), dtype=object)
+    # Plain Python strings, the storage and index code iterate over them row by row
+    for column in frame.columns:
+        if pd.api.types.infer_dtype(frame[column], skipna=False) != "string":
+            frame[column] = frame[column].map(_text).astype(object)
+    return frame
+
+
+def _text(value):
+    return "" if value is None or value != value else str(value)
+
+
+def _read_json_records(source, lines):
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            text = f.read()
+    else:
+        text = source.read()
+    if lines:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    return json.loads(text)
+
+
+def prepare_applications(frame, today=None):
+    """
+    Give imported applications every tracker column, with the defaults track_application uses
+
+    Missing dates default to today, the follow-up to 14 days after applying
+    and the status to Applied. Rows without a company or position are dropped,
+    as are repeats of a (company, position), keeping the first. No rows at
+    all (an empty JSON list, say) is simply nothing to import.
+
+    Args:
+        frame (DataFrame): Applications with at least company and position columns
+        today (datetime): Date the defaults are based on, now if None
+
+    Returns:
+        DataFrame: Applications with exactly TRACKER_COLUMNS
+    """
+    if frame.empty:
+        return pd.DataFrame(columns=TRACKER_COLUMNS, dtype=object)
+    missing = {'company', 'position'} - set(frame.columns)
+    if missing:
+        raise ValueError(f"Applications need {', '.join(sorted(missing))} columns")
+
+    today = today or datetime.now()
+    frame = frame.reindex(columns=TRACKER_COLUMNS, fill_value="")
+    frame['company'] = frame['company'].str.strip()
+    frame['position'] = frame['position'].str.strip()
+    frame = frame[(frame['company'] != "") & (frame['position'] != "")]
+    frame = frame.drop_duplicates(subset=['company', 'position'], keep='first')
+
+    frame['date_applied'] = frame['date_applied'].mask(frame['date_applied'] == "", today.strftime("%Y-%m-%d"))
+    frame['status'] = frame['status'].mask(frame['status'] == "", APP_STATUS["APPLIED"])
+    applied = pd.to_datetime(frame['date_applied'], errors="coerce", format="mixed")
+    follow_up = (applied + pd.Timedelta(days=14)).dt.strftime("%Y-%m-%d")
+    follow_up = follow_up.fillna((today + timedelta(days=14)).strftime("%Y-%m-%d"))
+    frame['follow_up_date'] = frame['follow_up_date'].mask(frame['follow_up_date'] == "", follow_up)
+    frame['last_contact_date'] = frame['last_contact_date'].mask(frame['last_contact_date'] == "",
+                                                                 frame['date_applied'])
+    return frame.reset_index(drop=True)
+
+
+def new_applications(frame, existing_keys):
+    """
+    Leave out applications already in the tracker
+
+    Args:
+        frame (DataFrame): Prepared applications
+        existing_keys (DataFrame): company and position of the tracked applications
+
+    Returns:
+        DataFrame: The rows of frame whose (company, position) is not tracked yet
+    """
+    keys = pd.MultiIndex.from_frame(frame[['company', 'position']])
+    tracked = pd.MultiIndex.from_frame(existing_keys[['company', 'position']].astype(str))
+    # Hash semi-join on the key, MultiIndex.isin builds one hash table of the tracked keys
+    return frame[~keys.isin(tracked)].reset_index(drop=True)
+
+
+def write_applications(frame, target, format=None):
+    """
+    Write applications as CSV, JSON (a list of objects) or JSON Lines
+
+    Args:
+        frame (DataFrame): Applications
+        target: File path or writable file object
+        format (str): csv, json or jsonl; guessed from the file extension if None
+    """
+    format = applications_format(target, format)
+    if isinstance(target, str):
+        os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+    if format == "csv":
+        frame.to_csv(target, index=False)
+    else:
+        frame.to_json(target, orient="records", lines=(format == "jsonl"), force_ascii=False)
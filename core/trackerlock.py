@@ -0,0 +1,182 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class LockStats:
+    """Acquisition counts and wait times of a lock"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, waited, contended):
+        """
+        Count one acquisition
+
+        Args:
+            waited (float): Seconds spent acquiring
+            contended (bool): Whether someone else held the lock at the time
+        """
+        with self._lock:
+            self.acquisitions += 1
+            if contended:
+                self.contended += 1
+                self.wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def summary(self):
+        """Counts and wait times as a dict"""
+        with self._lock:
+            return {
+                'acquisitions': self.acquisitions,
+                'contended': self.contended,
+                'contention_rate': self.contended / self.acquisitions if self.acquisitions else 0.0,
+                'wait_seconds': self.wait_seconds,
+                'max_wait_seconds': self.max_wait_seconds,
+            }
+
+
+class ReadWriteLock:
+    """
+    Lets any number of threads read at once, or one thread write
+
+    Both sides are reentrant and a writer may read, but a reader must not
+    ask to write. Waiting writers go first, so a steady stream of reads
+    cannot starve them.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+        self._local = threading.local()
+        self.stats = LockStats()
+
+    @contextmanager
+    def read(self):
+        me = threading.get_ident()
+        depth = getattr(self._local, "reads", 0)
+        with self._cond:
+            if self._writer != me and depth == 0:
+                while self._writer is not None or self._waiting_writers:
+                    self._cond.wait()
+            self._readers += 1
+        self._local.reads = depth + 1
+        try:
+            yield
+        finally:
+            self._local.reads = depth
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+            else:
+                started = time.perf_counter()
+                contended = self._writer is not None or self._readers > 0
+                self._waiting_writers += 1
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+                self._waiting_writers -= 1
+                self._writer = me
+                self._writer_depth = 1
+                self.stats.record(time.perf_counter() - started, contended)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer_depth -= 1
+                if not self._writer_depth:
+                    self._writer = None
+                    self._cond.notify_all()
+
+
+class TrackerFileLock:
+    """
+    Exclusive lock on "<file>.lock", held by one process (and one thread in it) at a time
+
+    Uses flock where available (Linux, macOS) and msvcrt.locking on Windows.
+    Reentrant within the holding thread.
+    """
+
+    def __init__(self, file_path, stats=None):
+        self.path = file_path + ".lock"
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd = None
+        self.stats = stats or LockStats()
+
+    def _try_lock(self, blocking):
+        if fcntl is not None:
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            try:
+                fcntl.flock(self._fd, flags)
+                return True
+            except BlockingIOError:
+                return False
+        while True:
+            try:
+                msvcrt.locking(self._fd, msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                if not blocking:
+                    return False
+                time.sleep(0.01)
+
+    def _unlock(self):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+
+    def __enter__(self):
+        started = time.perf_counter()
+        contended = not self._thread_lock.acquire(blocking=False)
+        if contended:
+            self._thread_lock.acquire()
+        self._depth += 1
+        if self._depth == 1:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                if not self._try_lock(blocking=False):
+                    contended = True
+                    self._try_lock(blocking=True)
+            except BaseException:
+                self._release()
+                raise
+            self.stats.record(time.perf_counter() - started, contended)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self._release()
+
+    def _release(self):
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            try:
+                self._unlock()
+            finally:
+                os.close(self._fd)
+                self._fd = None
+        self._thread_lock.release()
@@ -0,0 +1,123 @@
+import bisect
+from collections import Counter
+from datetime import timedelta
+
+import pandas as pd
+
+from core.followupindex import parse_date
+
+
+def week_ending(day):
+    """The Sunday closing the week of a date, the same bins as pd.Grouper(freq='W')"""
+    return day + timedelta(days=6 - day.weekday())
+
+
+class ApplicationStatistics:
+    """
+    Application counts kept up to date with every change
+
+    Status, company and position counters, the distinct application dates
+    (sorted, for the oldest and newest) and applications per week are
+    adjusted by each insert, update and delete, so summary() and timeline()
+    never look at the applications themselves.
+    """
+
+    def __init__(self):
+        self.rebuild(None)
+
+    def rebuild(self, applications):
+        """
+        Count every application
+
+        Args:
+            applications (DataFrame): All applications, None for an empty tracker
+        """
+        self.total = 0
+        self.status_counts = Counter()
+        self.company_counts = Counter()
+        self.position_counts = Counter()
+        self.date_counts = Counter()
+        self.week_counts = Counter()
+        self._dates = []
+        self._weeks = []
+        self._timeline = None
+        if applications is None or applications.empty:
+            return
+
+        self.total = len(applications)
+        self.status_counts.update(applications['status'].value_counts().to_dict())
+        self.company_counts.update(applications['company'].value_counts().to_dict())
+        self.position_counts.update(applications['position'].value_counts().to_dict())
+        self.date_counts.update({day: count for day, count in applications['date_applied'].value_counts().items()
+                                 if day})
+        applied = pd.to_datetime(applications['date_applied'], errors="coerce", format="mixed").dropna()
+        # Shift each date to the Sunday ending its week
+        weeks = (applied + pd.to_timedelta(6 - applied.dt.weekday, unit="D")).dt.date
+        self.week_counts.update(weeks.value_counts().to_dict())
+        self._dates = sorted(self.date_counts)
+        self._weeks = sorted(self.week_counts)
+
+    def apply(self, old_row, new_row):
+        """
+        Update the counts for one change
+
+        Args:
+            old_row (dict): Application before the change, None for an insert
+            new_row (dict): Application after the change, None for a delete
+        """
+        if old_row is not None:
+            self._count(old_row, -1)
+        if new_row is not None:
+            self._count(new_row, 1)
+
+    def _count(self, row, step):
+        self.total += step
+        self._adjust(self.status_counts, row['status'], step)
+        self._adjust(self.company_counts, row['company'], step)
+        self._adjust(self.position_counts, row['position'], step)
+        if not row['date_applied']:
+            return
+        self._adjust(self.date_counts, row['date_applied'], step, self._dates)
+        applied = parse_date(row['date_applied'])
+        if applied is not None:
+            self._adjust(self.week_counts, week_ending(applied), step, self._weeks)
+            self._timeline = None
+
+    @staticmethod
+    def _adjust(counts, key, step, ordered=None):
+        """Move a counter by step, keeping ordered (the sorted distinct keys) in line"""
+        counts[key] += step
+        if counts[key] <= 0:
+            del counts[key]
+            if ordered is not None:
+                del ordered[bisect.bisect_left(ordered, key)]
+        elif step > 0 and counts[key] == step and ordered is not None:
+            bisect.insort(ordered, key)
+
+    def summary(self):
+        """Counts and date range of the applications, as returned by ApplicationTracker.get_application_statistics"""
+        return {
+            'total_applications': self.total,
+            'status_counts': dict(self.status_counts.most_common()),
+            'companies_applied': len(self.company_counts),
+            'positions_applied': len(self.position_counts),
+            'oldest_application': self._dates[0] if self._dates else None,
+            'newest_application': self._dates[-1] if self._dates else None,
+        }
+
+    def timeline(self):
+        """
+        Applications per week, including empty weeks
+
+        Returns:
+            DataFrame: date_applied (week ending, YYYY-MM-DD) and count columns
+        """
+        if self._timeline is None:
+            rows = []
+            if self._weeks:
+                week, last = self._weeks[0], self._weeks[-1]
+                while week <= last:
+                    rows.append((week.strftime("%Y-%m-%d"), self.week_counts.get(week, 0)))
+                    week += timedelta(days=7)
+            self._timeline = pd.DataFrame(rows, columns=['date_applied', 'count'])
+        return self._timeline.copy()
@@ -0,0 +1,989 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from config import APP_STATUS
+from core.applicationevents import ApplicationEventLog, new_event
+from core.trackerlock import LockStats, TrackerFileLock
+
+# Parquet and Arrow snapshots are optional and need pyarrow
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+TRACKER_COLUMNS = [
+    'company', 'position', 'date_applied', 'status', 'follow_up_date',
+    'last_contact_date', 'contact_person', 'contact_email', 'notes', 'job_id'
+]
+
+# Every column but notes: what list views show and other processes' changes are passed on with
+SUMMARY_COLUMNS = [column for column in TRACKER_COLUMNS if column != 'notes']
+
+# Columns stored as real dates in Parquet/Arrow snapshots
+DATE_COLUMNS = ['date_applied', 'follow_up_date', 'last_contact_date']
+
+# File extensions stored in SQLite, everything else is a snapshot file
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+# Snapshot formats by file extension
+SNAPSHOT_FORMATS = {".csv": "csv", ".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow"}
+
+
+def is_sqlite_path(file_path):
+    """Whether a tracker file is an SQLite database, judged by its extension"""
+    return os.path.splitext(file_path)[1].lower() in SQLITE_EXTENSIONS
+
+
+def snapshot_format(file_path):
+    """Snapshot format of a tracker file, judged by its extension (CSV by default)"""
+    return SNAPSHOT_FORMATS.get(os.path.splitext(file_path)[1].lower(), "csv")
+
+
+def _require_pyarrow(file_path):
+    if pa is None:
+        raise ImportError(f"Reading or writing {file_path} needs pyarrow (pip install pyarrow)")
+
+
+def to_arrow_table(frame):
+    """
+    Convert tracker rows to a typed Arrow table
+
+    status becomes a dictionary (categorical) column and the date columns
+    real dates; text that is not a date is stored as null.
+    """
+    arrays = []
+    for column in TRACKER_COLUMNS:
+        values = frame[column]
+        if column in DATE_COLUMNS:
+            dates = pd.to_datetime(values.replace("", None), errors="coerce", format="mixed")
+            arrays.append(pa.array(dates, type=pa.timestamp("ms"), from_pandas=True).cast(pa.date32()))
+        elif column == 'status':
+            categories = list(dict.fromkeys(list(APP_STATUS.values()) + sorted(set(values) - {""})))
+            arrays.append(pa.DictionaryArray.from_pandas(pd.Categorical(values, categories=categories)))
+        else:
+            arrays.append(pa.array(values.astype(str).tolist(), type=pa.string()))
+    return pa.Table.from_arrays(arrays, names=TRACKER_COLUMNS)
+
+
+def from_arrow_table(table):
+    """Convert a typed Arrow table back to tracker rows of text, with blanks as empty strings"""
+    frame = table.to_pandas(date_as_object=False)
+    for column in frame.columns:
+        if column in DATE_COLUMNS:
+            frame[column] = pd.to_datetime(frame[column]).dt.strftime("%Y-%m-%d")
+        frame[column] = frame[column].astype(object).where(frame[column].notna(), "")
+    return frame
+
+
+def read_snapshot(file_path, columns=None):
+    """
+    Read a tracker snapshot (CSV, Parquet or Arrow IPC) into a DataFrame of text
+
+    Args:
+        file_path (str): Snapshot file
+        columns (list): Only read these columns; Parquet and Arrow skip the others entirely
+
+    Returns:
+        DataFrame: Tracker rows
+    """
+    file_format = snapshot_format(file_path)
+    if file_format == "csv":
+        # Read every column as text so blanks stay "" and IDs keep their leading zeros
+        return pd.read_csv(file_path, dtype=str, keep_default_na=False, usecols=columns)
+
+    _require_pyarrow(file_path)
+    if file_format == "parquet":
+        table = pq.read_table(file_path, columns=columns, memory_map=True)
+    else:
+        # Uncompressed Arrow IPC is mapped, not copied, into memory
+        table = feather.read_table(file_path, columns=columns, memory_map=True)
+    return from_arrow_table(table)
+
+
+def write_snapshot(frame, file_path):
+    """Write tracker rows to a snapshot file in the format its extension names"""
+    file_format = snapshot_format(file_path)
+    if file_format == "csv":
+        frame.to_csv(file_path, index=False)
+        return
+
+    _require_pyarrow(file_path)
+    table = to_arrow_table(frame)
+    if file_format == "parquet":
+        # Notes are long and rarely read, so they get their own dictionary-free column chunk
+        pq.write_table(table, file_path, compression="zstd",
+                       use_dictionary=[c for c in TRACKER_COLUMNS if c != 'notes'])
+    else:
+        feather.write_feather(table, file_path, compression="uncompressed")
+
+
+def file_signature(file_path):
+    """(mtime_ns, size) of a file, or None when it does not exist"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def file_identity(file_path):
+    """(device, inode) of a file, which changes when it is replaced, or None when it is missing"""
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+def create_tracker_storage(file_path=None):
+    """
+    Create the storage backend for a tracker file
+
+    Args:
+        file_path (str): Tracker file, its extension selects the backend
+
+    Returns:
+        MemoryTrackerStorage or SqliteTrackerStorage: Storage backend, not loaded yet
+    """
+    if file_path and is_sqlite_path(file_path):
+        return SqliteTrackerStorage()
+    return MemoryTrackerStorage()
+
+
+class MemoryTrackerStorage:
+    """
+    Applications kept in memory, saved as a snapshot plus a mutation log
+
+    The snapshot is CSV, or Parquet/Arrow IPC (typed, with categorical status
+    and real dates) when the tracker file ends in .parquet or .arrow.
+
+    Rows live in a preallocated columnar buffer (one object array per column)
+    that doubles when full, so inserts append in amortized O(1), and a hash
+    index on (company, position) maps each application to its row, so
+    lookups, updates and deletes never scan the tracker. Deleted rows are
+    tombstoned and squeezed out once they make up half the buffer.
+
+    Once bound to a file, every change is appended to "<file>.log" as one
+    numbered JSON record, so saving costs the size of the change rather than
+    the size of the tracker. save() checkpoints the log into a fresh snapshot
+    when it has grown past checkpoint_records. Records hold absolute values,
+    so replaying a log whose checkpoint was interrupted gives the same state.
+    Each application's history (status changes, contacts, notes) is kept
+    apart in "<file>.events" (see ApplicationEventLog).
+
+    Several processes can share the files: every change is made holding an
+    exclusive lock on "<file>.lock", after first applying whatever other
+    processes appended to the log since (or reloading, if one of them
+    checkpointed), so no read-modify-write works from stale rows.
+    """
+
+    INITIAL_CAPACITY = 256
+
+    # Log records after which save() rewrites the snapshot and empties the log
+    checkpoint_records = 1000
+
+    def __init__(self):
+        self.file_path = None
+        self._seq = 0
+        self._log_records = 0
+        self._log_offset = 0
+        self._log_identity = None
+        self._signature = None
+        self._file_lock = None
+        self.lock_stats = LockStats()
+        self._events = ApplicationEventLog()
+        self._clear(self.INITIAL_CAPACITY)
+
+    def _clear(self, capacity):
+        self._columns = {column: np.empty(capacity, dtype=object) for column in TRACKER_COLUMNS}
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._size = 0
+        self._deleted = 0
+        self._index = {}
+        self._job_ids = {}
+
+    @staticmethod
+    def log_path(file_path):
+        """Mutation log kept next to a snapshot"""
+        return file_path + ".log"
+
+    @staticmethod
+    def events_path(file_path):
+        """Application history kept next to a snapshot"""
+        return file_path + ".events"
+
+    def _bind(self, file_path):
+        if self.file_path != file_path:
+            self.file_path = file_path
+            self._file_lock = TrackerFileLock(file_path, self.lock_stats)
+            self._events.bind(self.events_path(file_path))
+
+    def load(self, file_path):
+        """
+        Load the CSV snapshot and replay the mutation log written since it
+
+        With neither file there yet the tracker is empty, bound to file_path
+        for the first save to create.
+        """
+        self._bind(file_path)
+        # A checkpoint by another process must not land between reading the snapshot and the log
+        with self._file_lock:
+            if os.path.exists(file_path):
+                self._rebuild(self._read_snapshot(file_path))
+            else:
+                self._clear(self.INITIAL_CAPACITY)
+            self._seq = 0
+            self._log_offset = 0
+            self._log_records = self._replay(self.log_path(file_path))
+            self._remember_files()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Hold the tracker file lock, caught up with the changes of other processes
+
+        Yields:
+            list: (old_row, new_row) for each application other processes
+            changed, or None when the whole tracker had to be reloaded
+        """
+        if self._file_lock is None:
+            yield []
+            return
+        with self._file_lock:
+            yield self.catch_up()
+
+    def refresh(self):
+        """Catch up with the changes of other processes, returned as by transaction()"""
+        with self.transaction() as changes:
+            return changes
+
+    def catch_up(self):
+        """
+        Apply what other processes appended to the log since we last looked
+
+        Only call holding the file lock. When another process checkpointed
+        (a new snapshot and log), everything is reloaded from those instead.
+
+        Returns:
+            list: (old_row, new_row) for each changed application, or None after a reload
+        """
+        if self._files_signature() == self._signature:
+            return []
+        log_path = self.log_path(self.file_path)
+        if (self._signature is not None
+                and file_signature(self.file_path) == self._signature[0]
+                and file_identity(log_path) == self._log_identity
+                and os.path.getsize(log_path) >= self._log_offset):
+            changes = []
+            self._log_records += self._replay(log_path, self._log_offset, changes)
+            self._remember_files()
+            return changes
+        self.load(self.file_path)
+        return None
+
+    def _files_signature(self):
+        return (file_signature(self.file_path), file_signature(self.log_path(self.file_path)))
+
+    def _remember_files(self):
+        """Record the state of our files, so only other writers make them look changed"""
+        self._signature = self._files_signature()
+
+    def is_stale(self, file_path):
+        """Whether file_path is not what this storage last loaded or wrote"""
+        if self.file_path is None or os.path.abspath(file_path) != os.path.abspath(self.file_path):
+            return True
+        return self._files_signature() != self._signature
+
+    def save(self, file_path):
+        """
+        Save applications
+
+        The file the storage is bound to only needs the log records it already
+        has, plus a checkpoint once the log is long. A first save binds the
+        storage to file_path; other paths get a CSV or SQLite export.
+        """
+        if is_sqlite_path(file_path):
+            target = SqliteTrackerStorage()
+            target.load(file_path)
+            target.replace_all(self.all())
+            target.add_events(self._events.events())
+            target.close()
+        elif self.file_path is None:
+            self._bind(file_path)
+            with self._file_lock:
+                self.checkpoint()
+        elif os.path.abspath(file_path) == os.path.abspath(self.file_path):
+            with self.transaction():
+                if self._log_records >= self.checkpoint_records or not os.path.exists(file_path):
+                    self.checkpoint()
+        else:
+            self._write_snapshot(file_path)
+
+    def checkpoint(self):
+        """Write a fresh snapshot and restart the log from it (call holding the file lock)"""
+        self._write_snapshot(self.file_path)
+        # The log only shrinks once the snapshot holding its records is in place
+        log_path = self.log_path(self.file_path)
+        marker = (json.dumps({"seq": self._seq, "op": "checkpoint"}) + "\n").encode("utf-8")
+        with open(log_path + ".tmp", "wb") as f:
+            f.write(marker)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(log_path + ".tmp", log_path)
+        self._log_records = 0
+        self._log_offset = len(marker)
+        self._log_identity = file_identity(log_path)
+        self._remember_files()
+        # Application history has no log to restart, only cleared applications to drop
+        self._events.compact()
+
+    def _read_snapshot(self, file_path):
+        return read_snapshot(file_path)
+
+    def _write_snapshot(self, file_path):
+        # Ensure the directory exists
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        # Keep the extension on the temporary file, it selects the format
+        root, extension = os.path.splitext(file_path)
+        tmp_path = f"{root}.tmp{extension}"
+        write_snapshot(self.all(), tmp_path)
+        os.replace(tmp_path, file_path)
+
+    def _append_log(self, record):
+        """Number a change and append it to the log, when the storage is bound to a file"""
+        if self.file_path is None:
+            return
+        self._seq += 1
+        record["seq"] = self._seq
+        line = (json.dumps(record) + "\n").encode("utf-8")
+        log_path = self.log_path(self.file_path)
+        with open(log_path, "ab") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self._log_records += 1
+        self._log_offset += len(line)
+        self._log_identity = file_identity(log_path)
+        self._remember_files()
+
+    def _replay(self, log_path, offset=0, changes=None):
+        """
+        Apply the records of a mutation log from a byte offset, returns how many changes they held
+
+        Args:
+            changes (list): Collects an (old_row, new_row) pair per changed application, when given
+        """
+        self._log_identity = file_identity(log_path)
+        if self._log_identity is None:
+            return 0
+        count = 0
+        good_bytes = offset
+        with open(log_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A crash mid-append leaves a torn last record; it never happened
+                    break
+                good_bytes += len(line)
+                self._seq = max(self._seq, record["seq"])
+                if record["op"] != "checkpoint":
+                    self._apply(record, changes)
+                    count += 1
+        if good_bytes < os.path.getsize(log_path):
+            with open(log_path, "r+b") as f:
+                f.truncate(good_bytes)
+        self._log_offset = good_bytes
+        return count
+
+    def _apply(self, record, changes=None):
+        """Apply one log record; inserts overwrite, so replaying twice is harmless"""
+        if record["op"] == "insert_many":
+            for values in record["rows"]:
+                self._apply({"op": "insert", "row": dict(zip(record["columns"], values))}, changes)
+            return
+        key = (record["row"]['company'], record["row"]['position']) if record["op"] == "insert" else record["key"]
+        old_row = self.get(*key) if changes is not None else None
+        if record["op"] == "insert":
+            if not self._update_row(*key, record["row"]):
+                self._insert_row(record["row"])
+        elif record["op"] == "update":
+            self._update_row(*key, record["fields"])
+        elif record["op"] == "delete":
+            self._delete_row(*key)
+        if changes is not None:
+            changes.append((old_row, self.get(*key)))
+
+    def replace_all(self, frame):
+        """Replace every application with the rows of a DataFrame"""
+        with self.transaction():
+            self._rebuild(frame)
+            if self.file_path is not None:
+                self.checkpoint()
+
+    def _rebuild(self, frame):
+        # Trackers saved before a column existed get it filled with blanks
+        frame = frame.reindex(columns=TRACKER_COLUMNS).astype(object)
+        frame = frame.where(frame.notna(), "")
+        frame = frame.drop_duplicates(subset=['company', 'position'], keep='first')
+
+        count = len(frame)
+        self._clear(max(self.INITIAL_CAPACITY, 2 * count))
+        for column in TRACKER_COLUMNS:
+            self._columns[column][:count] = frame[column].to_numpy(dtype=object)
+        self._alive[:count] = True
+        self._size = count
+        self._index = dict(zip(zip(frame['company'], frame['position']), range(count)))
+        self._job_ids = {}
+        for slot, job_id in enumerate(frame['job_id']):
+            if job_id:
+                self._job_ids.setdefault(job_id, slot)
+
+    def _row(self, slot):
+        return {column: self._columns[column][slot] for column in TRACKER_COLUMNS}
+
+    def get(self, company, position):
+        """Get an application as a dict, or None"""
+        slot = self._index.get((company, position))
+        return None if slot is None else self._row(slot)
+
+    def get_by_job_id(self, job_id):
+        """Get the application linked to a job posting as a dict, or None"""
+        slot = self._job_ids.get(job_id)
+        return None if slot is None else self._row(slot)
+
+    def insert(self, row):
+        """Add an application, given as a dict of column values; existing ones are left alone"""
+        with self.transaction():
+            if (row['company'], row['position']) in self._index:
+                return
+            row = {column: row.get(column, "") for column in TRACKER_COLUMNS}
+            self._insert_row(row)
+            self._append_log({"op": "insert", "row": row})
+
+    def insert_many(self, frame):
+        """
+        Add applications in bulk, as one log record (or a checkpoint when there are many)
+
+        Args:
+            frame (DataFrame): New applications, all TRACKER_COLUMNS as text and
+                no (company, position) already stored or repeated
+        """
+        with self.transaction():
+            self._insert_many(frame)
+
+    def _insert_many(self, frame):
+        # Another process may have added some of them since the caller looked
+        frame = frame[[key not in self._index for key in zip(frame['company'], frame['position'])]]
+        count = len(frame)
+        while self._size + count > len(self._alive):
+            self._grow()
+        start, end = self._size, self._size + count
+        for column in TRACKER_COLUMNS:
+            self._columns[column][start:end] = frame[column].to_numpy(dtype=object)
+        self._alive[start:end] = True
+        self._size = end
+        self._index.update(zip(zip(frame['company'], frame['position']), range(start, end)))
+        for slot, job_id in zip(range(start, end), frame['job_id']):
+            if job_id:
+                self._job_ids.setdefault(job_id, slot)
+
+        if self.file_path is None or not count:
+            return
+        if self._log_records + count >= self.checkpoint_records:
+            self.checkpoint()
+        else:
+            self._append_log({"op": "insert_many", "columns": TRACKER_COLUMNS,
+                              "rows": frame[TRACKER_COLUMNS].values.tolist()})
+
+    def _insert_row(self, row):
+        if self._size == len(self._alive):
+            self._grow()
+        slot = self._size
+        for column in TRACKER_COLUMNS:
+            self._columns[column][slot] = row.get(column, "")
+        self._alive[slot] = True
+        self._size += 1
+        self._index[(row['company'], row['position'])] = slot
+        if row.get('job_id'):
+            self._job_ids.setdefault(row['job_id'], slot)
+
+    def _grow(self):
+        capacity = 2 * len(self._alive)
+        for column, values in self._columns.items():
+            grown = np.empty(capacity, dtype=object)
+            grown[:self._size] = values[:self._size]
+            self._columns[column] = grown
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self._size] = self._alive[:self._size]
+        self._alive = alive
+
+    def update(self, company, position, fields):
+        """Set columns of an application, returns False when there is none"""
+        with self.transaction():
+            if not self._update_row(company, position, fields):
+                return False
+            self._append_log({"op": "update", "key": [company, position], "fields": fields})
+        return True
+
+    def _update_row(self, company, position, fields):
+        slot = self._index.get((company, position))
+        if slot is None:
+            return False
+        for column, value in fields.items():
+            if column in ('company', 'position'):
+                continue
+            if column == 'job_id':
+                if self._job_ids.get(self._columns['job_id'][slot]) == slot:
+                    del self._job_ids[self._columns['job_id'][slot]]
+                if value:
+                    self._job_ids.setdefault(value, slot)
+            self._columns[column][slot] = value
+        return True
+
+    def delete(self, company, position):
+        """Delete an application, returns False when there is none"""
+        with self.transaction():
+            if not self._delete_row(company, position):
+                return False
+            self._append_log({"op": "delete", "key": [company, position]})
+        return True
+
+    def _delete_row(self, company, position):
+        slot = self._index.pop((company, position), None)
+        if slot is None:
+            return False
+        job_id = self._columns['job_id'][slot]
+        if self._job_ids.get(job_id) == slot:
+            del self._job_ids[job_id]
+        self._alive[slot] = False
+        for column in TRACKER_COLUMNS:
+            self._columns[column][slot] = None
+        self._deleted += 1
+        if self._deleted > self.INITIAL_CAPACITY and self._deleted * 2 > self._size:
+            self._rebuild(self.all())
+        return True
+
+    def count(self):
+        """Number of applications"""
+        return self._size - self._deleted
+
+    def keys(self):
+        """(company, position) of every application as a DataFrame"""
+        mask = self._alive[:self._size]
+        return pd.DataFrame({column: self._columns[column][:self._size][mask] for column in ('company', 'position')},
+                            columns=['company', 'position'])
+
+    def all(self, status=None, columns=None):
+        """All applications as a DataFrame, optionally filtered by status and limited to some columns"""
+        columns = columns or TRACKER_COLUMNS
+        mask = self._alive[:self._size]
+        if status:
+            mask = mask & (self._columns['status'][:self._size] == status)
+        return pd.DataFrame({column: self._columns[column][:self._size][mask] for column in columns},
+                            columns=columns)
+
+    def add_event(self, company, position, kind, body):
+        """Add to an application's history (call inside transaction())"""
+        self._events.append(new_event(company, position, kind, body))
+
+    def add_events(self, events):
+        """Add event dicts (see new_event) in one write (call inside transaction())"""
+        self._events.append_many(events)
+
+    def history(self, company, position, limit=20, offset=0):
+        """A page of an application's events (occurred_at, kind, body), newest first"""
+        return self._events.history(company, position, limit, offset)
+
+    def history_count(self, company, position):
+        """Number of events in an application's history"""
+        return self._events.count(company, position)
+
+    def clear_history(self, company, position):
+        """Forget an application's history (call inside transaction())"""
+        self._events.clear(company, position)
+
+    def close(self):
+        pass
+
+
+class SqliteTrackerStorage:
+    """
+    Applications stored in an SQLite database
+
+    Lookups go through the UNIQUE (company, position) index and the indexes
+    on status, follow_up_date and job_id, and every change is its own
+    transaction, so nothing is rewritten as the tracker grows and
+    save() has nothing left to do. Transactions start with BEGIN IMMEDIATE,
+    taking the database write lock before anything is read, so concurrent
+    read-modify-writes from other processes queue up instead of failing
+    or overwriting each other, while WAL readers carry on: other threads
+    read through a second, read-only connection, so they never queue behind
+    a write transaction, or one waiting for the write lock. Triggers note
+    every change (without notes) in application_changes, for the other
+    connections to catch up from. Each application's history is a row per
+    event in application_events, paged through its (company, position, id) index.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS applications (
+            id INTEGER PRIMARY KEY,
+            company TEXT NOT NULL,
+            position TEXT NOT NULL,
+            date_applied TEXT,
+            status TEXT,
+            follow_up_date TEXT,
+            last_contact_date TEXT,
+            contact_person TEXT,
+            contact_email TEXT,
+            notes TEXT,
+            job_id TEXT,
+            UNIQUE (company, position)
+        );
+        CREATE INDEX IF NOT EXISTS idx_applications_status ON applications (status);
+        CREATE INDEX IF NOT EXISTS idx_applications_follow_up ON applications (follow_up_date);
+        CREATE INDEX IF NOT EXISTS idx_applications_job_id ON applications (job_id);
+        CREATE TABLE IF NOT EXISTS application_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            old_row TEXT,
+            new_row TEXT
+        );
+        CREATE TRIGGER IF NOT EXISTS applications_inserted AFTER INSERT ON applications BEGIN
+            INSERT INTO application_changes (old_row, new_row) VALUES (NULL, {new});
+        END;
+        CREATE TRIGGER IF NOT EXISTS applications_updated AFTER UPDATE ON applications BEGIN
+            INSERT INTO application_changes (old_row, new_row) VALUES ({old}, {new});
+        END;
+        CREATE TRIGGER IF NOT EXISTS applications_deleted AFTER DELETE ON applications BEGIN
+            INSERT INTO application_changes (old_row, new_row) VALUES ({old}, NULL);
+        END;
+        CREATE TABLE IF NOT EXISTS application_events (
+            id INTEGER PRIMARY KEY,
+            company TEXT NOT NULL,
+            position TEXT NOT NULL,
+            occurred_at TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            body TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_application_events_application
+            ON application_events (company, position, id);
+    """.format(
+        old="json_object(" + ", ".join(f"'{column}', OLD.{column}" for column in SUMMARY_COLUMNS) + ")",
+        new="json_object(" + ", ".join(f"'{column}', NEW.{column}" for column in SUMMARY_COLUMNS) + ")",
+    )
+
+    # Changes kept for other connections to catch up from; one further behind reloads
+    CHANGE_HISTORY = 10000
+
+    # How long to wait for another connection's write transaction
+    BUSY_TIMEOUT_MS = 30000
+
+    def __init__(self):
+        self.file_path = None
+        self._conn = None
+        self._reader = None
+        self._data_version = None
+        self._change_seq = 0
+        self._depth = 0
+        self._owner = None
+        # _lock guards the write connection, _read_lock the read connection
+        self._lock = threading.RLock()
+        self._read_lock = threading.Lock()
+        self.lock_stats = LockStats()
+
+    def load(self, file_path):
+        """Open (creating if needed) the database at file_path"""
+        with self._lock:
+            self.close()
+            directory = os.path.dirname(file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Streamlit reruns a session's script on different threads
+            self._conn = sqlite3.connect(file_path, check_same_thread=False,
+                                         timeout=self.BUSY_TIMEOUT_MS / 1000)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+            self._reader = sqlite3.connect(f"file:{file_path}?mode=ro", uri=True, check_same_thread=False,
+                                           timeout=self.BUSY_TIMEOUT_MS / 1000)
+            self._reader.row_factory = sqlite3.Row
+            self.file_path = file_path
+            self._depth = 0
+            self._owner = None
+            self._data_version = self._execute("PRAGMA data_version")[0][0]
+            self._change_seq = self._last_change()
+
+    def _last_change(self):
+        return self._execute("SELECT COALESCE(MAX(seq), 0) FROM application_changes")[0][0]
+
+    def is_stale(self, file_path):
+        """Whether another connection committed changes to the applications since this one last looked"""
+        if self._conn is None or os.path.abspath(file_path) != os.path.abspath(self.file_path):
+            return True
+        # On the read connection, so checking never waits for a writer
+        return self._query("SELECT COALESCE(MAX(seq), 0) FROM application_changes")[0][0] != self._change_seq
+
+    def refresh(self):
+        """
+        Collect the changes other connections committed since this one last looked
+
+        Returns:
+            list: (old_row, new_row) for each changed application, without
+            notes, or None when they are too many or too far back to replay
+        """
+        with self._lock:
+            data_version = self._execute("PRAGMA data_version")[0][0]
+            if data_version == self._data_version:
+                return []
+            self._data_version = data_version
+            rows = self._execute("SELECT seq, old_row, new_row FROM application_changes WHERE seq > ? ORDER BY seq",
+                                 (self._change_seq,))
+            if not rows:
+                return []
+            last_seen, self._change_seq = self._change_seq, rows[-1]["seq"]
+            if rows[0]["seq"] != last_seen + 1:
+                # Pruned before we saw them
+                return None
+            changes = []
+            for row in rows:
+                if row["old_row"] is None and row["new_row"] is None:
+                    # replace_all() marker
+                    return None
+                changes.append((json.loads(row["old_row"]) if row["old_row"] else None,
+                                json.loads(row["new_row"]) if row["new_row"] else None))
+            return changes
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run the enclosed changes as one write transaction
+
+        Yields:
+            list: (old_row, new_row) for each application other connections
+            changed since this one last looked, or None if they cannot be listed
+        """
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield []
+                finally:
+                    self._depth -= 1
+                return
+            self._begin_immediate()
+            self._depth = 1
+            self._owner = threading.get_ident()
+            try:
+                yield self.refresh()
+                # Our own changes are already in our views
+                first_seq, self._change_seq = self._change_seq, self._last_change()
+                if first_seq // self.CHANGE_HISTORY != self._change_seq // self.CHANGE_HISTORY:
+                    self._conn.execute("DELETE FROM application_changes WHERE seq <= ?",
+                                       (self._change_seq - self.CHANGE_HISTORY,))
+            except BaseException:
+                self._depth = 0
+                self._owner = None
+                self._conn.rollback()
+                raise
+            self._depth = 0
+            self._owner = None
+            self._conn.commit()
+
+    def _begin_immediate(self):
+        started = time.perf_counter()
+        contended = False
+        # Try without waiting first, to tell whether another connection holds the write lock
+        self._conn.execute("PRAGMA busy_timeout = 0")
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.OperationalError as e:
+            if "locked" not in str(e) and "busy" not in str(e):
+                raise
+            contended = True
+            self._conn.execute(f"PRAGMA busy_timeout = {self.BUSY_TIMEOUT_MS}")
+            self._conn.execute("BEGIN IMMEDIATE")
+        finally:
+            self._conn.execute(f"PRAGMA busy_timeout = {self.BUSY_TIMEOUT_MS}")
+        self.lock_stats.record(time.perf_counter() - started, contended)
+
+    def save(self, file_path):
+        """Changes are committed as they happen; other paths get an export"""
+        if self._conn is None:
+            raise RuntimeError("The SQLite tracker is not loaded")
+        if os.path.abspath(file_path) == os.path.abspath(self.file_path):
+            return
+        if is_sqlite_path(file_path):
+            with self._lock:
+                target = sqlite3.connect(file_path)
+                self._conn.backup(target)
+                target.close()
+        else:
+            os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+            self.all().to_csv(file_path, index=False)
+
+    def _execute(self, sql, params=()):
+        """Run a statement on the write connection"""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    @contextmanager
+    def _reading(self):
+        """
+        The connection to read from: the write connection for the thread in a
+        write transaction (it must see its own changes), the read-only one otherwise
+        """
+        if self._owner == threading.get_ident():
+            with self._lock:
+                yield self._conn
+        else:
+            with self._read_lock:
+                yield self._reader
+
+    def _query(self, sql, params=()):
+        with self._reading() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def _frame(self, sql, params=(), columns=TRACKER_COLUMNS):
+        with self._reading() as conn:
+            frame = pd.read_sql_query(sql, conn, params=params)
+        return frame[columns] if not frame.empty else pd.DataFrame(columns=columns)
+
+    def _row_dict(self, rows):
+        return {column: rows[0][column] for column in TRACKER_COLUMNS} if rows else None
+
+    def get(self, company, position):
+        """Get an application as a dict, or None"""
+        return self._row_dict(self._query(
+            "SELECT * FROM applications WHERE company = ? AND position = ?", (company, position)
+        ))
+
+    def get_by_job_id(self, job_id):
+        """Get the application linked to a job posting as a dict, or None"""
+        return self._row_dict(self._query("SELECT * FROM applications WHERE job_id = ? LIMIT 1", (job_id,)))
+
+    def insert(self, row):
+        """Add an application, given as a dict of column values"""
+        with self.transaction():
+            self._conn.execute(
+                f"INSERT OR IGNORE INTO applications ({', '.join(TRACKER_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(TRACKER_COLUMNS))})",
+                [row.get(column, "") for column in TRACKER_COLUMNS]
+            )
+
+    def insert_many(self, frame):
+        """Add applications in bulk in one transaction; existing ones are left alone"""
+        with self.transaction():
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO applications ({', '.join(TRACKER_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(TRACKER_COLUMNS))})",
+                frame[TRACKER_COLUMNS].itertuples(index=False, name=None)
+            )
+
+    def update(self, company, position, fields):
+        """Set columns of an application in one transaction, returns False when there is none"""
+        if not fields:
+            return self.get(company, position) is not None
+        columns = [column for column in fields if column in TRACKER_COLUMNS]
+        with self.transaction():
+            cursor = self._conn.execute(
+                f"UPDATE applications SET {', '.join(f'{column} = ?' for column in columns)} "
+                f"WHERE company = ? AND position = ?",
+                [fields[column] for column in columns] + [company, position]
+            )
+        return cursor.rowcount > 0
+
+    def delete(self, company, position):
+        """Delete an application, returns False when there is none"""
+        with self.transaction():
+            cursor = self._conn.execute(
+                "DELETE FROM applications WHERE company = ? AND position = ?", (company, position)
+            )
+        return cursor.rowcount > 0
+
+    def replace_all(self, frame):
+        """Replace every application with the rows of a DataFrame in one transaction"""
+        rows = frame.reindex(columns=TRACKER_COLUMNS).astype(object)
+        rows = rows.where(rows.notna(), "")
+        with self.transaction():
+            first_seq = self._last_change()
+            self._conn.execute("DELETE FROM applications")
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO applications ({', '.join(TRACKER_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(TRACKER_COLUMNS))})",
+                rows.itertuples(index=False, name=None)
+            )
+            # Other connections reload rather than replay every row
+            self._conn.execute("DELETE FROM application_changes WHERE seq > ?", (first_seq,))
+            self._conn.execute("INSERT INTO application_changes (old_row, new_row) VALUES (NULL, NULL)")
+
+    def count(self):
+        """Number of applications"""
+        return self._query("SELECT COUNT(*) FROM applications")[0][0]
+
+    def keys(self):
+        """(company, position) of every application as a DataFrame"""
+        with self._reading() as conn:
+            return pd.read_sql_query("SELECT company, position FROM applications ORDER BY id", conn)
+
+    def all(self, status=None, columns=None):
+        """All applications as a DataFrame, optionally filtered by status and limited to some columns"""
+        columns = columns or TRACKER_COLUMNS
+        selected = ", ".join(column for column in columns if column in TRACKER_COLUMNS)
+        if status:
+            return self._frame(f"SELECT {selected} FROM applications WHERE status = ? ORDER BY id",
+                               (status,), columns)
+        return self._frame(f"SELECT {selected} FROM applications ORDER BY id", columns=columns)
+
+    def add_event(self, company, position, kind, body):
+        """Add to an application's history"""
+        self.add_events([new_event(company, position, kind, body)])
+
+    def add_events(self, events):
+        """Add event dicts (see new_event) in one transaction"""
+        with self.transaction():
+            self._conn.executemany(
+                "INSERT INTO application_events (company, position, occurred_at, kind, body) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ((event['company'], event['position'], event['occurred_at'], event['kind'], event['body'])
+                 for event in events)
+            )
+
+    def history(self, company, position, limit=20, offset=0):
+        """A page of an application's events (occurred_at, kind, body), newest first"""
+        rows = self._query(
+            "SELECT company, position, occurred_at, kind, body FROM application_events "
+            "WHERE company = ? AND position = ? ORDER BY id DESC LIMIT ? OFFSET ?",
+            (company, position, limit, offset)
+        )
+        return [dict(row) for row in rows]
+
+    def history_count(self, company, position):
+        """Number of events in an application's history"""
+        return self._query("SELECT COUNT(*) FROM application_events WHERE company = ? AND position = ?",
+                           (company, position))[0][0]
+
+    def clear_history(self, company, position):
+        """Forget an application's history"""
+        with self.transaction():
+            self._conn.execute("DELETE FROM application_events WHERE company = ? AND position = ?",
+                               (company, position))
+
+    def close(self):
+        with self._lock, self._read_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
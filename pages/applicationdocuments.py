@@ -4,6 +4,7 @@ import json
 import tempfile
 from datetime import datetime
 
+from config import TRACKER_FILE
 from utils.helpers import ensure_directory_exists, save_text_to_file
 
 def show_documents_page():
@@ -124,7 +125,7 @@ def show_documents_page():
                 if st.button("Track This Application"):
                     try:
                         # Load tracker
-                        st.session_state.automator.load_application_tracker("data/application_tracker.csv")
+                        st.session_state.automator.load_application_tracker(TRACKER_FILE)
                     except:
                         pass
                         
@@ -132,7 +133,7 @@ def show_documents_page():
                     st.session_state.automator.track_application(company_name, position_title)
                     
                     # Save tracker
-                    st.session_state.automator.save_application_tracker("data/application_tracker.csv")
+                    st.session_state.automator.save_application_tracker(TRACKER_FILE)
                     st.success(f"Application for {position_title} at {company_name} tracked successfully.")
         
         # Tailored Resume tab
@@ -1,4 +1,5 @@
 import streamlit as st
+import io
 import os
 from datetime import datetime
 import sys
@@ -7,7 +8,13 @@ import sys
 if not any(p.endswith('job_track') for p in sys.path):
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import APP_STATUS
+from config import APP_STATUS, TRACKER_FILE
+from core.trackerstorage import SUMMARY_COLUMNS
+
+# Events of an application's history shown at a time
+HISTORY_PAGE_SIZE = 10
+
+EVENT_LABELS = {"status": "Status", "contact": "Contact", "note": "Note", "follow_up": "Follow-up"}
 
 def show_tracker_page():
     """Display the application tracker page"""
@@ -15,12 +22,12 @@ def show_tracker_page():
     
     # Initialize tracker if needed
     try:
-        st.session_state.automator.load_application_tracker("data/application_tracker.csv")
-        applications = st.session_state.automator.application_tracker.get_all_applications()
+        st.session_state.automator.load_application_tracker(TRACKER_FILE)
+        applications = st.session_state.automator.application_tracker.get_all_applications(columns=SUMMARY_COLUMNS)
     except Exception as e:
         # If file doesn't exist yet, create an empty tracker
-        st.session_state.automator.application_tracker.save_tracker("data/application_tracker.csv")
-        applications = st.session_state.automator.application_tracker.get_all_applications()
+        st.session_state.automator.application_tracker.save_tracker(TRACKER_FILE)
+        applications = st.session_state.automator.application_tracker.get_all_applications(columns=SUMMARY_COLUMNS)
     
     # Add new application form
     with st.expander("Add New Application"):
@@ -42,10 +49,35 @@ def show_tracker_page():
                 st.session_state.automator.track_application(new_company, new_position, new_status, new_notes)
                 
                 # Save tracker
-                st.session_state.automator.save_application_tracker("data/application_tracker.csv")
+                st.session_state.automator.save_application_tracker(TRACKER_FILE)
                 st.success(f"Application for {new_position} at {new_company} tracked successfully.")
                 st.rerun()
     
+    # Bulk import and export
+    with st.expander("Import / Export Applications"):
+        uploaded = st.file_uploader("Import from CSV, JSON or JSON Lines", type=["csv", "json", "jsonl"])
+        if uploaded is not None and st.button("Import Applications"):
+            imported = st.session_state.automator.application_tracker.import_applications(uploaded)
+            st.session_state.automator.save_application_tracker(TRACKER_FILE)
+            st.success(f"Imported {imported} new applications.")
+            st.rerun()
+        
+        export_format = st.selectbox("Export Format", ["csv", "json", "jsonl"])
+        # The expander body runs on every rerun, so only write the applications out when asked
+        if st.button("Prepare Export"):
+            buffer = io.StringIO()
+            st.session_state.automator.application_tracker.export_applications(buffer, format=export_format)
+            st.session_state.tracker_export = {"format": export_format, "data": buffer.getvalue()}
+
+        export = st.session_state.get("tracker_export")
+        if export and export["format"] == export_format:
+            st.download_button(
+                label="Download Applications",
+                data=export["data"],
+                file_name=f"applications_{datetime.now().strftime('%Y%m%d')}.{export_format}",
+                mime="application/json" if export_format != "csv" else "text/csv"
+            )
+    
     # Display applications
     if not applications.empty:
         # Filter by status
@@ -93,9 +125,9 @@ def show_tracker_page():
                     if app['contact_email']:
                         st.markdown(f"**Email:** {app['contact_email']}")
                     
-                    if app['notes']:
-                        st.markdown("**Notes:**")
-                        st.text_area("", app['notes'], key=f"notes_{i}", height=100, disabled=True)
+                    # Notes and history are only read once asked for
+                    if st.checkbox("Show History", key=f"history_{i}"):
+                        show_application_history(app, i)
                 
                 with col2:
                     # Update status
@@ -107,7 +139,7 @@ def show_tracker_page():
                         st.session_state.automator.application_tracker.update_application(
                             app['company'], app['position'], status=new_status
                         )
-                        st.session_state.automator.save_application_tracker("data/application_tracker.csv")
+                        st.session_state.automator.save_application_tracker(TRACKER_FILE)
                         st.success("Status updated!")
                         st.rerun()
                     
@@ -124,7 +156,7 @@ def show_tracker_page():
                         if st.session_state.automator.application_tracker.delete_application(
                             app['company'], app['position']
                         ):
-                            st.session_state.automator.save_application_tracker("data/application_tracker.csv")
+                            st.session_state.automator.save_application_tracker(TRACKER_FILE)
                             st.success("Application deleted!")
                             st.rerun()
     else:
@@ -142,11 +174,38 @@ def show_tracker_page():
                  "notes": "Sent follow-up email on " + datetime.now().strftime("%Y-%m-%d")},
             ]
             
-            for sample in samples:
-                st.session_state.automator.track_application(
-                    sample["company"], sample["position"], sample["status"], sample["notes"]
-                )
+            st.session_state.automator.application_tracker.import_applications(samples)
             
-            st.session_state.automator.save_application_tracker("data/application_tracker.csv")
+            st.session_state.automator.save_application_tracker(TRACKER_FILE)
             st.success("Sample applications added!")
             st.rerun()
+
+
+def show_application_history(app, i):
+    """Display an application's notes and history, a page at a time"""
+    tracker = st.session_state.automator.application_tracker
+    company, position = app['company'], app['position']
+    
+    application = tracker.get_application(company, position)
+    if application and application['notes']:
+        st.markdown("**Notes:**")
+        st.text_area("", application['notes'], key=f"notes_{i}", height=100, disabled=True)
+    
+    new_note = st.text_input("Add a note", key=f"new_note_{i}")
+    if st.button("Add Note", key=f"add_note_{i}") and new_note:
+        tracker.update_application(company, position, notes=new_note)
+        st.session_state.automator.save_application_tracker(TRACKER_FILE)
+        st.rerun()
+    
+    shown_key = f"history_shown_{company}_{position}"
+    shown = st.session_state.get(shown_key, HISTORY_PAGE_SIZE)
+    events = tracker.get_application_history(company, position, limit=shown)
+    if not events:
+        st.caption("No history yet.")
+    for event in events:
+        st.markdown(f"`{event['occurred_at']}` **{EVENT_LABELS.get(event['kind'], event['kind'])}:** {event['body']}")
+    
+    total = tracker.count_application_history(company, position)
+    if total > shown and st.button(f"Show Older ({total - shown} more)", key=f"history_more_{i}"):
+        st.session_state[shown_key] = shown + HISTORY_PAGE_SIZE
+        st.rerun()
@@ -3,6 +3,7 @@ import os
 import pandas as pd
 from datetime import datetime
 
+from config import TRACKER_FILE
 from utils.helpers import ensure_directory_exists, save_text_to_file
 
 def show_followup_page():
@@ -11,11 +12,11 @@ def show_followup_page():
     
     # Check for due follow-ups
     try:
-        st.session_state.automator.load_application_tracker("data/application_tracker.csv")
+        st.session_state.automator.load_application_tracker(TRACKER_FILE)
         due_followups = st.session_state.automator.get_due_follow_ups()
     except:
         # If file doesn't exist yet, create an empty tracker
-        st.session_state.automator.application_tracker.save_tracker("data/application_tracker.csv")
+        st.session_state.automator.application_tracker.save_tracker(TRACKER_FILE)
         due_followups = pd.DataFrame()
     
     # Display due follow-ups
@@ -36,6 +37,15 @@ def show_followup_page():
                     st.session_state.selected_company = app['company']
                     st.session_state.selected_position = app['position']
                     st.rerun()
+
+    # Follow-ups coming up this week
+    try:
+        upcoming = st.session_state.automator.get_upcoming_follow_ups(7)
+    except Exception:
+        upcoming = pd.DataFrame()
+    if not upcoming.empty:
+        with st.expander(f"Coming Up This Week ({len(upcoming)})"):
+            st.dataframe(upcoming[['company', 'position', 'date_applied', 'follow_up_date']])
     
     # Generate follow-up form
     st.subheader("Generate Follow-up Email")
@@ -102,7 +112,7 @@ def show_followup_page():
                 last_contact_date=datetime.now().strftime("%Y-%m-%d"),
                 notes=f"Follow-up email sent on {datetime.now().strftime('%Y-%m-%d')}"
             )
-            st.session_state.automator.save_application_tracker("data/application_tracker.csv")
+            st.session_state.automator.save_application_tracker(TRACKER_FILE)
             st.success("Application status updated to 'Follow-up Sent'")
             
             # Clear the form
@@ -1,6 +1,8 @@
 import streamlit as st
 import os
 import pandas as pd
+from config import TRACKER_FILE
+from core.savedsearches import get_default_watcher
 
 def show_home_page():
     """Display the home page with system overview and status"""
@@ -31,45 +33,42 @@ def show_home_page():
     with col1:
         st.info(f"API Key: {'✅ Configured' if api_key else '❌ Not Configured'}")
         st.info(f"Resume: {'✅ Loaded' if st.session_state.resume_loaded else '❌ Not Loaded'}")
+        
+        # Counts are kept by the saved search watcher, nothing is searched here
+        new_postings = get_default_watcher().store.total_new_count()
+        if new_postings:
+            st.success(f"Saved Searches: {new_postings} new postings - see the Job Search page")
+    
+    # Read the tracker through its storage backend, CSV or SQLite
+    st.session_state.automator.load_application_tracker(TRACKER_FILE)
+    stats = st.session_state.automator.application_tracker.get_application_statistics()
+    status_counts = stats['status_counts']
     
     with col2:
-        if os.path.exists(os.path.join("data", "application_tracker.csv")):
-            try:
-                df = pd.read_csv(os.path.join("data", "application_tracker.csv"))
-                st.info(f"Applications Tracked: {len(df)}")
-                st.info(f"Applications Pending Follow-up: {len(df[df['status'] == 'Applied'])}")
-            except:
-                st.info("Applications Tracked: 0")
-                st.info("Applications Pending Follow-up: 0")
-        else:
-            st.info("Applications Tracked: 0")
-            st.info("Applications Pending Follow-up: 0")
+        st.info(f"Applications Tracked: {stats['total_applications']}")
+        st.info(f"Applications Pending Follow-up: {status_counts.get('Applied', 0)}")
             
     # Quick stats if there's tracked data
-    if os.path.exists(os.path.join("data", "application_tracker.csv")):
+    if stats['total_applications'] > 0:
         try:
-            df = pd.read_csv(os.path.join("data", "application_tracker.csv"))
-            if not df.empty:
-                st.subheader("Application Summary")
-                
-                # Statistics
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Total Applications", len(df))
-                with col2:
-                    status_counts = df['status'].value_counts().to_dict()
-                    interview_count = status_counts.get('Interview Scheduled', 0)
-                    st.metric("Interviews", interview_count)
-                with col3:
-                    offer_count = status_counts.get('Offer Received', 0) + status_counts.get('Offer Accepted', 0)
-                    st.metric("Offers", offer_count)
-                
-                # Status breakdown
-                st.subheader("Application Status")
-                status_df = pd.DataFrame(df['status'].value_counts()).reset_index()
-                status_df.columns = ['Status', 'Count']
-                
-                # Simple bar chart for status
-                st.bar_chart(data=status_df, x='Status', y='Count')
+            st.subheader("Application Summary")
+            
+            # Statistics
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Applications", stats['total_applications'])
+            with col2:
+                interview_count = status_counts.get('Interview Scheduled', 0)
+                st.metric("Interviews", interview_count)
+            with col3:
+                offer_count = status_counts.get('Offer Received', 0) + status_counts.get('Offer Accepted', 0)
+                st.metric("Offers", offer_count)
+            
+            # Status breakdown
+            st.subheader("Application Status")
+            status_df = pd.DataFrame(list(status_counts.items()), columns=['Status', 'Count'])
+            
+            # Simple bar chart for status
+            st.bar_chart(data=status_df, x='Status', y='Count')
         except Exception as e:
             st.error(f"Error loading application data: {str(e)}")
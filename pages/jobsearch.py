@@ -1,9 +1,21 @@
 import streamlit as st
 import os
-import json
-from datetime import datetime
-from core.jobsearch import GoogleJobsSearch, SimulatedJobSearch
-from utils.helpers import ensure_directory_exists, save_text_to_file
+from itertools import islice
+from config import TRACKER_FILE
+from core.fetchscheduler import get_default_scheduler
+from core.jobhistory import get_default_history_index
+from core.jobsearch import SimulatedJobSearch
+from core.jobposting import compact_results
+from core.jobsearchfactory import JobSearchFactory
+from core.savedsearches import get_default_watcher
+
+def format_cache_age(seconds):
+    """Describe the age of a cached search in words"""
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    if seconds < 3600:
+        return f"{int(seconds // 60)} min"
+    return f"{seconds / 3600:.1f} h"
 
 def show_job_search_page():
     """Display the job search page"""
@@ -14,46 +26,110 @@ def show_job_search_page():
     col1, col2, col3 = st.columns([2, 2, 1])
     
     with col1:
-        search_query = st.text_input("Job Title or Keywords", "Software Engineer")
+        search_query = st.text_input("Job Title or Keywords", "Software Engineer",
+                                     help="Separate several titles with ';' to search them all at once")
     
     with col2:
-        location = st.text_input("Location", "Remote")
+        location = st.text_input("Location", "Remote",
+                                 help="Separate several locations with ';' to search them all at once")
     
     with col3:
         num_results = st.number_input("Results", min_value=1, max_value=50, value=10)
     
-    # Search source selector
+    # Search source selector, built from the registered job search sources
+    source_labels = {"all": "All Sources"}
+    source_labels.update(JobSearchFactory.available_sources())
+    source_labels["history"] = "My Saved Jobs (Offline)"
     search_source = st.radio(
         "Search Source",
-        ["I will be adding (LinkedIn/Indeed)API in future", "Simulated (Demo)"],
+        list(source_labels),
+        format_func=source_labels.get,
         horizontal=True
     )
     
-    if st.button("Search Jobs"):
+    col1, col2 = st.columns([1, 4])
+    with col1:
+        search_clicked = st.button("Search Jobs")
+    with col2:
+        # Saved searches are rerun in the background and report only new postings
+        if search_source != "history" and st.button("Save This Search"):
+            saved = get_default_watcher().store.add(search_query, location, search_source, num_results)
+            st.success(f"Saved '{saved['query']}'. New postings will show up on the home page.")
+
+    if search_clicked and search_source == "history":
+        # Answer from the local index of previously saved postings, no network needed
+        history_index = get_default_history_index()
+        history_index.backfill()
+        st.session_state.search_results = compact_results(history_index.search(search_query, location, num_results))
+        st.session_state.search_stream = None
+    elif search_clicked:
         with st.spinner("Searching for jobs..."):
-            # Convert the search source to the appropriate search type
             # Choose which search implementation to use based on selection
-            if search_source == "Google Jobs":
-                job_search = GoogleJobsSearch()
-            else:
-               job_search = SimulatedJobSearch()
+            job_search = JobSearchFactory.create_job_search(search_source)
+            st.session_state.job_search = job_search
 
-            # Use the job search implementation directly
-            results = job_search.search_jobs(search_query, location, num_results)
+            # Fan out over every query/location combination when several are given
+            queries = [q.strip() for q in search_query.split(";") if q.strip()]
+            locations = [l.strip() for l in location.split(";") if l.strip()]
             
-            st.session_state.search_results = results
+            if len(queries) > 1 or len(locations) > 1:
+                results = job_search.search_many(queries, locations, num_results)
+                st.session_state.search_stream = None
+            else:
+                # Use the job search implementation directly
+                results = job_search.search_jobs(search_query, location, num_results)
+                
+                # Later pages are only fetched when "Load More" is clicked
+                st.session_state.search_stream = job_search.iter_jobs(
+                    search_query, location, num_results, start_page=1
+                )
+            
+            # Flag postings that earlier searches already found
+            job_search.mark_seen(results)
+            
+            # Save results to the search history and index them for offline history search
+            job_search.save_search_results(results, query=search_query, location=location)
             
-            # Save results to file
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"job_search_{timestamp}.json"
-            file_path = os.path.join("data", "job_listings", filename)
-            ensure_directory_exists(os.path.dirname(file_path))
-            save_text_to_file(json.dumps(results, indent=2), file_path)
+            # Keep compact postings in the session, they are converted back to dicts only for JSON
+            st.session_state.search_results = compact_results(results)
     
     # Display search results
     if 'search_results' in st.session_state and st.session_state.search_results:
         st.subheader(f"Found {len(st.session_state.search_results['results'])} Jobs")
         
+        # Tell the user when the results were served from the cache
+        cache_info = st.session_state.search_results.get('cache')
+        if cache_info and cache_info.get('hit'):
+            revalidated = " (confirmed unchanged by the source)" if cache_info.get('revalidated') else ""
+            st.caption(f"Served from cache, {format_cache_age(cache_info['age_seconds'])} old{revalidated}")
+        
+        # Sources that failed or missed the deadline in an all-sources search
+        for name, source_status in st.session_state.search_results.get('sources', {}).items():
+            if source_status['status'] == "timeout":
+                st.caption(f"{name}: no response within the time limit, showing the other sources")
+            elif source_status['status'] == "error":
+                st.caption(f"{name}: failed ({source_status.get('error', 'unknown error')})")
+        
+        # Per-query timings for multi-query searches
+        if st.session_state.search_results.get('timings'):
+            with st.expander(f"Searched {len(st.session_state.search_results['timings'])} combinations "
+                             f"in {st.session_state.search_results['elapsed']}s"):
+                st.dataframe(st.session_state.search_results['timings'])
+        
+        # Fetch full descriptions, requirements and salaries for the listings
+        if st.button("Fetch Full Details"):
+            progress = st.progress(0.0)
+            status = st.empty()
+            
+            def report_progress(completed, total, job):
+                progress.progress(completed / total)
+                status.caption(f"Enriched {completed} of {total}: {job['title']} at {job['company']}")
+            
+            job_search = st.session_state.get('job_search') or SimulatedJobSearch()
+            st.session_state.search_results = compact_results(job_search.enrich_results(
+                st.session_state.search_results, progress_callback=report_progress
+            ))
+        
         # Allow sorting options
         sort_option = st.selectbox(
             "Sort by",
@@ -71,7 +147,8 @@ def show_job_search_page():
         
         # Display jobs
         for i, job in enumerate(results):
-            with st.expander(f"{job['title']} at {job['company']} - {job['location']}"):
+            new_badge = "" if job.get('seen_before', True) else "🆕 "
+            with st.expander(f"{new_badge}{job['title']} at {job['company']} - {job['location']}"):
                 col1, col2 = st.columns([3, 1])
                 
                 with col1:
@@ -84,7 +161,7 @@ def show_job_search_page():
                         st.markdown(f"**Salary Range:** {job['salary_range']}")
                     
                     st.markdown("### Description")
-                    st.write(job['description'])
+                    st.write(job.get('full_description') or job['description'])
                     
                     if 'requirements' in job and job['requirements']:
                         st.markdown("### Requirements")
@@ -107,10 +184,14 @@ def show_job_search_page():
                                 st.session_state.job_description = job['description']
                                 if 'requirements' in job and job['requirements']:
                                     st.session_state.job_description += "\n\nRequirements:\n" + "\n".join([f"- {req}" for req in job['requirements']])
-                                    
-                                st.session_state.job_analysis = st.session_state.automator.analyze_job_description(
-                                    st.session_state.job_description
-                                )
+                                
+                                # Reuse the analysis when the same posting was already analyzed
+                                job_analyses = st.session_state.setdefault('job_analyses', {})
+                                if job['job_id'] not in job_analyses:
+                                    job_analyses[job['job_id']] = st.session_state.automator.analyze_job_description(
+                                        st.session_state.job_description
+                                    )
+                                st.session_state.job_analysis = job_analyses[job['job_id']]
                                 
                                 # Store company and job title for use in document generation
                                 st.session_state.company_name = job['company']
@@ -121,18 +202,74 @@ def show_job_search_page():
                     if st.button("Track Application", key=f"track_{i}"):
                         # Load application tracker
                         try:
-                            st.session_state.automator.load_application_tracker("data/application_tracker.csv")
+                            st.session_state.automator.load_application_tracker(TRACKER_FILE)
                         except:
                             # If file doesn't exist yet, that's fine
                             pass
                             
                         # Track application
-                        st.session_state.automator.track_application(job['company'], job['title'])
+                        st.session_state.automator.track_application(
+                            job['company'], job['title'], job_id=job.get('job_id', "")
+                        )
                         
                         # Save tracker
-                        st.session_state.automator.save_application_tracker("data/application_tracker.csv")
+                        st.session_state.automator.save_application_tracker(TRACKER_FILE)
                         st.success(f"Application for {job['title']} at {job['company']} tracked successfully.")
     
+        # Load the next page of results on demand
+        if st.session_state.get('search_stream') is not None and st.button("Load More"):
+            with st.spinner("Loading more jobs..."):
+                more = list(islice(st.session_state.search_stream, num_results))
+            if more:
+                # Pages can overlap when the listings shift, skip postings already shown
+                shown = st.session_state.search_results['results']
+                shown_ids = {job.get('job_id') for job in shown}
+                new_jobs = []
+                for job in more:
+                    if not job.get('job_id') or job['job_id'] not in shown_ids:
+                        shown_ids.add(job.get('job_id'))
+                        new_jobs.append(job)
+                if new_jobs:
+                    job_search = st.session_state.get('job_search') or SimulatedJobSearch()
+                    job_search.mark_seen({"results": new_jobs})
+                    shown.extend(compact_results({"results": new_jobs})['results'])
+                st.rerun()
+            else:
+                st.session_state.search_stream = None
+                st.info("No more results for this search.")
+    
+    # Saved searches and the postings they found since the last visit
+    watcher = get_default_watcher()
+    saved_searches = watcher.store.all()
+    if saved_searches:
+        with st.expander(f"Saved Searches ({watcher.store.total_new_count()} new postings)"):
+            for saved in saved_searches:
+                st.markdown(f"**{saved['query']}** in {saved['location'] or 'any location'} "
+                            f"- {saved['new_count']} new, last run {saved['last_run'] or 'pending'}")
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    if st.button("Show New", key=f"saved_show_{saved['id']}"):
+                        records = watcher.store.get_new_postings(saved['id'], limit=saved['new_count'])
+                        st.session_state.search_results = compact_results(
+                            {"results": [record['job'] for record in records]}
+                        )
+                        st.session_state.search_stream = None
+                        watcher.store.mark_viewed(saved['id'])
+                        st.rerun()
+                with col2:
+                    if st.button("Run Now", key=f"saved_run_{saved['id']}"):
+                        with st.spinner("Running saved search..."):
+                            new_postings = watcher.run_search(saved)
+                        st.info(f"Found {len(new_postings)} new postings.")
+                with col3:
+                    if st.button("Remove", key=f"saved_remove_{saved['id']}"):
+                        watcher.store.remove(saved['id'])
+                        st.rerun()
+    
+    # Queue and throttle metrics of the polite fetcher, for tuning its limits
+    with st.expander("Fetch Metrics"):
+        st.json(get_default_scheduler().metrics())
+    
     # Tips for searching
     with st.expander("Job Search Tips"):
         st.markdown("""
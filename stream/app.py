@@ -18,6 +18,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import application components
 from core.app import JobApplicationAutomator
 from config import init_directories
+from core.savedsearches import get_default_watcher
 
 def setup_page_config():
     """Configure page settings"""
@@ -46,6 +47,9 @@ def initialize_session_state():
         st.session_state.cover_letter = None
         st.session_state.search_results = None
         st.session_state.initialized = True
+    
+    # Rerun saved searches in the background; started once per process
+    get_default_watcher().start()
 
 def show_sidebar():
     """Display sidebar navigation and API key input"""
@@ -96,16 +96,11 @@ def display_application_statistics(application_tracker):
         st.bar_chart(status_df.set_index('Status'))
         
         # Application timeline if enough data
-        applications = application_tracker.get_all_applications()
-        if len(applications) >= 3:
+        if stats['total_applications'] >= 3:
             st.subheader("Application Timeline")
             
-            # Convert dates to datetime
-            applications['date_applied'] = pd.to_datetime(applications['date_applied'])
-            
-            # Group by week and count
-            timeline = applications.groupby(pd.Grouper(key='date_applied', freq='W')).size().reset_index(name='count')
-            timeline['date_applied'] = timeline['date_applied'].dt.strftime('%Y-%m-%d')
+            # Weekly counts are kept up to date by the tracker
+            timeline = application_tracker.get_application_timeline()
             
             st.line_chart(timeline.set_index('date_applied'))
 
@@ -0,0 +1,40 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The project root, and the benchmarks for their synthetic data builders
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+
+@pytest.fixture
+def job_data(tmp_path, monkeypatch):
+    """Run in an empty directory, with fresh process-wide job search caches and indexes in its data/"""
+    from core import fetchscheduler, jobhistory, jobindex, searchcache, searchhistory
+
+    monkeypatch.chdir(tmp_path)
+    for module, name in ((searchcache, "_default_cache"), (fetchscheduler, "_default_scheduler"),
+                         (jobindex, "_default_index"), (jobhistory, "_default_index"),
+                         (searchhistory, "_default_store")):
+        monkeypatch.setattr(module, name, None)
+    return tmp_path
+
+
+@pytest.fixture
+def load_tracker():
+    """Load application trackers from files, closing their storage after the test"""
+    from core.applicationtracker import ApplicationTracker
+
+    trackers = []
+
+    def load(path):
+        tracker = ApplicationTracker()
+        tracker.load_tracker(path)
+        trackers.append(tracker)
+        return tracker
+    yield load
+    for tracker in trackers:
+        tracker.storage.close()
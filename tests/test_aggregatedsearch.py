@@ -0,0 +1,79 @@
+import threading
+
+import pytest
+
+from core import jobsearchfactory
+from core.aggregatedsearch import AggregatedJobSearch, normalize_posting
+from core.jobsearch import GoogleJobsSearch, JobSearchAPI, SimulatedJobSearch
+from core.jobsearchfactory import JobSearchFactory
+
+
+class StaticSource(JobSearchAPI):
+    """A source answering with fixed postings, after waiting for release when it is slow"""
+
+    source_name = "Static"
+
+    def __init__(self, postings=(), release=None, error=None):
+        super().__init__()
+        self.cache = None
+        self.postings = list(postings)
+        self.release = release
+        self.error = error
+
+    def fetch_jobs(self, query, location=None, limit=10, validators=None, page=0):
+        if self.release is not None:
+            self.release.wait(5)
+        if self.error:
+            raise RuntimeError(self.error)
+        return {"results": [dict(job) for job in self.postings[:limit]]}
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    # Let timed-out sources finish in the background
+    event.set()
+
+
+def test_registry_lookup(job_data, monkeypatch):
+    monkeypatch.setitem(JobSearchFactory._sources, "static", StaticSource)
+    monkeypatch.setattr(jobsearchfactory, "JOB_SEARCH_SOURCES", ["static", "simulated", "missing"])
+
+    assert JobSearchFactory.available_sources()["static"] == "Static"
+    assert isinstance(JobSearchFactory.create_job_search("Static"), StaticSource)
+    assert isinstance(JobSearchFactory.create_job_search("simulated"), SimulatedJobSearch)
+    assert isinstance(JobSearchFactory.create_job_search("nonsense"), GoogleJobsSearch)
+    aggregated = JobSearchFactory.create_job_search("all", deadline=2)
+    assert isinstance(aggregated, AggregatedJobSearch)
+    assert list(aggregated.sources) == ["static", "simulated"]
+    assert aggregated.deadline == 2
+
+
+def test_slow_and_failing_sources_give_partial_results(job_data, release):
+    shared = {"title": "Shared Role", "company": "Acme", "location": "Remote"}
+    search = AggregatedJobSearch({
+        "fast": StaticSource([{"title": " Python Developer ", "company": "Acme", "location": ""}, shared]),
+        "also_fast": StaticSource([shared, {"title": "Data Analyst", "company": "Globex", "source": "Feed"}]),
+        "slow": StaticSource([{"title": "Too Late"}], release=release),
+        "slower": StaticSource([{"title": "Much Too Late"}], release=release),
+        "broken": StaticSource(error="source is down"),
+    }, timeouts={"slow": 0.1}, deadline=0.4)
+
+    results = search.search_jobs("python")
+
+    assert [job["title"] for job in results["results"]] == ["Python Developer", "Shared Role", "Data Analyst"]
+    statuses = {name: source["status"] for name, source in results["sources"].items()}
+    assert statuses == {"fast": "ok", "also_fast": "ok", "slow": "timeout", "slower": "timeout", "broken": "error"}
+    assert results["sources"]["broken"]["error"] == "source is down"
+    assert 0.1 <= results["sources"]["slow"]["seconds"] < 0.4 <= results["sources"]["slower"]["seconds"]
+    assert results["elapsed"] < 1
+    python, _, analyst = results["results"]
+    assert (python["location"], python["source"], analyst["source"]) == ("Remote", "Static", "Feed")
+
+
+def test_normalize_posting_fills_the_common_schema():
+    job = normalize_posting({"title": "  Engineer ", "requirements": None}, "Feed")
+    assert job["title"] == "Engineer" and job["company"] == "Unknown Company"
+    assert job["requirements"] == [] and job["source"] == "Feed" and job["job_id"]
+    assert normalize_posting({"job_id": "kept"}, "Feed")["job_id"] == "kept"
@@ -0,0 +1,80 @@
+import os
+import threading
+
+from core.applicationevents import ApplicationEventLog, new_event
+
+
+def add(log, company, position, count, kind="note"):
+    for i in range(count):
+        log.append(new_event(company, position, kind, f"{company} {i}"))
+
+
+def test_history_pages_newest_first(tmp_path):
+    log = ApplicationEventLog(str(tmp_path / "tracker.csv.events"))
+    add(log, "Acme", "Engineer", 25)
+    add(log, "Other", "Analyst", 3)
+
+    assert log.count("Acme", "Engineer") == 25
+    assert [event['body'] for event in log.history("Acme", "Engineer", limit=3)] == ["Acme 24", "Acme 23", "Acme 22"]
+    assert [event['body'] for event in log.history("Acme", "Engineer", limit=10, offset=20)] == [
+        "Acme 4", "Acme 3", "Acme 2", "Acme 1", "Acme 0"]
+    assert log.history("Missing", "Role") == []
+
+
+def test_other_log_sees_appends_and_clears(tmp_path):
+    path = str(tmp_path / "tracker.csv.events")
+    writer, reader = ApplicationEventLog(path), ApplicationEventLog(path)
+    add(writer, "Acme", "Engineer", 2)
+    assert reader.count("Acme", "Engineer") == 2
+    writer.clear("Acme", "Engineer")
+    add(writer, "Acme", "Engineer", 1)
+    assert [event['body'] for event in reader.history("Acme", "Engineer")] == ["Acme 0"]
+
+
+def test_compact_drops_cleared_applications(tmp_path):
+    path = str(tmp_path / "tracker.csv.events")
+    log, other = ApplicationEventLog(path), ApplicationEventLog(path)
+    add(log, "Gone", "Role", 50)
+    add(log, "Kept", "Role", 10)
+    assert other.count("Kept", "Role") == 10
+    log.clear("Gone", "Role")
+    size = os.path.getsize(path)
+
+    assert log.compact()
+    assert os.path.getsize(path) < size / 2
+    assert not log.compact()
+    # Another reader notices the rewritten file instead of trusting its old offsets
+    assert [event['body'] for event in other.history("Kept", "Role", limit=2)] == ["Kept 9", "Kept 8"]
+    assert other.count("Gone", "Role") == 0
+    assert len(list(log.events())) == 10
+
+
+def test_compact_waits_for_enough_dead_events(tmp_path):
+    log = ApplicationEventLog(str(tmp_path / "tracker.csv.events"))
+    add(log, "Kept", "Role", 50)
+    add(log, "Gone", "Role", 1)
+    log.clear("Gone", "Role")
+    assert not log.compact()
+
+
+def test_events_does_not_hold_the_lock(tmp_path):
+    log = ApplicationEventLog(str(tmp_path / "tracker.csv.events"))
+    add(log, "Acme", "Engineer", 5)
+    events = log.events()
+    first = next(events)
+    # A slow consumer must not block writers
+    writer = threading.Thread(target=add, args=(log, "Acme", "Engineer", 1))
+    writer.start()
+    writer.join(timeout=5)
+    assert not writer.is_alive()
+    assert first['body'] == "Acme 0" and len(list(events)) == 4
+    events.close()
+
+
+def test_in_memory_until_bound(tmp_path):
+    log = ApplicationEventLog()
+    add(log, "Acme", "Engineer", 3)
+    assert log.count("Acme", "Engineer") == 3
+    path = str(tmp_path / "sub" / "tracker.csv.events")
+    log.bind(path)
+    assert ApplicationEventLog(path).count("Acme", "Engineer") == 3
@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from core.fetchscheduler import FetchScheduler
+from core.httpfixtures import FixtureResponse
+
+
+class FakeHosts:
+    """
+    Answers after a short delay, tracking how many requests each host has in flight
+
+    Statuses in script[url] are answered in turn before the URL gets a 200.
+    """
+
+    def __init__(self, delay=0.0, script=None, headers=None):
+        self.delay = delay
+        self.script = {url: list(statuses) for url, statuses in (script or {}).items()}
+        self.headers = headers or {}
+        self.active = Counter()
+        self.peak = Counter()
+        self.peak_total = 0
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):
+        host = url.split("/")[2]
+        with self._lock:
+            self.sent.append((url, time.monotonic()))
+            self.active[host] += 1
+            self.peak[host] = max(self.peak[host], self.active[host])
+            self.peak_total = max(self.peak_total, sum(self.active.values()))
+            statuses = self.script.get(url)
+            status = statuses.pop(0) if statuses else 200
+        time.sleep(self.delay)
+        with self._lock:
+            self.active[host] -= 1
+        return FixtureResponse(url, status, self.headers.get(status, {}), "")
+
+
+def scheduler(session, **kwargs):
+    kwargs.setdefault("rate_per_host", 1e9)
+    kwargs.setdefault("burst_per_host", 10 ** 9)
+    return FetchScheduler(session=session, **kwargs)
+
+
+def run(fetcher, urls):
+    threads = [threading.Thread(target=fetcher.get, args=(url,)) for url in urls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_per_host_and_global_caps():
+    hosts = FakeHosts(delay=0.05)
+    fetcher = scheduler(hosts, max_concurrency=3, per_host_concurrency=2)
+    run(fetcher, [f"https://{host}/job/{i}" for i in range(8) for host in ("a.example", "b.example")])
+
+    assert hosts.peak["a.example"] == 2 and hosts.peak["b.example"] <= 2
+    assert hosts.peak_total == 3
+    metrics = fetcher.metrics()
+    assert metrics["active"] == 0 and metrics["queued"] == 0
+    assert metrics["hosts"]["a.example"]["requests"] == 8
+    assert metrics["hosts"]["a.example"]["max_queue"] > 2
+
+
+def test_rate_limit_spaces_requests():
+    hosts = FakeHosts()
+    fetcher = FetchScheduler(session=hosts, rate_per_host=20, burst_per_host=1)
+    run(fetcher, [f"https://a.example/job/{i}" for i in range(5)])
+    times = sorted(sent for _, sent in hosts.sent)
+    assert times[-1] - times[0] >= 4 / 20 * 0.9
+
+
+def test_throttled_requests_back_off_and_retry():
+    url = "https://a.example/search"
+    hosts = FakeHosts(script={url: [429, 503]})
+    fetcher = scheduler(hosts, backoff_base=0.05, backoff_max=1)
+
+    assert fetcher.get(url).status_code == 200
+    (_, first), (_, second), (_, third) = hosts.sent
+    assert second - first >= 0.05 and third - second >= 0.1
+    stats = fetcher.metrics()["hosts"]["a.example"]
+    assert (stats["throttled"], stats["retries"], stats["requests"]) == (2, 2, 3)
+    assert stats["backoff_seconds"] >= 0.15
+
+
+def test_backoff_holds_the_host_but_not_the_others():
+    throttled = "https://a.example/search"
+    hosts = FakeHosts(script={throttled: [429]}, headers={429: {"Retry-After": "0.3"}})
+    fetcher = scheduler(hosts, backoff_base=0.01, backoff_max=1)
+
+    started = time.monotonic()
+    worker = threading.Thread(target=fetcher.get, args=(throttled,))
+    worker.start()
+    time.sleep(0.05)
+    fetcher.get("https://b.example/job")
+    other_host_done = time.monotonic() - started
+    fetcher.get("https://a.example/job")
+    same_host_done = time.monotonic() - started
+    worker.join()
+
+    assert other_host_done < 0.2
+    # Retry-After beats the shorter exponential delay, for every request to the host
+    assert same_host_done >= 0.3
+
+
+def test_retries_run_out():
+    url = "https://a.example/search"
+    hosts = FakeHosts(script={url: [503] * 5})
+    fetcher = scheduler(hosts, max_retries=2, backoff_base=0.01)
+    assert fetcher.get(url).status_code == 503
+    assert len(hosts.sent) == 3
+
+
+def test_backoff_delay():
+    fetcher = FetchScheduler(session=FakeHosts(), backoff_base=1, backoff_max=60)
+    plain = FixtureResponse("u", 429, {}, "")
+    assert 4 <= fetcher._backoff_delay(plain, 2) <= 5
+    assert fetcher._backoff_delay(plain, 10) == 60
+    assert fetcher._backoff_delay(FixtureResponse("u", 429, {"Retry-After": "30"}, ""), 0) == 30
+    assert fetcher._backoff_delay(FixtureResponse("u", 429, {"Retry-After": "3600"}, ""), 0) == 60
+    retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=20), usegmt=True)
+    assert 15 <= fetcher._backoff_delay(FixtureResponse("u", 503, {"Retry-After": retry_at}, ""), 0) <= 20
+    assert 1 <= fetcher._backoff_delay(FixtureResponse("u", 503, {"Retry-After": "soon"}, ""), 0) <= 1.25
@@ -0,0 +1,79 @@
+import random
+from datetime import date, timedelta
+
+import pandas as pd
+
+from config import APP_STATUS, FOLLOW_UP_STATUSES
+from core.followupindex import FollowUpIndex, parse_date
+
+START = date(2024, 3, 1)
+STATUSES = list(APP_STATUS.values())
+
+
+def brute_force(rows):
+    """Every eligible application with a follow-up date, sorted, by scanning all of them"""
+    entries = []
+    for application in rows.values():
+        due = parse_date(application['follow_up_date'])
+        if application['status'] in FOLLOW_UP_STATUSES and due is not None:
+            entries.append((due, application['company'], application['position']))
+    return sorted(entries)
+
+
+def random_follow_up(rng):
+    choice = rng.random()
+    if choice < 0.1:
+        return ""
+    if choice < 0.15:
+        return "not a date"
+    return (START + timedelta(days=rng.randrange(60))).isoformat()
+
+
+def check(index, rows):
+    expected = brute_force(rows)
+    assert index._entries == expected
+    assert index.next_due() == (expected[0] if expected else None)
+    for day in (START, START + timedelta(days=20), START + timedelta(days=70)):
+        assert index.due(day) == [entry for entry in expected if entry[0] <= day]
+        for days in (0, 6, 30):
+            assert index.due_within(days, start=day) == [
+                entry for entry in expected if day <= entry[0] <= day + timedelta(days=days)]
+
+
+def test_index_matches_a_scan_through_random_changes():
+    rng = random.Random(0)
+    index = FollowUpIndex()
+    rows = {}
+    for step in range(3000):
+        key = (f"Company {rng.randrange(80)}", rng.choice(["Engineer", "Analyst"]))
+        old_row = rows.get(key)
+        choice = rng.random()
+        if old_row is None:
+            new_row = {'company': key[0], 'position': key[1], 'status': rng.choice(STATUSES),
+                       'follow_up_date': random_follow_up(rng)}
+        elif choice < 0.4:
+            new_row = dict(old_row, status=rng.choice(STATUSES))
+        elif choice < 0.8:
+            new_row = dict(old_row, follow_up_date=random_follow_up(rng))
+        else:
+            new_row = None
+        index.apply(old_row, new_row)
+        if new_row is None:
+            del rows[key]
+        else:
+            rows[key] = new_row
+        if step % 100 == 0:
+            check(index, rows)
+    check(index, rows)
+
+    rebuilt = FollowUpIndex()
+    rebuilt.rebuild(pd.DataFrame(list(rows.values()), columns=['company', 'position', 'status', 'follow_up_date']))
+    assert rebuilt._entries == index._entries
+    assert len(rebuilt) == len(index)
+
+
+def test_empty_index():
+    index = FollowUpIndex()
+    index.apply(None, {'company': "Acme", 'position': "Engineer", 'status': "Applied", 'follow_up_date': ""})
+    assert index.next_due() is None
+    assert index.due() == [] and index.due_within(7) == []
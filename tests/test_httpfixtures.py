@@ -0,0 +1,65 @@
+import os
+
+import pytest
+import requests
+
+from core.httpfixtures import FixtureResponse, RecordReplayTransport
+
+
+class FakeSession:
+    """Answers every request with a page naming it, or with the status set for its URL"""
+
+    def __init__(self, statuses=None):
+        self.statuses = statuses or {}
+        self.requests = []
+
+    def request(self, method, url, params=None, **kwargs):
+        self.requests.append((method, url, dict(params or {})))
+        headers = {"Content-Type": "text/html", "ETag": '"v1"', "Set-Cookie": "session=secret"}
+        return FixtureResponse(url, self.statuses.get(url, 200), headers, f"<p>{url} {sorted((params or {}).items())}</p>")
+
+
+class Offline:
+    def request(self, *args, **kwargs):
+        raise AssertionError("replay touched the network")
+
+
+def test_record_then_replay(tmp_path):
+    session = FakeSession()
+    recorder = RecordReplayTransport(str(tmp_path), "record", session=session)
+    recorded = recorder.request("GET", "https://jobs.example/search", params={"q": "python", "start": 10})
+
+    replayer = RecordReplayTransport(str(tmp_path), "replay", session=Offline())
+    replayed = replayer.request("get", "https://jobs.example/search", params={"start": 10, "q": "python"})
+    assert (replayed.status_code, replayed.text) == (recorded.status_code, recorded.text)
+    assert replayed.headers["etag"] == '"v1"'
+    # Only the headers the searches use are kept, cookies never reach the fixture files
+    assert "Set-Cookie" not in replayed.headers
+    assert len(session.requests) == 1
+    fixture, = replayer.fixtures()
+    assert fixture["params"] == {"q": "python", "start": 10}
+
+
+def test_throttled_responses_are_not_recorded(tmp_path):
+    session = FakeSession({"https://jobs.example/busy": 429, "https://jobs.example/gone": 404})
+    recorder = RecordReplayTransport(str(tmp_path), "record", session=session)
+    assert recorder.request("GET", "https://jobs.example/busy").status_code == 429
+    assert recorder.request("GET", "https://jobs.example/gone").status_code == 404
+
+    replayer = RecordReplayTransport(str(tmp_path), "replay")
+    with pytest.raises(requests.ConnectionError):
+        replayer.request("GET", "https://jobs.example/busy")
+    gone = replayer.request("GET", "https://jobs.example/gone")
+    with pytest.raises(requests.HTTPError):
+        gone.raise_for_status()
+    assert len(os.listdir(str(tmp_path))) == 1
+
+
+def test_live_mode_passes_through(tmp_path):
+    session = FakeSession()
+    transport = RecordReplayTransport(str(tmp_path), "live", session=session)
+    transport.request("GET", "https://jobs.example/search", params={"q": "data"})
+    assert session.requests == [("GET", "https://jobs.example/search", {"q": "data"})]
+    assert list(transport.fixtures()) == []
+    with pytest.raises(ValueError):
+        RecordReplayTransport(str(tmp_path), "sometimes")
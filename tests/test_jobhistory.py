@@ -0,0 +1,87 @@
+import json
+import sqlite3
+
+from core.jobhistory import JobHistoryIndex
+
+
+def job(job_id, title, company="Acme", location="Remote", description="", requirements=()):
+    return {"job_id": job_id, "title": title, "company": company, "location": location,
+            "description": description, "requirements": list(requirements)}
+
+
+def found(results):
+    return [posting["job_id"] for posting in results["results"]]
+
+
+def make_index(tmp_path):
+    index = JobHistoryIndex(str(tmp_path / "history_index.db"))
+    index.add_results({"results": [
+        job("a", "Python Developer", location="Berlin, Germany", requirements=["Django"]),
+        job("b", "Data Analyst", company="Globex", location="Remote", description="SQL and Python dashboards"),
+        job("c", "Product Designer", location="Berlin, Germany"),
+        {"title": "No ID", "company": "Skipped"},
+    ]})
+    return index
+
+
+def test_search_by_words_prefixes_and_location(tmp_path):
+    index = make_index(tmp_path)
+    assert index.count() == 3
+    assert sorted(found(index.search("python"))) == ["a", "b"]
+    assert found(index.search("djan")) == ["a"]
+    assert found(index.search("python", location="berlin")) == ["a"]
+    assert sorted(found(index.search("", location="germany"))) == ["a", "c"]
+    assert found(index.search("globex analyst")) == ["b"]
+    assert index.search("") == {"results": []}
+    assert all(posting["from_history"] for posting in index.search("python")["results"])
+
+
+def test_resaved_job_replaces_its_old_copy(tmp_path):
+    index = make_index(tmp_path)
+    index.add_results({"results": [job("a", "Rust Engineer", location="Munich")]})
+
+    assert index.count() == 3
+    assert found(index.search("rust")) == ["a"]
+    assert found(index.search("python")) == ["b"]
+    assert found(index.search("", location="berlin")) == ["c"]
+    index.add_results({"results": [job("a", "Rust Engineer", location="Munich")]})
+    assert found(index.search("rust engineer")) == ["a"]
+
+
+def test_backfill_runs_once(tmp_path):
+    directory = tmp_path / "job_listings"
+    directory.mkdir()
+    (directory / "job_search_1.json").write_text(json.dumps({"results": [job("x", "Site Reliability Engineer")]}))
+    (directory / "job_search_2.json").write_text("not json")
+    index = JobHistoryIndex(str(tmp_path / "history_index.db"))
+
+    assert index.backfill(str(directory)) == 1
+    (directory / "job_search_3.json").write_text(json.dumps({"results": [job("y", "Reliability Analyst")]}))
+    assert index.backfill(str(directory)) == 0
+    assert found(index.search("reliability")) == ["x"]
+
+
+def test_like_fallback(tmp_path):
+    index = make_index(tmp_path)
+    index.has_fts = False
+
+    assert sorted(found(index.search("python"))) == ["a", "b"]
+    assert found(index.search("python", location="berlin")) == ["a"]
+    assert found(index.search("designer")) == ["c"]
+
+
+def test_index_from_before_rowid_keys_is_migrated(tmp_path):
+    path = str(tmp_path / "history_index.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE postings (job_id TEXT PRIMARY KEY, title TEXT, company TEXT, location TEXT, "
+                 "description TEXT, requirements TEXT, saved_at TEXT, data TEXT)")
+    conn.execute("INSERT INTO postings VALUES ('old', 'Kotlin Developer', 'Acme', 'Remote', '', '', '2024-01-01', ?)",
+                 (json.dumps(job("old", "Kotlin Developer")),))
+    conn.commit()
+    conn.close()
+
+    index = JobHistoryIndex(path)
+    assert found(index.search("kotlin")) == ["old"]
+    index.add_results({"results": [job("old", "Swift Developer")]})
+    assert found(index.search("kotlin")) == []
+    assert index.count() == 1
@@ -0,0 +1,60 @@
+import random
+
+from core.jobindex import SeenJobsIndex, assign_job_id, make_job_id
+from core.jobsearch import SimulatedJobSearch
+
+POSTINGS = [
+    {"company": "Acme", "title": "Python Developer", "location": "Berlin",
+     "application_url": "https://jobs.acme.com/apply?id=7&src=x"},
+    {"company": "Globex", "title": "Data Analyst", "location": "Remote"},
+    {"company": "Initech", "title": "Tester", "location": "Austin, TX",
+     "application_url": "https://initech.example/jobs/3"},
+]
+
+
+def test_same_posting_same_id_across_runs(job_data):
+    # A hash of the content, not of the process: the ID is the same in every run
+    assert make_job_id("Acme", "Python Developer", "Berlin",
+                       "https://jobs.acme.com/apply?id=7&src=x") == "5f613b43761b2b6a"
+    first = SimulatedJobSearch(seed=5).fetch_jobs("engineer", limit=5)
+    second = SimulatedJobSearch(seed=5).fetch_jobs("engineer", limit=5)
+    assert [job["job_id"] for job in first["results"]] == [job["job_id"] for job in second["results"]]
+
+
+def test_ids_do_not_depend_on_result_order():
+    ids = {posting["title"]: assign_job_id(dict(posting))["job_id"] for posting in POSTINGS}
+    shuffled = [dict(posting) for posting in POSTINGS]
+    random.Random(1).shuffle(shuffled)
+    assert {posting["title"]: assign_job_id(posting)["job_id"] for posting in shuffled} == ids
+    assert len(set(ids.values())) == len(POSTINGS)
+
+
+def test_whitespace_case_and_tracking_parameters_do_not_change_the_id():
+    job_id = make_job_id("Acme", "Python Developer", "Berlin", "https://jobs.acme.com/apply?id=7&src=x")
+    assert make_job_id("  ACME ", "python   developer", "berlin\n", "HTTPS://Jobs.Acme.com/apply/?src=x&id=7"
+                       "&utm_source=mail&ved=abc#top") == job_id
+    assert make_job_id("Acme", "Python Developer", "Munich", "https://jobs.acme.com/apply?id=7&src=x") != job_id
+    assert make_job_id("Acme", "Python Developer", "Berlin", "https://jobs.acme.com/apply?id=8&src=x") != job_id
+
+
+def test_seen_index_persists_and_flags_repeats(tmp_path):
+    path = str(tmp_path / "seen_jobs.txt")
+    index = SeenJobsIndex(path)
+    first = index.mark_results({"results": [assign_job_id(dict(posting)) for posting in POSTINGS[:2]]})
+    assert [job["seen_before"] for job in first["results"]] == [False, False]
+
+    reopened = SeenJobsIndex(path)
+    assert len(reopened) == 2
+    second = reopened.mark_results({"results": [assign_job_id(dict(posting)) for posting in POSTINGS]})
+    assert [job["seen_before"] for job in second["results"]] == [True, True, False]
+    assert reopened.add_many([second["results"][2]["job_id"], "", None]) == []
+    assert len(SeenJobsIndex(path)) == 3
+
+
+def test_search_marks_postings_seen_by_an_earlier_search(job_data):
+    search = SimulatedJobSearch(seed=3)
+    first = search.mark_seen(search.search_jobs("engineer", "Remote", limit=5))
+    again = SimulatedJobSearch(seed=3).mark_seen(search.search_jobs("engineer", "Remote", limit=8))
+
+    assert not any(job["seen_before"] for job in first["results"])
+    assert [job["seen_before"] for job in again["results"]] == [True] * 5 + [False] * 3
@@ -0,0 +1,48 @@
+import json
+
+from core.jobposting import JobPosting, compact_results, results_to_dicts
+
+JOBS = [
+    {"job_id": "a1", "title": "Python Developer", "company": "Acme", "location": "Remote",
+     "description": "Build APIs", "requirements": ["Python", "SQL"], "posted_date": "2 days ago",
+     "application_url": "https://acme.example/apply", "source": "Simulated", "salary_range": "$100k",
+     "seen_before": False, "details_fetched": True, "full_description": "Build and run APIs"},
+    {"job_id": "b2", "title": "Data Analyst", "company": "Globex", "location": "Berlin",
+     "description": "", "requirements": [], "source": "Google Jobs", "from_history": True},
+]
+
+
+def test_compact_results_round_trip():
+    results = {"results": JOBS, "cache": {"hit": True, "age_seconds": 3.0}, "sources": {"simulated": {}}}
+    compact = compact_results(results)
+    assert all(isinstance(job, JobPosting) for job in compact["results"])
+    assert compact["cache"] == results["cache"]
+
+    plain = results_to_dicts(compact)
+    assert plain == results
+    assert json.loads(json.dumps(plain)) == results
+    assert compact_results(compact)["results"][0] is compact["results"][0]
+
+
+def test_postings_behave_like_dicts():
+    job = compact_results({"results": JOBS})["results"][0]
+    assert job["title"] == "Python Developer" and job.get("missing", "-") == "-"
+    assert "seen_before" in job and "missing" not in job
+    assert list(job["requirements"]) == ["Python", "SQL"]
+    assert (job.get("full_description") or job["description"]) == "Build and run APIs"
+
+    job["seen_before"] = True
+    job["title"] = "Senior Python Developer"
+    job.update({"notes": "Referral"})
+    assert job.to_dict()["seen_before"] is True and job["notes"] == "Referral"
+    assert dict(job.items())["title"] == "Senior Python Developer"
+    assert len(job) == len(job.keys()) == len(JOBS[0]) + 1
+
+    job["salary_range"] = None
+    assert "salary_range" not in job.to_dict()
+
+
+def test_repeated_values_are_shared():
+    first, second = compact_results({"results": [dict(JOBS[0]), dict(JOBS[0], job_id="a2")]})["results"]
+    assert first["requirements"] is second["requirements"]
+    assert first["company"] is second["company"]
@@ -0,0 +1,181 @@
+import time
+
+import pytest
+
+from core.fetchscheduler import FetchScheduler
+from core.httpfixtures import FixtureResponse, RecordReplayTransport
+from core.jobsearch import GoogleJobsSearch
+
+
+def card(title, company, location):
+    slug = f"{title}-{company}".replace(" ", "-").lower()
+    return f"""
+    <div class="iFjolb">
+        <div class="BjJfJf">{title}</div>
+        <div class="vNEEBe">{company}</div>
+        <div class="Qk80Jf">{location}</div>
+        <div class="HBvzbc">Experience with Python and SQL.</div>
+        <a class="pMhGee" href="/search?job={slug}">Apply</a>
+    </div>"""
+
+
+class FakeGoogle:
+    """
+    Serves Google Jobs shaped pages from a dict of search text to cards
+
+    A page starts at the "start" parameter; unknown searches and detail
+    pages, and (search, start) pages in errors, get an error status, and
+    searches in raises make the request fail.
+    """
+
+    def __init__(self, listings, details=None, delays=None, raises=(), errors=()):
+        self.listings = listings
+        self.details = details or {}
+        self.delays = delays or {}
+        self.raises = set(raises)
+        self.errors = set(errors)
+        self.requests = []
+
+    def request(self, method, url, params=None, **kwargs):
+        params = params or {}
+        self.requests.append(params.get("q", url))
+        if params.get("q") in self.raises:
+            raise ValueError(f"Broken source for {params['q']}")
+        time.sleep(self.delays.get(params.get("q"), 0))
+        if "q" in params:
+            cards = self.listings.get(params["q"])
+            if cards is None or (params["q"], params.get("start", 0)) in self.errors:
+                return FixtureResponse(url, 500, {}, "")
+            html = "".join(card(*c) for c in cards[params.get("start", 0):])
+        elif url in self.details:
+            html = self.details[url]
+        else:
+            return FixtureResponse(url, 404, {}, "")
+        return FixtureResponse(url, 200, {"Content-Type": "text/html"}, f"<html><body>{html}</body></html>")
+
+
+@pytest.fixture
+def google(job_data):
+    """A Google Jobs search whose requests are recorded from a FakeGoogle, returned with it"""
+    def make(listings, **kwargs):
+        site = FakeGoogle(listings, **kwargs)
+        transport = RecordReplayTransport(str(job_data / "fixtures"), "record", session=site)
+        search = GoogleJobsSearch()
+        search.cache = None
+        search.scheduler = FetchScheduler(session=transport, rate_per_host=1e9, burst_per_host=10 ** 9,
+                                          per_host_concurrency=8)
+        return search, site
+    return make
+
+
+def titles(results):
+    return [job["title"] for job in results["results"]]
+
+
+def test_search_many_merges_in_submission_order(google):
+    search, site = google({
+        "python jobs in Berlin": [("Python A", "Acme", "Berlin"), ("Python B", "Acme", "Berlin")],
+        "python jobs in Remote": [("Python C", "Globex", "Remote"), ("Shared", "Initech", "Remote")],
+        "data jobs in Berlin": [("Data A", "Acme", "Berlin")],
+        "data jobs in Remote": [("Shared", "Initech", "Remote"), ("Data B", "Globex", "Remote")],
+    }, delays={"python jobs in Berlin": 0.3})
+
+    results = search.search_many(["python", "data"], ["Berlin", "Remote"], limit=10)
+
+    # The first search finishes last, the merge order does not change
+    assert titles(results) == ["Python A", "Python B", "Python C", "Shared", "Data A", "Data B"]
+    assert [(t["query"], t["location"], t["count"]) for t in results["timings"]] == [
+        ("python", "Berlin", 2), ("python", "Remote", 2), ("data", "Berlin", 1), ("data", "Remote", 2)]
+    assert results["timings"][0]["seconds"] >= 0.3
+    assert results["elapsed"] < 0.3 * 4
+
+
+def test_search_many_isolates_failing_searches(google):
+    search, site = google({
+        "python jobs in Berlin": [("Python A", "Acme", "Berlin")],
+        "python jobs in Remote": [("Python C", "Globex", "Remote")],
+    }, raises={"python jobs in Remote"})
+
+    results = search.search_many("python", ["Berlin", "Remote", "Paris"], limit=10)
+    assert titles(results) == ["Python A"]
+    berlin, remote, paris = results["timings"]
+    assert "error" not in berlin
+    assert "Broken source" in remote["error"] and remote["count"] == 0
+    assert "500" in paris["error"]
+
+
+def test_enrich_results_keeps_order_and_isolates_failures(google, monkeypatch):
+    search, site = google({"python jobs": [("Python A", "Acme", "Remote"), ("Python B", "Globex", "Remote"),
+                                           ("Python C", "Initech", "Remote"), ("Python D", "Hooli", "Remote")]},
+                          details={"https://www.google.com/search?job=python-a-acme":
+                                   "<div class='job-description'>All about A</div>"
+                                   "<div class='requirements'>• Python\n• SQL</div>"
+                                   "<div class='salary-range'>$100k</div>",
+                                   "https://www.google.com/search?job=python-d-hooli":
+                                   "<div class='job-description'>All about D</div>"})
+    results = search.fetch_jobs("python", limit=10)
+    results["results"].append({"title": "No link", "company": "Nowhere", "location": "Remote"})
+
+    fetch = search.get_job_details
+
+    def get_job_details(url):
+        if url.endswith("python-c-initech"):
+            raise RuntimeError("parser crashed")
+        return fetch(url)
+    monkeypatch.setattr(search, "get_job_details", get_job_details)
+
+    progress = []
+    enriched = search.enrich_results(results, max_workers=3,
+                                     progress_callback=lambda done, total, job: progress.append((done, total)))
+
+    assert titles(enriched) == ["Python A", "Python B", "Python C", "Python D", "No link"]
+    a, b, c, d, no_link = enriched["results"]
+    assert (a["full_description"], a["requirements"], a["salary_range"]) == ("All about A", ["Python", "SQL"], "$100k")
+    assert a["details_fetched"] and d["details_fetched"] and d["full_description"] == "All about D"
+    assert not b["details_fetched"] and not c["details_fetched"] and "details_fetched" not in no_link
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+    # The results passed in are left as they were
+    assert "full_description" not in results["results"][0]
+
+
+def test_iter_jobs_fetches_pages_only_as_needed(google):
+    cards = [(f"Python {i}", f"Company {i}", "Remote") for i in range(23)]
+    search, site = google({"python jobs": cards})
+
+    stream = search.iter_jobs("python", page_size=10)
+    first = [next(stream) for _ in range(5)]
+    assert [job["title"] for job in first] == [f"Python {i}" for i in range(5)]
+    assert len(site.requests) == 1
+
+    rest = list(stream)
+    assert [job["title"] for job in first + rest] == [title for title, _, _ in cards]
+    # Three pages of cards and the empty one after them
+    assert len(site.requests) == 4
+
+    site.requests.clear()
+    assert len(list(search.iter_jobs("python", page_size=10, start_page=1, max_pages=1))) == 10
+    assert len(site.requests) == 1
+
+
+def test_iter_jobs_stops_on_repeats_and_errors(google):
+    search, site = google({"python jobs": [(f"Python {i}", "Acme", "Remote") for i in range(12)]})
+    recorded = list(search.iter_jobs("python", page_size=5))
+    assert len(recorded) == 12
+
+    # A source that ignores the page offset keeps sending the first page
+    site.listings["stuck jobs"] = site.listings["python jobs"][:5]
+    site.requests.clear()
+    assert len(list(search.iter_jobs("stuck", page_size=5))) == 5
+    assert len(site.requests) == 2
+
+    site.listings["flaky jobs"] = site.listings["python jobs"]
+    site.errors.add(("flaky jobs", 10))
+    site.requests.clear()
+    assert len(list(search.iter_jobs("flaky", page_size=5))) == 10
+    assert len(site.requests) == 3
+
+    # Replaying the recorded pages offline pages through the same postings
+    transport = search.scheduler.session
+    transport.mode, transport.session = "replay", None
+    replayed = list(search.iter_jobs("python", page_size=5))
+    assert [job["job_id"] for job in replayed] == [job["job_id"] for job in recorded]
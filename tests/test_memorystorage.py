@@ -0,0 +1,109 @@
+import os
+import random
+
+from core.trackerstorage import TRACKER_COLUMNS, MemoryTrackerStorage
+
+
+def row(i, **fields):
+    application = {column: "" for column in TRACKER_COLUMNS}
+    application.update(company=f"Company {i}", position="Engineer", date_applied="2024-01-01",
+                       status="Applied", follow_up_date="2024-01-15", job_id=f"job-{i}")
+    application.update(fields)
+    return application
+
+
+def rows(storage):
+    return sorted(storage.all().to_dict("records"), key=lambda application: application['company'])
+
+
+def open_storage(path):
+    storage = MemoryTrackerStorage()
+    storage.load(path)
+    return storage
+
+
+def apply_random_changes(storage, expected, count, rng):
+    """Track, update and delete at random, mirroring every change in expected"""
+    for step in range(count):
+        i = rng.randrange(150)
+        key = (f"Company {i}", "Engineer")
+        choice = rng.random()
+        if key not in expected or choice < 0.4:
+            storage.insert(row(i))
+            expected.setdefault(key, row(i))
+        elif choice < 0.75:
+            fields = {'status': rng.choice(["Interview Scheduled", "Rejected"]), 'notes': f"step {step}"}
+            assert storage.update(*key, fields)
+            expected[key].update(fields)
+        else:
+            assert storage.delete(*key)
+            del expected[key]
+
+
+def test_reopen_from_log_and_checkpoint_gives_the_same_rows(tmp_path):
+    path = str(tmp_path / "tracker.csv")
+    storage = open_storage(path)
+    storage.checkpoint_records = 10 ** 6
+    expected = {}
+    apply_random_changes(storage, expected, 600, random.Random(0))
+    assert rows(storage) == sorted(expected.values(), key=lambda application: application['company'])
+
+    # Nothing saved yet: the snapshot does not exist, the log holds every change
+    assert not os.path.exists(path)
+    assert rows(open_storage(path)) == rows(storage)
+
+    storage.save(path)
+    with storage._file_lock:
+        storage.checkpoint()
+    assert os.path.getsize(storage.log_path(path)) < 100
+    assert rows(open_storage(path)) == rows(storage)
+
+    # Changes after the checkpoint are replayed on top of the snapshot
+    apply_random_changes(storage, expected, 100, random.Random(1))
+    reopened = open_storage(path)
+    assert rows(reopened) == rows(storage)
+    assert reopened.count() == len(expected)
+
+
+def test_torn_last_log_record_is_dropped(tmp_path):
+    path = str(tmp_path / "tracker.csv")
+    storage = open_storage(path)
+    for i in range(5):
+        storage.insert(row(i))
+    storage.update("Company 1", "Engineer", {'status': "Rejected"})
+    log_path = storage.log_path(path)
+    size = os.path.getsize(log_path)
+    with open(log_path, "ab") as f:
+        f.write(b'{"op": "delete", "key": ["Company 2", "Engi')
+
+    reopened = open_storage(path)
+    assert rows(reopened) == rows(storage)
+    assert os.path.getsize(log_path) == size
+    # Writing carries on after the last good record
+    reopened.delete("Company 2", "Engineer")
+    assert [application['company'] for application in rows(open_storage(path))] == [
+        "Company 0", "Company 1", "Company 3", "Company 4"]
+
+
+def test_lookups_use_the_index_after_deletes():
+    # Not bound to a file, nothing is logged
+    storage = MemoryTrackerStorage()
+    count = 3 * MemoryTrackerStorage.INITIAL_CAPACITY
+    for i in range(count):
+        storage.insert(row(i))
+    # Enough deletes to squeeze the tombstones out of the buffer
+    for i in range(0, count, 3):
+        storage.delete(f"Company {i}", "Engineer")
+    for i in range(1, count, 3):
+        storage.delete(f"Company {i}", "Engineer")
+    storage.update("Company 5", "Engineer", {'job_id': "moved"})
+
+    assert len(storage._alive) < 2 * count
+    assert storage.count() == count // 3
+    assert storage.get("Company 0", "Engineer") is None
+    assert storage.get_by_job_id("job-3") is None
+    assert storage.get("Company 8", "Engineer")['job_id'] == "job-8"
+    assert storage.get_by_job_id("job-11")['company'] == "Company 11"
+    assert storage.get_by_job_id("moved")['company'] == "Company 5"
+    assert storage.get_by_job_id("job-5") is None
+    assert sorted(storage.keys()['company']) == sorted(f"Company {i}" for i in range(2, count, 3))
@@ -0,0 +1,47 @@
+import re
+
+import pytest
+
+from core.requirementextractor import SKILL_KEYWORDS, RequirementExtractor, extract_requirements
+from requirements_benchmark import build_descriptions
+
+
+def legacy_extract(description):
+    """The per-phrase loop the extractor replaced"""
+    extracted_reqs = []
+    for keyword in SKILL_KEYWORDS:
+        for match in re.finditer(f"{keyword}\\s+([^.;]*)[.;]", description.lower()):
+            if match.group(1).strip():
+                extracted_reqs.append(f"{keyword.capitalize()} {match.group(1).strip()}")
+    return set(extracted_reqs)
+
+
+DESCRIPTIONS = [
+    "Requires experience with python and knowledge of sql; background in statistics.",
+    "Experience with aws and experience with gcp. Degree in computer science.",
+    "Knowledge of knowledge of graphs; skills in skills in rust.",
+    "Familiarity with docker, proficiency in go and expertise in kubernetes",
+    "Proficiency in; trained in first aid. Certification in pmp and qualified in six sigma.",
+    "No requirements here.",
+    "",
+]
+
+
+@pytest.mark.parametrize("description", DESCRIPTIONS)
+def test_same_requirements_as_per_phrase_loop(description):
+    assert set(RequirementExtractor().extract(description)) == legacy_extract(description)
+
+
+def test_phrase_inside_earlier_requirement():
+    requirements = extract_requirements(DESCRIPTIONS[0])
+    assert requirements == [
+        "Experience with python and knowledge of sql",
+        "Knowledge of sql",
+        "Background in statistics",
+    ]
+
+
+def test_benchmark_corpus_matches():
+    extractor = RequirementExtractor()
+    for description in build_descriptions(500, seed=7):
+        assert set(extractor.extract(description)) == legacy_extract(description)
@@ -0,0 +1,70 @@
+from core import jobsearchfactory
+from core.jobsearch import JobSearchAPI
+from core.jobsearchfactory import JobSearchFactory
+from core.savedsearches import SavedSearchStore, SavedSearchWatcher
+
+
+def results(*job_ids):
+    return {"results": [{"job_id": job_id, "title": f"Job {job_id}"} for job_id in job_ids]}
+
+
+def test_first_run_only_records_seen_ids(tmp_path):
+    store = SavedSearchStore(str(tmp_path))
+    search = store.add("python developer")
+
+    assert store.record_run(search["id"], results("a", "b")) == []
+    assert store.get_new_postings(search["id"]) == []
+    assert store.all()[0]["seen_count"] == 2
+
+    new = store.record_run(search["id"], results("a", "b", "c"))
+    assert [job["job_id"] for job in new] == ["c"]
+    assert [record["job"]["job_id"] for record in store.get_new_postings(search["id"])] == ["c"]
+    assert store.total_new_count() == 1
+
+
+def test_new_postings_paged_from_the_end(tmp_path):
+    store = SavedSearchStore(str(tmp_path))
+    search = store.add("data engineer")
+    store.record_run(search["id"], results("baseline"))
+    for i in range(3000):
+        store.record_run(search["id"], results(f"job-{i:04d}"))
+
+    page = store.get_new_postings(search["id"], limit=5)
+    assert [record["job"]["job_id"] for record in page] == [f"job-{i:04d}" for i in range(2999, 2994, -1)]
+    page = store.get_new_postings(search["id"], limit=3, offset=2998)
+    assert [record["job"]["job_id"] for record in page] == ["job-0001", "job-0000"]
+    assert len(store.get_new_postings(search["id"])) == 3000
+    assert store.get_new_postings(search["id"], limit=0) == []
+
+
+def test_since_stops_at_older_postings(tmp_path):
+    store = SavedSearchStore(str(tmp_path))
+    search = store.add("designer")
+    store.record_run(search["id"], results("baseline"))
+    store.record_run(search["id"], results("a"))
+    found_at = store.get_new_postings(search["id"])[0]["found_at"]
+    assert len(store.get_new_postings(search["id"], since=found_at)) == 1
+    assert store.get_new_postings(search["id"], since="9999") == []
+
+
+class ListingSource(JobSearchAPI):
+    """A source serving whatever postings the test gives it"""
+
+    source_name = "Listing"
+    postings = []
+
+    def fetch_jobs(self, query, location=None, limit=10, validators=None, page=0):
+        return {"results": [dict(job) for job in self.postings[page * limit:(page + 1) * limit]]}
+
+
+def test_rerun_of_all_sources_search_sees_new_postings(job_data, monkeypatch):
+    monkeypatch.setattr(JobSearchFactory, "_sources", {"listing": ListingSource})
+    monkeypatch.setattr(jobsearchfactory, "JOB_SEARCH_SOURCES", ["listing"])
+    monkeypatch.setattr(ListingSource, "postings", results("a", "b")["results"])
+    store = SavedSearchStore(str(job_data / "saved_searches"))
+    watcher = SavedSearchWatcher(store)
+    search = store.add("engineer", source="all")
+
+    assert watcher.run_search(search) == []
+    ListingSource.postings.append({"job_id": "c", "title": "Job c"})
+    assert [job["job_id"] for job in watcher.run_search(search)] == ["c"]
@@ -0,0 +1,56 @@
+import os
+import time
+
+from core.jobsearch import SimulatedJobSearch
+from core.searchcache import SearchCache
+
+
+def disk_files(cache):
+    return sorted(filename for filename in os.listdir(cache.cache_dir) if filename.endswith(".json"))
+
+
+def test_expired_entry_deleted_on_read(tmp_path):
+    cache = SearchCache(str(tmp_path), max_entries=4, ttl=10, max_age=100)
+    cache.put("old", {"jobs": []})
+    cache.put("new", {"jobs": [1]})
+    # A copy read back from disk by another process, a day old
+    cache._memory.clear()
+    for key in ("old",):
+        entry = cache._read_from_disk(key)
+        entry["stored_at"] = time.time() - 86400
+        cache._write_to_disk(key, entry)
+
+    assert cache.get("old") is None
+    assert disk_files(cache) == ["new.json"]
+    assert cache.get("new")["results"] == {"jobs": [1]}
+
+
+def test_stale_entry_still_served(tmp_path):
+    cache = SearchCache(str(tmp_path), ttl=0, max_age=100)
+    cache.put("key", {"jobs": []})
+    entry = cache.get("key")
+    assert entry is not None and not cache.is_fresh(entry)
+
+
+def test_disk_entries_capped(tmp_path):
+    cache = SearchCache(str(tmp_path), max_entries=2, max_disk_entries=8)
+    for i in range(30):
+        cache.put(f"key{i:02d}", {"page": i})
+        written = time.time() - 100 + i
+        os.utime(cache._path(f"key{i:02d}"), (written, written))
+        assert len(disk_files(cache)) <= 8
+    # The most recently written survive
+    assert "key29.json" in disk_files(cache)
+    assert "key00.json" not in disk_files(cache)
+
+
+def test_sources_with_other_settings_are_cached_apart(job_data):
+    first = SimulatedJobSearch(seed=1).search_jobs("engineer", "Remote", limit=3)
+    other = SimulatedJobSearch(seed=2).search_jobs("engineer", "Remote", limit=3)
+    assert not other["cache"]["hit"]
+    assert [job["job_id"] for job in other["results"]] != [job["job_id"] for job in first["results"]]
+
+    again = SimulatedJobSearch(seed=1).search_jobs("engineer", "Remote", limit=3)
+    assert again["cache"]["hit"]
+    assert [job["job_id"] for job in again["results"]] == [job["job_id"] for job in first["results"]]
+    assert not SimulatedJobSearch(seed=1, total_results=2).search_jobs("engineer", "Remote", limit=3)["cache"]["hit"]
@@ -0,0 +1,80 @@
+import gzip
+import os
+
+import pytest
+
+from core.searchhistory import SearchHistoryStore
+
+
+def results(*job_ids, title="Engineer"):
+    return {"results": [{"job_id": job_id, "title": title} for job_id in job_ids]}
+
+
+@pytest.fixture(params=[True, False], ids=["gzip", "plain"])
+def store(request, tmp_path):
+    return SearchHistoryStore(str(tmp_path), max_segment_bytes=2048, compress=request.param,
+                              compact_after=3, retention_days=None)
+
+
+def fill(store, batches, start=0):
+    for batch in range(start, start + batches):
+        store.append(results(*[f"job-{batch}-{i}" for i in range(20)]), saved_at=f"2024-01-01T00:{batch % 60:02d}:00")
+
+
+def test_compaction_keeps_latest_copy(store):
+    store.append(results("a", "b", title="Old"), saved_at="2024-01-01T00:00:00")
+    fill(store, 5)
+    store.append(results("a", title="New"), saved_at="2024-02-01T00:00:00")
+    # Enough after it to seal its segment, compaction leaves the active one alone
+    fill(store, 30, start=5)
+    store.compact()
+
+    sealed = [record for path in store._segments()[:-1] for record in store._read_segment(path)]
+    assert [record["job"]["title"] for record in sealed if record["job"]["job_id"] == "a"] == ["New"]
+    postings = list(store.iter_postings())
+    assert len(postings) == len({posting["job_id"] for posting in postings})
+    assert {posting["job_id"]: posting["title"] for posting in postings}["a"] == "New"
+
+
+def test_iter_postings_agrees_with_compaction(store):
+    for round in range(3):
+        store.append(results("x", "y", title=f"Copy {round}"), saved_at=f"2024-0{round + 1}-01T00:00:00")
+        fill(store, 4, start=round * 4)
+    before = {posting["job_id"]: posting["title"] for posting in store.iter_postings()}
+    store.compact()
+    after = {posting["job_id"]: posting["title"] for posting in store.iter_postings()}
+    assert before == after
+    assert after["x"] == "Copy 2"
+
+
+def test_compacted_segments_respect_size_on_disk(store):
+    fill(store, 10)
+    store.append(results(*[f"job-0-{i}" for i in range(20)]), saved_at="2024-03-01T00:00:00")
+    fill(store, 10, start=10)
+    store.compact()
+    sealed = store._segments()[:-1]
+    # Every slot but the last is filled up to the rotation size, as rotation measures it
+    for path in sealed[:-1]:
+        assert os.path.getsize(path) >= store.max_segment_bytes
+        if path.endswith(".gz"):
+            with gzip.open(path, "rt") as f:
+                f.read()
+
+
+def test_nothing_to_drop_leaves_segments_alone(store):
+    fill(store, 12)
+    sealed = store._segments()[:-1]
+    modified = {path: os.stat(path).st_mtime_ns for path in sealed}
+    stats = store.compact()
+    assert stats["records_kept"] == stats["records_read"]
+    assert {path: os.stat(path).st_mtime_ns for path in sealed} == modified
+
+
+def test_rotation_does_not_recompact_every_segment(store, monkeypatch):
+    calls = []
+    compact = store._compact_locked
+    monkeypatch.setattr(store, "_compact_locked", lambda: calls.append(1) or compact())
+    fill(store, 60)
+    sealed = len(store._segments()) - 1
+    # Once per compact_after rotations, not on every rotation past it
+    assert len(calls) <= sealed // store.compact_after
@@ -0,0 +1,35 @@
+from datetime import datetime
+from itertools import islice
+
+from core.syntheticjobs import SyntheticJobGenerator
+
+REFERENCE = datetime(2024, 6, 1)
+
+
+def test_same_seed_same_postings():
+    first = list(SyntheticJobGenerator(seed=7, reference_date=REFERENCE).iter_postings(200, "python", "Remote"))
+    second = list(SyntheticJobGenerator(seed=7, reference_date=REFERENCE).iter_postings(200, "python", "Remote"))
+    assert first == second
+    assert len({job["job_id"] for job in first}) == 200
+
+    other = list(SyntheticJobGenerator(seed=8, reference_date=REFERENCE).iter_postings(200, "python", "Remote"))
+    assert [job["job_id"] for job in other] != [job["job_id"] for job in first]
+
+
+def test_any_posting_can_be_regenerated_alone():
+    generator = SyntheticJobGenerator(seed=3, reference_date=REFERENCE)
+    stream = list(generator.iter_postings(50, "data"))
+    assert list(generator.iter_postings(10, "data", start=40)) == stream[40:]
+    assert generator.posting(17, "data") == stream[17]
+    # Queries and locations give their own data sets
+    assert generator.posting(17, "design") != stream[17]
+    assert generator.posting(17, "data", "Berlin")["location"] == "Berlin"
+
+
+def test_endless_stream_and_posting_shape():
+    generator = SyntheticJobGenerator(seed=1, reference_date=REFERENCE, max_age_days=30, source="Load Test")
+    postings = list(islice(generator.iter_postings(), 500))
+    assert len(postings) == 500
+    for job in postings:
+        assert job["source"] == "Load Test" and job["job_id"] and job["requirements"]
+        assert "2024-05-02" <= job["posted_date"] <= "2024-06-01"
@@ -0,0 +1,54 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+
+@pytest.mark.parametrize("name", ["tracker.csv", "tracker.db"])
+def test_two_writers_on_one_file_both_land(load_tracker, tmp_path, name):
+    path = str(tmp_path / name)
+    writers = [load_tracker(path), load_tracker(path)]
+
+    def write(tracker, prefix):
+        for i in range(30):
+            tracker.track_application(f"{prefix} {i}", "Engineer")
+            tracker.update_application(f"{prefix} {i}", "Engineer", notes="Called")
+        tracker.save_tracker(path)
+
+    threads = [threading.Thread(target=write, args=(tracker, prefix)) for tracker, prefix in zip(writers, "AB")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reader = load_tracker(path)
+    assert len(reader.get_all_applications()) == 60
+    assert reader.count_application_history("A 0", "Engineer") == 2
+    assert reader.count_application_history("B 29", "Engineer") == 2
+    for tracker in writers:
+        tracker.load_tracker(path)
+        assert tracker.get_application_statistics()['total_applications'] == 60
+
+
+def test_sqlite_reads_do_not_wait_for_a_blocked_writer(load_tracker, tmp_path):
+    path = str(tmp_path / "tracker.db")
+    tracker = load_tracker(path)
+    tracker.track_application("Acme", "Engineer")
+
+    # Another process holds the database's write lock
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    writer = threading.Thread(target=tracker.track_application, args=("Globex", "Analyst"))
+    writer.start()
+    try:
+        time.sleep(0.2)
+        started = time.perf_counter()
+        assert tracker.get_application("Acme", "Engineer")['status'] == "Applied"
+        assert len(tracker.get_all_applications()) == 1
+        assert time.perf_counter() - started < 1
+    finally:
+        other.execute("COMMIT")
+        other.close()
+    writer.join()
+    assert tracker.get_application("Globex", "Analyst") is not None
@@ -0,0 +1,82 @@
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from core.applicationtracker import ApplicationTracker
+from core.trackerio import prepare_applications, read_applications
+from core.trackerstorage import TRACKER_COLUMNS
+
+TODAY = datetime(2024, 3, 1)
+
+
+@pytest.fixture
+def tracker(tmp_path, request):
+    tracker = ApplicationTracker()
+    tracker.load_tracker(str(tmp_path / request.param))
+    yield tracker
+    tracker.storage.close()
+
+
+def named(text, name):
+    source = io.BytesIO(text.encode("utf-8"))
+    source.name = name
+    return source
+
+
+@pytest.mark.parametrize("source", [[], named("[]", "a.json"), named("", "a.jsonl"), named("", "a.csv"),
+                                    named("company,position\n", "a.csv")])
+def test_empty_input_imports_nothing(source):
+    applications = prepare_applications(read_applications(source))
+    assert applications.empty
+    assert list(applications.columns) == TRACKER_COLUMNS
+    assert ApplicationTracker().import_applications([]) == 0
+
+
+def test_missing_key_columns_are_an_error():
+    with pytest.raises(ValueError, match="position"):
+        prepare_applications(read_applications([{'company': "Acme"}]))
+
+
+def test_defaults_blanks_and_repeats():
+    applications = prepare_applications(read_applications([
+        {'company': " Acme ", 'position': "Engineer"},
+        {'company': "Acme", 'position': "Engineer", 'status': "Rejected"},
+        {'company': "", 'position': "Analyst"},
+        {'company': "Globex", 'position': None},
+        {'company': "Initech", 'position': "Analyst", 'date_applied': "2024-02-01", 'status': "Offer Received"},
+    ]), today=TODAY)
+
+    assert list(zip(applications['company'], applications['position'])) == [("Acme", "Engineer"),
+                                                                           ("Initech", "Analyst")]
+    acme, initech = applications.to_dict("records")
+    assert (acme['status'], acme['date_applied'], acme['follow_up_date'], acme['last_contact_date']) == (
+        "Applied", "2024-03-01", "2024-03-15", "2024-03-01")
+    assert (initech['status'], initech['follow_up_date'], initech['last_contact_date']) == (
+        "Offer Received", "2024-02-15", "2024-02-01")
+
+
+def test_numeric_job_ids_stay_as_written():
+    text = "\n".join(json.dumps(row) for row in [{'company': "A", 'position': "P", 'job_id': 123},
+                                                 {'company': "B", 'position': "P"}])
+    applications = prepare_applications(read_applications(named(text, "a.jsonl")))
+    assert list(applications['job_id']) == ["123", ""]
+    applications = prepare_applications(read_applications(named("company,position,job_id\nA,P,007\n", "a.csv")))
+    assert list(applications['job_id']) == ["007"]
+
+
+@pytest.mark.parametrize("tracker", ["tracker.csv", "tracker.db"], indirect=True)
+def test_import_skips_tracked_and_starts_each_history(tracker):
+    tracker.track_application("Acme", "Engineer", status="Interview Scheduled")
+    imported = tracker.import_applications(named(
+        "company,position,status\nAcme,Engineer,Applied\nGlobex,Analyst,\nInitech,Tester,Rejected\n", "a.csv"))
+
+    assert imported == 2
+    assert tracker.get_application("Acme", "Engineer")['status'] == "Interview Scheduled"
+    assert tracker.count_application_history("Acme", "Engineer") == 1
+    assert [(event['kind'], event['body']) for event in tracker.get_application_history("Globex", "Analyst")] == [
+        ("status", "Applied")]
+    assert [event['body'] for event in tracker.get_application_history("Initech", "Tester")] == ["Rejected"]
+    assert tracker.get_application_statistics()['total_applications'] == 3
+    assert tracker.import_applications(named("[]", "a.json")) == 0
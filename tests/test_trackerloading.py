@@ -0,0 +1,54 @@
+import pytest
+
+from core import applicationtracker
+from core.applicationtracker import get_default_tracker
+
+
+def fail(*args, **kwargs):
+    raise AssertionError("the tracker file was read again")
+
+
+@pytest.mark.parametrize("name", ["tracker.csv", "tracker.db"])
+def test_reloading_an_unchanged_file_does_nothing(load_tracker, tmp_path, monkeypatch, name):
+    path = str(tmp_path / name)
+    tracker = load_tracker(path)
+    tracker.track_application("Acme", "Engineer")
+    tracker.save_tracker(path)
+
+    monkeypatch.setattr(tracker, "_load", fail)
+    monkeypatch.setattr(tracker.storage, "transaction", fail)
+    for _ in range(3):
+        tracker.load_tracker(path)
+    assert tracker.get_application("Acme", "Engineer") is not None
+
+
+@pytest.mark.parametrize("name", ["tracker.csv", "tracker.db"])
+def test_another_process_change_is_picked_up_next_load(load_tracker, tmp_path, monkeypatch, name):
+    path = str(tmp_path / name)
+    tracker = load_tracker(path)
+    tracker.track_application("Acme", "Engineer")
+    tracker.save_tracker(path)
+    # Another process has its own storage and file handles
+    other = load_tracker(path)
+    other.track_application("Globex", "Analyst")
+    other.update_application("Acme", "Engineer", status="Rejected")
+    other.save_tracker(path)
+
+    # Just their changes are taken in, the tracker is not loaded from scratch
+    monkeypatch.setattr(tracker, "_load", fail)
+    tracker.load_tracker(path)
+    assert tracker.get_application("Globex", "Analyst") is not None
+    assert tracker.get_application("Acme", "Engineer")['status'] == "Rejected"
+    assert tracker.get_application_statistics()['total_applications'] == 2
+    assert tracker.get_application_statistics()['status_counts'].get("Rejected") == 1
+
+
+def test_default_tracker_loads_once(tmp_path, monkeypatch):
+    path = str(tmp_path / "tracker.csv")
+    monkeypatch.setattr(applicationtracker, "TRACKER_FILE", path)
+    monkeypatch.setattr(applicationtracker, "_default_tracker", None)
+
+    tracker = get_default_tracker()
+    assert get_default_tracker() is tracker
+    assert tracker.storage.file_path == path
+    assert tracker.get_all_applications().empty
@@ -0,0 +1,62 @@
+import random
+from collections import Counter
+from datetime import date, timedelta
+
+import pandas as pd
+
+from config import APP_STATUS
+from core.applicationtracker import ApplicationTracker
+from core.trackerstatistics import ApplicationStatistics
+
+STATUSES = list(APP_STATUS.values())
+
+
+def recompute(applications):
+    """Statistics straight from the rows, the way the dashboard computed them before"""
+    dates = sorted(day for day in applications['date_applied'] if day)
+    applied = pd.DataFrame({'date_applied': pd.to_datetime(applications['date_applied'], errors="coerce")})
+    applied['count'] = 1
+    timeline = applied.dropna().groupby(pd.Grouper(key='date_applied', freq='W')).count().reset_index()
+    timeline['date_applied'] = timeline['date_applied'].dt.strftime("%Y-%m-%d")
+    summary = {
+        'total_applications': len(applications),
+        'status_counts': dict(Counter(applications['status'])),
+        'companies_applied': applications['company'].nunique(),
+        'positions_applied': applications['position'].nunique(),
+        'oldest_application': dates[0] if dates else None,
+        'newest_application': dates[-1] if dates else None,
+    }
+    return summary, timeline
+
+
+def test_incremental_statistics_match_a_recompute():
+    rng = random.Random(0)
+    tracker = ApplicationTracker()
+    keys = [(f"Company {i}", rng.choice(["Engineer", "Analyst", "Designer"])) for i in range(120)]
+
+    for step in range(600):
+        company, position = rng.choice(keys)
+        choice = rng.random()
+        if choice < 0.1:
+            batch = rng.sample(keys, 15)
+            tracker.import_applications([
+                {'company': c, 'position': p, 'status': rng.choice(STATUSES),
+                 'date_applied': (date(2024, 1, 1) + timedelta(days=rng.randrange(120))).isoformat()}
+                for c, p in batch])
+        elif choice < 0.4:
+            tracker.track_application(company, position, status=rng.choice(STATUSES))
+        elif choice < 0.8:
+            tracker.update_application(company, position, status=rng.choice(STATUSES))
+        else:
+            tracker.delete_application(company, position)
+
+        if step % 50 == 0 or step == 599:
+            applications = tracker.get_all_applications()
+            summary, timeline = recompute(applications)
+            assert tracker.get_application_statistics() == summary
+            pd.testing.assert_frame_equal(tracker.get_application_timeline(), timeline, check_dtype=False)
+
+            rebuilt = ApplicationStatistics()
+            rebuilt.rebuild(applications)
+            assert rebuilt.summary() == summary
+            assert rebuilt.week_counts == tracker.statistics.week_counts
@@ -0,0 +1,92 @@
+import pytest
+
+from core.trackerstorage import (SUMMARY_COLUMNS, TRACKER_COLUMNS, MemoryTrackerStorage,
+                                 SqliteTrackerStorage, create_tracker_storage, read_snapshot)
+
+pytest.importorskip("pyarrow")
+
+BACKENDS = ["tracker.csv", "tracker.db", "tracker.parquet", "tracker.arrow"]
+
+APPLICATIONS = [
+    {'company': "Acme, Inc.", 'position': "Engineer", 'date_applied': "2024-01-05", 'status': "Applied",
+     'follow_up_date': "2024-01-19", 'last_contact_date': "2024-01-05", 'contact_person': "",
+     'contact_email': "", 'notes': "Line one\nline \"two\", with a comma", 'job_id': "007"},
+    {'company': "Globex", 'position': "Analyst", 'date_applied': "2024-02-01", 'status': "Interview Scheduled",
+     'follow_up_date': "2024-02-15", 'last_contact_date': "2024-02-03", 'contact_person': "Jo",
+     'contact_email': "jo@globex.com", 'notes': "", 'job_id': ""},
+    {'company': "Initech", 'position': "Tester", 'date_applied': "2024-02-10", 'status': "Rejected",
+     'follow_up_date': "2024-02-24", 'last_contact_date': "2024-02-10", 'contact_person': "",
+     'contact_email': "", 'notes': "Ünïcode ✓", 'job_id': "linkedin-42"},
+]
+
+
+def rows(frame):
+    return sorted(frame[TRACKER_COLUMNS].to_dict("records"), key=lambda row: (row['company'], row['position']))
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_storage_backend_by_extension(tmp_path, name):
+    storage = create_tracker_storage(str(tmp_path / name))
+    assert isinstance(storage, SqliteTrackerStorage if name.endswith(".db") else MemoryTrackerStorage)
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_round_trip(load_tracker, tmp_path, name):
+    path = str(tmp_path / name)
+    tracker = load_tracker(path)
+    assert tracker.import_applications(APPLICATIONS) == 3
+    tracker.save_tracker(path)
+
+    reloaded = load_tracker(path)
+    assert rows(reloaded.get_all_applications()) == APPLICATIONS
+    assert list(reloaded.get_all_applications(columns=SUMMARY_COLUMNS).columns) == SUMMARY_COLUMNS
+    assert reloaded.get_application_by_job_id("007")['company'] == "Acme, Inc."
+    assert reloaded.get_application_statistics()['total_applications'] == 3
+    assert [event['body'] for event in reloaded.get_application_history("Globex", "Analyst")] == [
+        "Interview Scheduled"]
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_changes_survive_a_reload_before_and_after_save(load_tracker, tmp_path, name):
+    path = str(tmp_path / name)
+    tracker = load_tracker(path)
+    tracker.import_applications(APPLICATIONS)
+    tracker.save_tracker(path)
+
+    tracker.update_application("Globex", "Analyst", status="Offer Received", follow_up_date="2024-03-01")
+    tracker.delete_application("Initech", "Tester")
+    tracker.track_application("Hooli", "Designer", job_id="99")
+    # Unsaved changes are in the mutation log (or the database) already
+    unsaved = load_tracker(path)
+    assert rows(unsaved.get_all_applications()) == rows(tracker.get_all_applications())
+
+    tracker.save_tracker(path)
+    saved = load_tracker(path)
+    expected = rows(tracker.get_all_applications())
+    assert rows(saved.get_all_applications()) == expected
+    assert [row['company'] for row in expected] == ["Acme, Inc.", "Globex", "Hooli"]
+    assert saved.get_application("Globex", "Analyst")['follow_up_date'] == "2024-03-01"
+    assert saved.count_application_history("Initech", "Tester") == 0
+
+
+@pytest.mark.parametrize("source, target", [("tracker.csv", "copy.parquet"), ("tracker.parquet", "copy.arrow"),
+                                            ("tracker.arrow", "copy.db"), ("tracker.db", "copy.csv")])
+def test_save_as_another_format(load_tracker, tmp_path, source, target):
+    tracker = load_tracker(str(tmp_path / source))
+    tracker.import_applications(APPLICATIONS)
+    tracker.save_tracker(str(tmp_path / target))
+
+    copy = load_tracker(str(tmp_path / target))
+    assert rows(copy.get_all_applications()) == APPLICATIONS
+
+
+@pytest.mark.parametrize("name", ["tracker.csv", "tracker.parquet", "tracker.arrow"])
+def test_snapshot_reads_only_the_asked_columns(load_tracker, tmp_path, name):
+    path = str(tmp_path / name)
+    tracker = load_tracker(path)
+    tracker.import_applications(APPLICATIONS)
+    tracker.save_tracker(path)
+
+    frame = read_snapshot(path, columns=['company', 'date_applied'])
+    assert sorted(frame.columns) == ['company', 'date_applied']
+    assert sorted(frame['date_applied']) == ["2024-01-05", "2024-02-01", "2024-02-10"]